@@ -1,7 +1,9 @@
 """A module for generating xcresult models."""
 
 import os
+import re
 import subprocess
+import sys
 
 
 DATA_TYPES = {
@@ -23,6 +25,14 @@ DATA_TYPES = {
     "URL": "str",
 }
 
+# The default values of the primitives which have one
+PRIMITIVE_DEFAULTS = {
+    "bool": "False",
+    "float": "0.0",
+    "int": "0",
+    "str": '""',
+}
+
 
 def get_indentation(line: str) -> int:
     """Get the indentation level of a line.
@@ -76,6 +86,24 @@ class XcresultType:
             self.root_type = self.root_type[:-1]
             self.is_optional = True
 
+    def field(self) -> tuple[str, str]:
+        """Get the kind of field of this type, and its default value.
+
+        :returns: The Python code for the kind of field (one of the FIELD_*
+            constants in the models) and for its default value
+        """
+
+        if self.is_list:
+            return "FIELD_LIST", "None"
+
+        if self.is_optional:
+            return "FIELD_OPTIONAL", "None"
+
+        if self.root_type in DATA_TYPES:
+            return "FIELD_PRIMITIVE", PRIMITIVE_DEFAULTS.get(DATA_TYPES[self.root_type], "REQUIRED")
+
+        return "FIELD_OBJECT", "REQUIRED"
+
     def python_type(self, container_type: str) -> str:
         """Convert the xcresult type to a Python type.
 
@@ -113,12 +141,15 @@ class Definition:
         supertype: str | None,
         properties: list[tuple[str, str]],
         original: list[str] | None = None,
+        frozen: bool = False,
     ) -> None:
         self.name = name
         self.kind = kind
         self.supertype = supertype if supertype else "XcresultObject"
         self.properties = properties
         self.original = original
+        self.inherited_properties: list[tuple[str, str]] = []
+        self.frozen = frozen
 
     def dependency_types(self) -> list[str]:
         """Return a list of the types that this definition uses.
@@ -176,52 +207,134 @@ class Definition:
         else:
             output.append('    """Generated from xcresulttool format description."""')
 
+        output.extend(self._generate_slots())
+
         for name, ptype in self.properties:
             xctype = XcresultType(ptype)
             python_type = xctype.python_type(self.name)
             output.append(f"    {name}: {python_type}")
 
+        output.extend(self._generate_fields())
+
         return output
 
-    def _add_additional_methods(self) -> list[str]:
-        output: list[str] = []
+    def _generate_fields(self) -> list[str]:
+        """Generate the table of fields for this definition.
+
+        Every property, including inherited ones, is listed with its kind and
+        default value, so deserializing doesn't need to inspect type hints.
+        Definitions without properties of their own inherit the table.
+        """
+        annotation = "    FIELDS: ClassVar[tuple[tuple[str, str, Any], ...]] ="
+
+        if self.name == "XcresultObject":
+            return [f"{annotation} ()", ""]
+
+        if not self.properties:
+            return []
+
+        output = ["", f"{annotation} ("]
+        for name, ptype in self.properties + self.inherited_properties:
+            kind, default = XcresultType(ptype).field()
+            output.append(f'        ("{name}", {kind}, {default}),')
+        output.append("    )")
+        return output
+
+    def _generate_slots(self) -> list[str]:
+        """Generate the slots for this definition.
+
+        Every class in the hierarchy declares slots, so instances have no
+        __dict__. Properties already declared by a supertype are skipped.
+        """
+        if self.name == "XcresultObject":
+            if not self.frozen:
+                return ["    __slots__ = ()", ""]
 
+            # The cached hash
+            return ['    __slots__ = ("_hash",)', "", "    _hash: int", ""]
+
+        inherited_names = {name for name, _ in self.inherited_properties}
+        names = [name for name, _ in self.properties if name not in inherited_names]
+        names.extend(self._private_attributes())
+
+        if not names:
+            return ["    __slots__ = ()", ""]
+
+        output = ["    __slots__ = ("]
+        for name in names:
+            output.append(f'        "{name}",')
+        output.append("    )")
+        output.append("")
+        return output
+
+    def _additional_methods_lines(self) -> list[str]:
         additional_methods_path = os.path.join(
             os.path.dirname(os.path.abspath(__file__)),
             "additional_methods",
             f"{self.name}.py",
         )
         if not os.path.exists(additional_methods_path):
+            return []
+
+        with open(additional_methods_path, encoding="utf-8") as additional_methods_file:
+            return additional_methods_file.readlines()
+
+    def _private_attributes(self) -> list[str]:
+        """Get the private attributes declared by the additional methods.
+
+        These are annotations such as ``_cached: int`` at the top level of the
+        additional methods file. They aren't properties, so they are never
+        deserialized, but they still need slots.
+        """
+        names: list[str] = []
+        for line in self._additional_methods_lines():
+            match = re.match(r"(_\w+):", line)
+            if match:
+                names.append(match.group(1))
+        return names
+
+    def _add_additional_methods(self) -> list[str]:
+        output: list[str] = []
+
+        lines = self._additional_methods_lines()
+        if not lines:
             return output
 
         output.append("")
-        with open(additional_methods_path, encoding="utf-8") as additional_methods_file:
-            for line in additional_methods_file.readlines():
-                stripped = line.rstrip()
-                if len(stripped) > 0:
-                    output.append("    " + line.rstrip())
-                else:
-                    output.append("")
+        for line in lines:
+            stripped = line.rstrip()
+            if len(stripped) > 0:
+                output.append("    " + line.rstrip())
+            else:
+                output.append("")
 
         return output
 
     def _add_dunder_methods(self) -> list[str]:
         output: list[str] = [""]
 
-        if len(self.properties) > 0 or self.name == "XcresultObject":
-            output.append("    def _members(self) -> tuple[Any, ...]:")
-            if self.name == "XcresultObject":
-                output.append("        return ()")
-            else:
-                output.append("        properties: list[Any] = [")
+        if self.name != "XcresultObject":
+            if len(self.properties) > 0:
+                # A flat tuple of our own properties followed by the inherited ones
+                output.append("    def _members(self) -> tuple[Any, ...]:")
+                output.append("        return (")
                 for name, _ in self.properties:
                     output.append(f"            self.{name},")
-                output.append("        ]")
-                output.append("        return tuple(properties + list(super()._members()))")
+                for name, _ in self.inherited_properties:
+                    output.append(f"            self.{name},")
+                output.append("        )")
+                output.append("")
 
-            output.append("")
+            return output
+
+        output.append("    def _members(self) -> tuple[Any, ...]:")
+        output.append("        return ()")
+        output.append("")
 
         output.append("    def __eq__(self, other: Any) -> bool:")
+        output.append("        if self is other:")
+        output.append("            return True")
+        output.append("")
         output.append("        if not isinstance(other, self.__class__):")
         output.append("            return False")
         output.append("")
@@ -231,7 +344,66 @@ class Definition:
         output.append("")
 
         output.append("    def __hash__(self) -> int:")
-        output.append("        return xchash(self)")
+
+        if not self.frozen:
+            # Mutable models can change after being hashed, so can't cache it
+            output.append(
+                "        return hash(tuple(xchash(member) for member in self._members()))"
+            )
+            output.append("")
+            return output
+
+        output.append(
+            "        # The hash covers everything below the object, so only work it out once"
+        )
+        output.append("        try:")
+        output.append("            return self._hash")
+        output.append("        except AttributeError:")
+        output.append("            pass")
+        output.append("")
+        output.append("        value = hash(tuple(xchash(member) for member in self._members()))")
+        output.append('        object.__setattr__(self, "_hash", value)')
+        output.append("        return value")
+        output.append("")
+
+        output.extend(self._add_frozen_methods())
+
+        return output
+
+    def _add_frozen_methods(self) -> list[str]:
+        """Generate the methods which stop frozen models being changed.
+
+        Deserialization sets properties through the slot descriptors, which
+        doesn't go through these. Nor does restoring the state of a copied or
+        unpickled object, which would otherwise set each slot with setattr.
+        """
+        output: list[str] = []
+
+        output.append("    def __setattr__(self, name: str, value: Any) -> None:")
+        output.append(
+            '        raise AttributeError(f"{type(self).__name__} is frozen: cannot set {name}")'
+        )
+        output.append("")
+
+        output.append("    def __delattr__(self, name: str) -> None:")
+        output.append(
+            '        raise AttributeError(f"{type(self).__name__} is frozen: cannot delete {name}")'
+        )
+        output.append("")
+
+        output.append("    def __getstate__(self) -> dict[str, Any]:")
+        output.append(
+            "        # The cached hash is left out, as string hashes differ between processes"
+        )
+        output.append(
+            "        return {name: getattr(self, name) for name, _, _ in self.FIELDS"
+            " if hasattr(self, name)}"
+        )
+        output.append("")
+
+        output.append("    def __setstate__(self, state: dict[str, Any]) -> None:")
+        output.append("        for name, value in state.items():")
+        output.append("            object.__setattr__(self, name, value)")
         output.append("")
 
         return output
@@ -309,7 +481,7 @@ def get_definitions(format_description: str) -> list[Definition]:
     """
     root_properties = {}
     definitions = [Definition("XcresultObject", "object", None, [])]
-    buffer = []
+    buffer: list[str] = []
 
     lines = [line for line in format_description.split("\n") if len(line.strip()) > 0]
 
@@ -379,10 +551,32 @@ def order_definitions(definitions: list[Definition]) -> list[Definition]:
     return all_output
 
 
-def generate(output_path: str):
+def resolve_inheritance(definitions: list[Definition]) -> None:
+    """Record the properties each definition inherits from its supertypes.
+
+    They are listed in the order ``_members`` returns them: the supertype's
+    own properties, followed by the ones it inherits in turn.
+
+    :param definitions: The definitions to resolve
+    """
+    definition_dict = {definition.name: definition for definition in definitions}
+
+    for definition in definitions:
+        supertype = definition_dict.get(definition.supertype)
+
+        while supertype is not None and supertype is not definition:
+            definition.inherited_properties.extend(supertype.properties)
+            if supertype.name == "XcresultObject":
+                break
+            supertype = definition_dict.get(supertype.supertype)
+
+
+def generate(output_path: str, frozen: bool = False):
     """Generate the models for xcresulttool.
 
     :param output_path: The path to write the models to
+    :param frozen: Set to True to generate models which can't be changed once
+        they have been deserialized. They can then be shared and cached safely.
     """
     output = subprocess.run(
         ["xcrun", "xcresulttool", "formatDescription", "--legacy"],
@@ -394,18 +588,37 @@ def generate(output_path: str):
 
     definitions = get_definitions(output)
     definitions = order_definitions(definitions)
+    resolve_inheritance(definitions)
+
+    for definition in definitions:
+        definition.frozen = frozen
 
     with open(output_path, "w", encoding="utf-8") as output_file:
         output_file.write('"""Autogenerated models for xcresulttool."""\n\n')
         output_file.write("import datetime\n")
         output_file.write("import sys\n")
-        output_file.write("from typing import Any, Optional\n")
+        output_file.write("from typing import Any, ClassVar, Iterator, Optional\n")
         output_file.write("import urllib.parse\n")
         output_file.write("\n\n")
         output_file.write("# pylint: disable=too-many-lines\n")
         output_file.write("# pylint: disable=invalid-name\n")
         output_file.write("\n")
 
+        output_file.write("# The kinds of field listed in the FIELDS of each model\n")
+        output_file.write('FIELD_PRIMITIVE = "primitive"\n')
+        output_file.write('FIELD_LIST = "list"\n')
+        output_file.write('FIELD_OPTIONAL = "optional"\n')
+        output_file.write('FIELD_OBJECT = "object"\n')
+        output_file.write("\n")
+
+        output_file.write("# The default value of fields which must be present in the data\n")
+        output_file.write("REQUIRED: Any = object()\n")
+        output_file.write("\n")
+
+        output_file.write("# Whether the models reject changes once they have been deserialized\n")
+        output_file.write(f"FROZEN = {frozen}\n")
+        output_file.write("\n")
+
         output_file.write("def flatten(list_of_lists: list[Any]) -> list[Any]:\n")
         output_file.write('    """Flatten a list of lists."""\n')
         output_file.write("    return [item for sublist in list_of_lists for item in sublist]\n")
@@ -428,17 +641,8 @@ def generate(output_path: str):
         output_file.write("            all_hashes.append(xchash(value))\n")
         output_file.write("        return hash(tuple(all_hashes))\n")
         output_file.write("\n")
-        output_file.write('    if not hasattr(item, "_members"):\n')
-        output_file.write("        return hash(item)\n")
-        output_file.write("\n")
-        output_file.write('    members_call = getattr(item, "_members", None)\n')
-        output_file.write("    if members_call is None:\n")
-        output_file.write("        return hash(item)\n")
-        output_file.write("\n")
-        output_file.write("    for member in members_call():\n")
-        output_file.write("        all_hashes.append(xchash(member))\n")
-        output_file.write("\n")
-        output_file.write("    return hash(tuple(all_hashes))\n")
+        output_file.write("    # Models hash their members themselves\n")
+        output_file.write("    return hash(item)\n")
         output_file.write("\n")
 
         for definition in definitions:
@@ -466,4 +670,7 @@ def generate(output_path: str):
 
 
 if __name__ == "__main__":
-    generate(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "xcresult", "model.py")))
+    generate(
+        os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "xcresult", "model.py")),
+        frozen="--frozen" in sys.argv[1:],
+    )
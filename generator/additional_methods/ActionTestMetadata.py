@@ -1,3 +1,11 @@
+def iter_subtests(self) -> Iterator[ActionTestSummaryIdentifiableObject]:
+    """Iterate over all subtests.
+
+    :returns: An iterator over all subtests - just self in this case
+    """
+    yield self
+
+
 def all_subtests(self) -> list[ActionTestSummaryIdentifiableObject]:
     """Get all subtests.
 
@@ -1,15 +1,27 @@
+def iter_subtests(self) -> Iterator[ActionTestSummaryIdentifiableObject]:
+    """Iterate over all subtests, depth first.
+
+    Nested groups are walked with a stack of iterators, so no lists are built
+    along the way however deep the groups go.
+
+    :returns: An iterator over all subtests
+    """
+    stack = [iter(self.subtests or [])]
+
+    while stack:
+        for test in stack[-1]:
+            if isinstance(test, ActionTestSummaryGroup):
+                stack.append(iter(test.subtests or []))
+                break
+            if isinstance(test, ActionTestMetadata):
+                yield test
+        else:
+            stack.pop()
+
+
 def all_subtests(self) -> list[ActionTestSummaryIdentifiableObject]:
     """Get all subtests.
 
     :returns: All subtests
     """
-    if not self.subtests:
-        return []
-
-    return flatten(
-        [
-            test.all_subtests()
-            for test in self.subtests
-            if isinstance(test, (ActionTestSummaryGroup, ActionTestMetadata))
-        ]
-    )
+    return list(self.iter_subtests())
@@ -1,15 +1,16 @@
+def iter_tests(self) -> Iterator[ActionTestSummaryIdentifiableObject]:
+    """Iterate over all subtests, depth first.
+
+    :returns: An iterator over all subtests
+    """
+    for test in self.tests or []:
+        if isinstance(test, (ActionTestSummaryGroup, ActionTestMetadata)):
+            yield from test.iter_subtests()
+
+
 def all_tests(self) -> list[ActionTestSummaryIdentifiableObject]:
     """Get all subtests.
 
     :returns: All subtests
     """
-    if not self.tests:
-        return []
-
-    return flatten(
-        [
-            test.all_subtests()
-            for test in self.tests
-            if isinstance(test, (ActionTestSummaryGroup, ActionTestMetadata))
-        ]
-    )
+    return list(self.iter_tests())
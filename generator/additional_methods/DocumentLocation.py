@@ -1,3 +1,10 @@
+# The url along with its path, location, location details and the integer
+# values of the location details (the last three None if the url has no
+# location). Filled in the first time any of them are needed, and again if
+# the url changes.
+_parsed: tuple[str, str, str | None, dict[str, list[str]] | None, dict[str, int] | None]
+
+
 @staticmethod
 def empty() -> "DocumentLocation":
     """Create a new "empty" instance
@@ -5,18 +12,60 @@ def empty() -> "DocumentLocation":
     :returns: A new instance
     """
     instance = DocumentLocation.__new__(DocumentLocation)
-    instance.concreteTypeName = ""
-    instance.url = "file://#CharacterRangeLen=0&EndingColumnNumber=0&EndingLineNumber=0&StartingColumnNumber=0&StartingLineNumber=0"
+    # Bypasses __setattr__, which frozen models don't allow
+    object.__setattr__(instance, "concreteTypeName", "")
+    object.__setattr__(
+        instance,
+        "url",
+        "file://#CharacterRangeLen=0&EndingColumnNumber=0&EndingLineNumber=0&StartingColumnNumber=0&StartingLineNumber=0",
+    )
     return instance
 
 
+def _parse(
+    self,
+) -> tuple[str, str, str | None, dict[str, list[str]] | None, dict[str, int] | None]:
+    """Parse the url, unless it has been parsed already.
+
+    :returns: The url, path, location, location details and the integer values
+        of the location details
+    """
+    try:
+        parsed = self._parsed
+        if parsed[0] == self.url:
+            return parsed
+    except AttributeError:
+        pass
+
+    url = self.url
+    components = url.split("#")
+    path = components[0].replace("file://", "")
+
+    if len(components) < 2:
+        parsed = (url, path, None, None, None)
+    else:
+        location = components[1]
+        details = urllib.parse.parse_qs(location)
+        values: dict[str, int] = {}
+        for key, value in details.items():
+            try:
+                values[key] = int(value[0])
+            except ValueError:
+                pass
+        parsed = (url, path, location, details, values)
+
+    # Bypasses __setattr__, which frozen models don't allow
+    object.__setattr__(self, "_parsed", parsed)
+    return parsed
+
+
 @property
 def path(self) -> str:
     """Get the path of the document if set, empty string otherwise.
 
     :returns: The path of the document
     """
-    return self.url.split("#", maxsplit=1)[0].replace("file://", "")
+    return self._parse()[1]
 
 
 @property
@@ -25,7 +74,10 @@ def location(self) -> str:
 
     :returns: The location inside the document
     """
-    return self.url.split("#")[1]
+    location = self._parse()[2]
+    if location is None:
+        raise IndexError(f"No location in {self.url}")
+    return location
 
 
 @property
@@ -34,7 +86,21 @@ def location_details(self) -> dict[str, list[str]]:
 
     :returns: The location parametersinside the document
     """
-    return urllib.parse.parse_qs(self.location)
+    details = self._parse()[3]
+    if details is None:
+        raise IndexError(f"No location in {self.url}")
+    return details
+
+
+def _location_values(self) -> dict[str, int]:
+    """Get the integer values of the location details.
+
+    :returns: The values, by key
+    """
+    values = self._parse()[4]
+    if values is None:
+        raise IndexError(f"No location in {self.url}")
+    return values
 
 
 def _get_property(self, key: str, *, offset: int = 0) -> int | None:
@@ -45,10 +111,10 @@ def _get_property(self, key: str, *, offset: int = 0) -> int | None:
 
     :returns: The property as an int value if found, None otherwise
     """
-    value = self.location_details.get(key)
+    value = self._location_values().get(key)
     if value is None:
         return None
-    return int(value[0]) + offset
+    return value + offset
 
 
 @property
@@ -57,7 +123,7 @@ def character_range_length(self) -> int:
 
     :returns: The character range length
     """
-    return int(self.location_details["CharacterRangeLen"][0]) + 1
+    return self._location_values()["CharacterRangeLen"] + 1
 
 
 @property
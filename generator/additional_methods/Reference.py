@@ -0,0 +1,34 @@
+# The Xcresults this reference was read from, if any
+_results: Any
+
+
+def resolve(self, results: Any = None) -> Any:
+    """Get the object this reference points to.
+
+    The object is only fetched and deserialized when first asked for. After
+    that it comes from the object cache of the Xcresults, so resolving the
+    same reference again is free.
+
+    :param results: The Xcresults to load the object from. Defaults to the one
+        this reference was read from.
+
+    :returns: The deserialized object
+    """
+    if results is None:
+        results = getattr(self, "_results", None)
+
+    if results is None:
+        raise ValueError(f"Reference {self.id} was not read from an xcresult bundle")
+
+    return results.get_object(self.id)
+
+
+def __getstate__(self) -> dict[str, Any]:
+    # The Xcresults holds locks and every cached object, so pickling or copying
+    # a reference leaves it out
+    return {name: getattr(self, name) for name, _, _ in self.FIELDS if hasattr(self, name)}
+
+
+def __setstate__(self, state: dict[str, Any]) -> None:
+    for name, value in state.items():
+        object.__setattr__(self, name, value)
@@ -0,0 +1,98 @@
+"""Helpers shared by the tests."""
+
+import importlib.util
+import os
+import sys
+from typing import Any
+
+import pytest
+
+DATA_PATH = os.path.join(os.path.dirname(__file__), "data")
+
+TEST_SUCCESS_PATH = os.path.join(DATA_PATH, "TestSuccess.xcresult")
+TEST_FAILURE_PATH = os.path.join(DATA_PATH, "TestFailure.xcresult")
+TEST_BUILD_FAILURE_PATH = os.path.join(DATA_PATH, "TestBuildFailure.xcresult")
+
+# Bundles store their objects compressed, so reading them natively needs zstd
+requires_zstd = pytest.mark.skipif(
+    importlib.util.find_spec("zstandard") is None and sys.version_info < (3, 14),
+    reason="Reading compressed objects requires zstandard or Python 3.14+",
+)
+
+
+# Builders for the JSON which xcresulttool prints
+
+
+def value(content: str, type_name: str = "String") -> dict[str, Any]:
+    """Build a value of one of the basic types.
+
+    :param content: The value as xcresulttool formats it
+    :param type_name: The name of the type
+
+    :returns: The JSON for the value
+    """
+    return {"_type": {"_name": type_name}, "_value": content}
+
+
+def array(values: list[dict[str, Any]]) -> dict[str, Any]:
+    """Build an array.
+
+    :param values: The JSON for the elements
+
+    :returns: The JSON for the array
+    """
+    return {"_type": {"_name": "Array"}, "_values": values}
+
+
+def reference(identifier: str) -> dict[str, Any]:
+    """Build a reference to another object.
+
+    :param identifier: The id of the object
+
+    :returns: The JSON for the reference
+    """
+    return {"_type": {"_name": "Reference"}, "id": value(identifier)}
+
+
+def metadata(
+    identifier: str,
+    status: str = "Success",
+    summary_id: str | None = None,
+    duration: float | None = None,
+) -> dict[str, Any]:
+    """Build the ActionTestMetadata for a test.
+
+    :param identifier: The identifier of the test, e.g. "SuiteTests/testExample()"
+    :param status: The status of the test
+    :param summary_id: The id of the ActionTestSummary of the test, if it has one
+    :param duration: How long the test took in seconds, if it ran
+
+    :returns: The JSON for the test
+    """
+    data: dict[str, Any] = {
+        "_type": {"_name": "ActionTestMetadata"},
+        "identifier": value(identifier),
+        "identifierURL": value(f"test://com.apple.xcode/App/AppTests/{identifier}"),
+        "name": value(identifier.split("/")[-1]),
+        "testStatus": value(status),
+    }
+    if summary_id is not None:
+        data["summaryRef"] = reference(summary_id)
+    if duration is not None:
+        data["duration"] = value(str(duration), "Double")
+    return data
+
+
+def group(name: str, subtests: list[dict[str, Any]]) -> dict[str, Any]:
+    """Build an ActionTestSummaryGroup.
+
+    :param name: The name of the group
+    :param subtests: The JSON for the groups and tests in the group
+
+    :returns: The JSON for the group
+    """
+    return {
+        "_type": {"_name": "ActionTestSummaryGroup"},
+        "name": value(name),
+        "subtests": array(subtests),
+    }
@@ -104,7 +104,7 @@ def test_junit_writer_failure_no_location():
 
         with mock.patch.object(writer.results, "get"):
             with mock.patch(
-                "xcresult.junit_writer.deserialize"
+                "xcresult.xcresult_base.deserialize"
             ) as mock_deserialize:
                 summary = xcresult.ActionTestSummary()
                 failure = xcresult.ActionTestFailureSummary()
@@ -158,7 +158,7 @@ def test_junit_writer_with_attachments_and_identifierURL():
 
         with mock.patch.object(writer.results, "get"):
             with mock.patch(
-                "xcresult.junit_writer.deserialize"
+                "xcresult.xcresult_base.deserialize"
             ) as mock_deserialize:
                 summary = xcresult.ActionTestSummary()
                 failure = xcresult.ActionTestFailureSummary()
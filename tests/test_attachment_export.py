@@ -0,0 +1,557 @@
+"""Test exporting test attachments."""
+
+import os
+import sys
+import tempfile
+import threading
+from typing import Any, Iterable
+from unittest import mock
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+# pylint: disable=wrong-import-position
+import xcresult
+from xcresult.attachment_export import (
+    AttachmentExporter,
+    AttachmentFilter,
+    ExportManifest,
+    ExportProgress,
+)
+from xcresult.backends import RecordedBackend
+from xcresult.xcresulttool import (
+    deserialize,
+    export_action_test_summary_group,
+    plan_test_attachments,
+)
+from .helpers import array, metadata, reference, value
+
+# pylint: enable=wrong-import-position
+
+
+def _attachment(filename: str | None, payload_id: str) -> dict[str, Any]:
+    type_identifier = "public.data"
+    if filename is not None and filename.endswith(".png"):
+        type_identifier = "public.png"
+    elif filename is not None and filename.endswith(".txt"):
+        type_identifier = "public.plain-text"
+
+    attachment: dict[str, Any] = {
+        "_type": {"_name": "ActionTestAttachment"},
+        "name": value(filename or "Attachment"),
+        "uniformTypeIdentifier": value(type_identifier),
+        "payloadRef": reference(payload_id),
+        "payloadSize": {"_type": {"_name": "Int"}, "_value": str(len(FILES.get(payload_id, b"")))},
+    }
+    if filename is not None:
+        attachment["filename"] = value(filename)
+    return attachment
+
+
+def _summary(
+    activity_attachments: Iterable[dict[str, Any]],
+    failure_attachments: Iterable[dict[str, Any]] = (),
+) -> dict[str, Any]:
+    return {
+        "_type": {"_name": "ActionTestSummary"},
+        "activitySummaries": array(
+            [
+                {
+                    "_type": {"_name": "ActionTestActivitySummary"},
+                    "title": value("Activity"),
+                    "attachments": array(list(activity_attachments)),
+                }
+            ]
+        ),
+        "failureSummaries": array(
+            [
+                {
+                    "_type": {"_name": "ActionTestFailureSummary"},
+                    "attachments": array(list(failure_attachments)),
+                }
+            ]
+        ),
+    }
+
+
+def _objects() -> dict[str, dict[str, Any]]:
+    group = {
+        "_type": {"_name": "ActionTestSummaryGroup"},
+        "name": value("SuiteTests"),
+        "identifierURL": value("test://com.apple.xcode/App/AppTests/SuiteTests"),
+        "subtests": array(
+            [
+                metadata("SuiteTests/testOne()", "Failure", "summary-one"),
+                metadata("SuiteTests/testTwo()", "Success", "summary-two"),
+                metadata("SuiteTests/testThree()", "Skipped", "summary-three"),
+            ]
+        ),
+    }
+    testable = {
+        "_type": {"_name": "ActionTestableSummary"},
+        "name": value("AppTests"),
+        "tests": array([group]),
+    }
+    summaries = {
+        "_type": {"_name": "ActionTestPlanRunSummaries"},
+        "summaries": array(
+            [
+                {
+                    "_type": {"_name": "ActionTestPlanRunSummary"},
+                    "name": value("Configuration 1"),
+                    "testableSummaries": array([testable]),
+                }
+            ]
+        ),
+    }
+    build_result = {
+        "_type": {"_name": "ActionResult"},
+        "issues": {"_type": {"_name": "ResultIssueSummaries"}},
+        "metrics": {"_type": {"_name": "ResultMetrics"}},
+        "coverage": {"_type": {"_name": "CodeCoverageInfo"}},
+    }
+    device = {
+        "_type": {"_name": "ActionDeviceRecord"},
+        "platformRecord": {"_type": {"_name": "ActionPlatformRecord"}},
+    }
+    action = {
+        "_type": {"_name": "ActionRecord"},
+        "schemeCommandName": value("Test"),
+        "actionResult": dict(build_result, testsRef=reference("tests")),
+        "buildResult": build_result,
+        "runDestination": {
+            "_type": {"_name": "ActionRunDestinationRecord"},
+            "targetDeviceRecord": device,
+            "localComputerRecord": device,
+            "targetSDKRecord": {"_type": {"_name": "ActionSDKRecord"}},
+        },
+        "startedTime": {"_type": {"_name": "Date"}, "_value": "2024-01-02T03:04:05.678+0000"},
+        "endedTime": {"_type": {"_name": "Date"}, "_value": "2024-01-02T03:04:06.678+0000"},
+    }
+    root = {
+        "_type": {"_name": "ActionsInvocationRecord"},
+        "actions": array([action]),
+        "issues": {"_type": {"_name": "ResultIssueSummaries"}},
+        "metrics": {"_type": {"_name": "ResultMetrics"}},
+    }
+
+    return {
+        "root": root,
+        "tests": summaries,
+        "summary-one": _summary(
+            [_attachment("screenshot.png", "launch"), _attachment("screenshot.png", "tap")],
+            [_attachment("failure.txt", "failure")],
+        ),
+        "summary-two": _summary([_attachment("screenshot.png", "launch")]),
+        "summary-three": _summary([_attachment("skipped.png", "skipped")]),
+    }
+
+
+FILES = {
+    "launch": b"launch screenshot",
+    "tap": b"tap screenshot",
+    "failure": b"failure log",
+    "skipped": b"never exported",
+}
+
+
+def _bundle(files: dict[str, bytes] | None = None) -> xcresult.Xcresults:
+    return xcresult.Xcresults(
+        "/path/to/App.xcresult",
+        backend=RecordedBackend("root", _objects(), FILES if files is None else files),
+    )
+
+
+def _tree(path: str) -> dict[str, bytes]:
+    """Read every file under a path.
+
+    :returns: The contents of each file, by path relative to ``path``
+    """
+    tree: dict[str, bytes] = {}
+    for folder, _, file_names in os.walk(path):
+        for file_name in file_names:
+            file_path = os.path.join(folder, file_name)
+            with open(file_path, "rb") as exported:
+                tree[os.path.relpath(file_path, path)] = exported.read()
+    return tree
+
+
+def test_export_test_attachments():
+    """Test that the pipeline lays attachments out like the serial export."""
+    bundle = _bundle()
+
+    with tempfile.TemporaryDirectory() as pipelined, tempfile.TemporaryDirectory() as serial:
+        bundle.export_test_attachments(pipelined, max_workers=4)
+
+        group = bundle.get_object("tests").summaries[0].testableSummaries[0].tests[0]
+        export_action_test_summary_group(
+            bundle.path,
+            group,
+            serial,
+            loader=bundle.get_objects,
+            exporter=bundle.export_attachment,
+        )
+
+        tree = _tree(pipelined)
+        assert tree == _tree(serial)
+        assert tree == {
+            "App/AppTests/SuiteTests/testOne()/screenshot.png": b"launch screenshot",
+            "App/AppTests/SuiteTests/testOne()/screenshot-tap.png": b"tap screenshot",
+            "App/AppTests/SuiteTests/testOne()/failure.txt": b"failure log",
+            "App/AppTests/SuiteTests/testTwo()/screenshot.png": b"launch screenshot",
+        }
+
+
+def test_export_test_attachments_repeated():
+    """Test that exporting again gives exactly the same files."""
+    bundle = _bundle()
+
+    with tempfile.TemporaryDirectory() as first, tempfile.TemporaryDirectory() as second:
+        bundle.export_test_attachments(first)
+        bundle.export_test_attachments(second)
+        tree = _tree(first)
+        assert _tree(second) == tree
+
+        # Exporting over a previous export replaces the files rather than adding more
+        bundle.export_test_attachments(first)
+        assert _tree(first) == tree
+
+
+def test_plan_test_attachments():
+    """Test that clashing names get suffixes from the payload id."""
+    test = deserialize(metadata("SuiteTests/testOne()", "Failure", "summary-one"))
+    summary = deserialize(
+        _summary(
+            [
+                _attachment("Screenshot.png", "0~abcdefghijklmnop"),
+                _attachment("screenshot.png", "0~qrstuvwxyz"),
+                _attachment("screenshot.png", "0~qrstuvwxyz"),
+                _attachment(None, "0~no-file-name"),
+            ]
+        )
+    )
+
+    reserved = set()
+    planned = plan_test_attachments(test, summary, "/output", reserved=reserved)
+    folder = "/output/App/AppTests/SuiteTests/testOne()"
+
+    assert planned == [
+        ("0~abcdefghijklmnop", f"{folder}/Screenshot.png"),
+        ("0~qrstuvwxyz", f"{folder}/screenshot-qrstuvwx.png"),
+        ("0~qrstuvwxyz", f"{folder}/screenshot-qrstuvwx-2.png"),
+        ("0~no-file-name", f"{folder}/no-file-name"),
+    ]
+    assert len(reserved) == 4
+
+    # Paths reserved by earlier tests (e.g. a retry) are avoided too
+    [(_, path)] = plan_test_attachments(
+        test,
+        deserialize(_summary([_attachment("screenshot.png", "0~retry")])),
+        "/output",
+        0,
+        reserved,
+    )
+    assert path == f"{folder}/screenshot-retry.png"
+
+
+def test_export_progress():
+    """Test that progress is reported as the export runs."""
+    reports: list[tuple[int, int, bool]] = []
+
+    def record(progress: ExportProgress) -> None:
+        reports.append(
+            (
+                progress.attachments_exported,
+                progress.attachments_discovered,
+                progress.discovery_complete,
+            )
+        )
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        _bundle().export_test_attachments(temp_dir, max_workers=2, progress_callback=record)
+
+    assert reports[-1] == (4, 4, True)
+    assert reports.count((4, 4, True)) == 1
+    assert [exported for exported, _, _ in reports] == sorted(
+        exported for exported, _, _ in reports
+    )
+
+
+def test_export_concurrency():
+    """Test that no more than max_workers attachments are exported at once."""
+    bundle = _bundle()
+    lock = threading.Lock()
+    running = [0, 0]
+
+    def exporter(identifier: str, type_identifier: str, output_path: str) -> None:
+        with lock:
+            running[0] += 1
+            running[1] = max(running)
+        bundle.export_attachment(identifier, type_identifier, output_path)
+        with lock:
+            running[0] -= 1
+
+    group = bundle.get_object("tests").summaries[0].testableSummaries[0].tests[0]
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        progress = AttachmentExporter(
+            bundle.get_objects, exporter, temp_dir, max_workers=1, batch_size=1
+        ).export([group])
+
+    assert running[1] == 1
+    assert progress.tests_discovered == 2
+    assert progress.attachments_exported == 4
+
+
+def test_export_error():
+    """Test that a failed export stops the rest and is raised."""
+    files = dict(FILES)
+    del files["tap"]
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        with pytest.raises(xcresult.XcresultException):
+            _bundle(files).export_test_attachments(temp_dir, max_workers=1)
+
+        assert not os.path.exists(os.path.join(temp_dir, "App/AppTests/SuiteTests/testTwo()"))
+
+
+def test_export_blob_store():
+    """Test that each payload is exported once and linked to from every test."""
+    bundle = _bundle()
+    exported: list[str] = []
+
+    def exporter(identifier: str, type_identifier: str, output_path: str) -> None:
+        exported.append(identifier)
+        bundle.export_attachment(identifier, type_identifier, output_path)
+
+    group = bundle.get_object("tests").summaries[0].testableSummaries[0].tests[0]
+
+    with tempfile.TemporaryDirectory() as plain, tempfile.TemporaryDirectory() as deduplicated:
+        bundle.export_test_attachments(plain)
+
+        blob_store_path = os.path.join(deduplicated, "blobs")
+        output_path = os.path.join(deduplicated, "attachments")
+        progress = AttachmentExporter(
+            bundle.get_objects, exporter, output_path, blob_store_path=blob_store_path
+        ).export([group])
+
+        assert _tree(output_path) == _tree(plain)
+        assert sorted(exported) == ["failure", "launch", "tap"]
+        assert sorted(os.listdir(blob_store_path)) == ["failure", "launch", "tap"]
+        assert progress.attachments_exported == 4
+        assert progress.payloads_exported == 3
+
+        first = os.path.join(output_path, "App/AppTests/SuiteTests/testOne()/screenshot.png")
+        second = os.path.join(output_path, "App/AppTests/SuiteTests/testTwo()/screenshot.png")
+        assert os.path.samefile(first, second)
+        assert os.path.samefile(first, os.path.join(blob_store_path, "launch"))
+
+        # Exporting again replaces the links
+        bundle.export_test_attachments(output_path, blob_store_path=blob_store_path)
+        assert _tree(output_path) == _tree(plain)
+
+
+def test_export_blob_store_without_links():
+    """Test that payloads are copied where they can't be linked."""
+    bundle = _bundle()
+
+    with tempfile.TemporaryDirectory() as plain, tempfile.TemporaryDirectory() as deduplicated:
+        bundle.export_test_attachments(plain)
+
+        blob_store_path = os.path.join(deduplicated, "blobs")
+        output_path = os.path.join(deduplicated, "attachments")
+
+        with mock.patch("os.link", side_effect=OSError("Not supported")):
+            bundle.export_test_attachments(output_path, blob_store_path=blob_store_path)
+
+        assert _tree(output_path) == _tree(plain)
+        assert not os.path.samefile(
+            os.path.join(output_path, "App/AppTests/SuiteTests/testOne()/screenshot.png"),
+            os.path.join(blob_store_path, "launch"),
+        )
+
+
+def test_export_resume():
+    """Test that a resumed export only exports what an earlier one didn't finish."""
+    bundle = _bundle()
+    files = dict(FILES)
+    del files["tap"]
+
+    with tempfile.TemporaryDirectory() as plain, tempfile.TemporaryDirectory() as temp_dir:
+        bundle.export_test_attachments(plain)
+
+        output_path = os.path.join(temp_dir, "attachments")
+        manifest_path = os.path.join(temp_dir, "manifest.jsonl")
+
+        # The first export stops at the missing payload
+        with pytest.raises(xcresult.XcresultException):
+            _bundle(files).export_test_attachments(
+                output_path, max_workers=1, manifest_path=manifest_path
+            )
+
+        # Whether the failure log was exported before the export stopped depends on timing
+        manifest = ExportManifest(manifest_path)
+        finished = sorted(identifier for identifier, _ in manifest.entries.values())
+        assert finished in (["launch"], ["failure", "launch"])
+
+        exported: list[str] = []
+
+        def exporter(identifier: str, type_identifier: str, file_path: str) -> None:
+            exported.append(identifier)
+            bundle.export_attachment(identifier, type_identifier, file_path)
+
+        group = bundle.get_object("tests").summaries[0].testableSummaries[0].tests[0]
+        progress = AttachmentExporter(
+            bundle.get_objects, exporter, output_path, manifest_path=manifest_path
+        ).export([group])
+
+        assert len(exported) == 4 - len(finished)
+        assert "tap" in exported
+        assert progress.attachments_skipped == len(finished)
+        assert progress.attachments_exported == 4
+        assert _tree(output_path) == _tree(plain)
+
+        # A file which has changed since is exported again
+        with open(
+            os.path.join(output_path, "App/AppTests/SuiteTests/testOne()/failure.txt"), "ab"
+        ) as changed:
+            changed.write(b" and more")
+
+        exported.clear()
+        progress = AttachmentExporter(
+            bundle.get_objects, exporter, output_path, manifest_path=manifest_path
+        ).export([group])
+
+        assert exported == ["failure"]
+        assert progress.attachments_skipped == 3
+        assert _tree(output_path) == _tree(plain)
+
+
+def test_export_resume_blob_store():
+    """Test resuming an export into a blob store."""
+    bundle = _bundle()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        output_path = os.path.join(temp_dir, "attachments")
+        blob_store_path = os.path.join(temp_dir, "blobs")
+        manifest_path = os.path.join(temp_dir, "manifest.jsonl")
+
+        bundle.export_test_attachments(
+            output_path, blob_store_path=blob_store_path, manifest_path=manifest_path
+        )
+        assert len(ExportManifest(manifest_path).entries) == 7
+
+        # Without the attachment, only the link is made again
+        os.remove(os.path.join(output_path, "App/AppTests/SuiteTests/testTwo()/screenshot.png"))
+
+        with mock.patch.object(bundle, "export_attachment") as export_attachment:
+            bundle.export_test_attachments(
+                output_path, blob_store_path=blob_store_path, manifest_path=manifest_path
+            )
+
+        export_attachment.assert_not_called()
+        assert os.path.samefile(
+            os.path.join(output_path, "App/AppTests/SuiteTests/testTwo()/screenshot.png"),
+            os.path.join(blob_store_path, "launch"),
+        )
+
+
+def test_export_manifest_cut_short():
+    """Test that a manifest whose last line was cut short can still be read and extended."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        manifest_path = os.path.join(temp_dir, "manifest.jsonl")
+        file_path = os.path.join(temp_dir, "file.txt")
+
+        with open(file_path, "wb") as written:
+            written.write(b"contents")
+
+        with open(manifest_path, "w", encoding="utf-8") as manifest_file:
+            manifest_file.write('{"id":"file","path":"file.txt","size":8}\n{"id":"oth')
+
+        manifest = ExportManifest(manifest_path)
+        assert manifest.is_complete("file", file_path)
+        assert not manifest.is_complete("other", file_path)
+
+        manifest.record("again", file_path)
+        manifest.close()
+
+        assert ExportManifest(manifest_path).entries == {"file.txt": ("again", 8)}
+
+
+def _filtered_tree(attachment_filter: AttachmentFilter) -> list[str]:
+    with tempfile.TemporaryDirectory() as temp_dir:
+        _bundle().export_test_attachments(temp_dir, attachment_filter=attachment_filter)
+        return sorted(_tree(temp_dir))
+
+
+def test_export_filters():
+    """Test filtering the attachments which are exported."""
+    one = "App/AppTests/SuiteTests/testOne()"
+    two = "App/AppTests/SuiteTests/testTwo()"
+
+    assert _filtered_tree(AttachmentFilter(statuses=["Failure"])) == [
+        f"{one}/failure.txt",
+        f"{one}/screenshot-tap.png",
+        f"{one}/screenshot.png",
+    ]
+    assert _filtered_tree(AttachmentFilter(type_identifiers=["public.plain-text"])) == [
+        f"{one}/failure.txt"
+    ]
+    assert _filtered_tree(AttachmentFilter(excluded_type_identifiers=["public.plain-text"])) == [
+        f"{one}/screenshot-tap.png",
+        f"{one}/screenshot.png",
+        f"{two}/screenshot.png",
+    ]
+    assert _filtered_tree(AttachmentFilter(name_patterns=["fail*", "*.TXT"])) == [
+        f"{one}/failure.txt"
+    ]
+    assert _filtered_tree(
+        AttachmentFilter(statuses=["Success"], type_identifiers=["public.png"])
+    ) == [f"{two}/screenshot.png"]
+
+
+def test_export_filter_skips_summaries():
+    """Test that the summaries of tests left out by status are never loaded."""
+    bundle = _bundle()
+
+    with mock.patch.object(bundle, "get_objects", wraps=bundle.get_objects) as get_objects:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            bundle.export_test_attachments(
+                temp_dir, attachment_filter=AttachmentFilter(statuses=["Success"])
+            )
+
+    loaded = [identifier for call in get_objects.call_args_list for identifier in call.args[0]]
+    assert "summary-one" not in loaded
+    assert "summary-two" in loaded
+
+
+def test_export_does_not_keep_summaries():
+    """Test that the summaries read by an export aren't left in the object cache."""
+    bundle = _bundle()
+    failed = bundle.get_object("summary-one")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        bundle.export_test_attachments(temp_dir, max_workers=2)
+        assert len(_tree(temp_dir)) == 4
+
+    # Summaries which were already loaded are still reused
+    assert bundle.get_object("summary-one") is failed
+    assert "summary-two" not in bundle.object_cache
+    assert "summary-three" not in bundle.object_cache
+
+
+def test_export_max_bytes():
+    """Test that attachments which don't fit in the budget are skipped, in order."""
+    one = "App/AppTests/SuiteTests/testOne()"
+    two = "App/AppTests/SuiteTests/testTwo()"
+
+    # launch (17 bytes) fits, tap (14) doesn't, failure (11) does, then nothing else fits
+    assert _filtered_tree(AttachmentFilter(max_bytes=30)) == [
+        f"{one}/failure.txt",
+        f"{one}/screenshot.png",
+    ]
+    assert _filtered_tree(AttachmentFilter(max_bytes=0)) == []
+    assert len(_filtered_tree(AttachmentFilter(max_bytes=59))) == 4
+    assert _filtered_tree(AttachmentFilter(max_bytes=17, statuses=["Success"])) == [
+        f"{two}/screenshot.png"
+    ]
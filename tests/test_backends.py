@@ -0,0 +1,139 @@
+"""Test the bundle backends."""
+
+import base64
+import json
+import os
+import sys
+import tempfile
+from unittest import mock
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+# pylint: disable=wrong-import-position
+import xcresult
+from xcresult.backends import CachingBackend, RecordedBackend, SubprocessBackend
+from xcresult.cache import DiskCache
+from xcresult.exceptions import XcresultException
+
+# pylint: enable=wrong-import-position
+
+
+SUCCESS_PATH = os.path.join(os.path.dirname(__file__), "data", "Success.xcresult")
+
+ROOT = {
+    "_type": {"_name": "ActionsInvocationRecord"},
+    "actions": {"_type": {"_name": "Array"}, "_values": []},
+    "issues": {"_type": {"_name": "ResultIssueSummaries"}},
+    "metrics": {"_type": {"_name": "ResultMetrics"}},
+}
+STRING = {"_type": {"_name": "String"}, "_value": "test"}
+
+
+def _recorded_backend() -> RecordedBackend:
+    return RecordedBackend("root", {"root": ROOT, "string": STRING}, {"file": b"contents"})
+
+
+def test_recorded_backend():
+    """Test that a recorded backend replays its objects and files."""
+    backend = _recorded_backend()
+
+    assert backend.get("ignored") == ROOT
+    assert backend.get("ignored", "string") == STRING
+    assert backend.get_many("ignored", ["string", "root"]) == [STRING, ROOT]
+    assert backend.list_ids("ignored") == ["file", "root", "string"]
+
+    with pytest.raises(XcresultException):
+        backend.get("ignored", "missing")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        output_path = os.path.join(temp_dir, "nested", "file")
+        backend.export_file("ignored", "file", output_path)
+
+        with open(output_path, "rb") as output_file:
+            assert output_file.read() == b"contents"
+
+        with pytest.raises(XcresultException):
+            backend.export_file("ignored", "missing", output_path)
+
+
+def test_recorded_backend_load():
+    """Test loading a recording from disk."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        recording_path = os.path.join(temp_dir, "recording.json")
+
+        with open(recording_path, "w", encoding="utf-8") as recording_file:
+            json.dump(
+                {
+                    "rootId": "root",
+                    "objects": {"root": ROOT},
+                    "files": {"file": base64.b64encode(b"contents").decode("ascii")},
+                },
+                recording_file,
+            )
+
+        backend = RecordedBackend.load(recording_path)
+
+    assert backend.get("ignored") == ROOT
+    assert backend.files == {"file": b"contents"}
+
+
+def test_subprocess_backend():
+    """Test that the subprocess backend goes through xcresulttool."""
+    backend = SubprocessBackend(max_workers=2)
+
+    with mock.patch("xcresult.xcresulttool.get", return_value=STRING) as mock_get:
+        assert backend.get(SUCCESS_PATH, "string") == STRING
+        assert backend.get_many(SUCCESS_PATH, ["a", "b"]) == [STRING, STRING]
+        assert mock_get.call_count == 3
+
+    with mock.patch("xcresult.xcresulttool.export_attachment") as mock_export:
+        backend.export_directory(SUCCESS_PATH, "directory", "/tmp/output")
+        mock_export.assert_called_once_with(SUCCESS_PATH, "directory", "directory", "/tmp/output")
+
+
+def test_caching_backend():
+    """Test that the caching backend only calls through on a miss."""
+    inner = _recorded_backend()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        backend = CachingBackend(inner, DiskCache(temp_dir))
+
+        with mock.patch.object(inner, "get", wraps=inner.get) as mock_get:
+            assert backend.get(SUCCESS_PATH, "string") == STRING
+            assert backend.get(SUCCESS_PATH, "string") == STRING
+            assert mock_get.call_count == 1
+
+            assert backend.get_many(SUCCESS_PATH, ["string", "root", "string"]) == [
+                STRING,
+                ROOT,
+                STRING,
+            ]
+            assert mock_get.call_count == 2
+
+        # Bundles without a root id can't be cached, but still work
+        assert backend.get(temp_dir, "string") == STRING
+
+
+def test_xcresults_with_backend():
+    """Test that Xcresults reads everything through its backend."""
+    with mock.patch("subprocess.run", side_effect=AssertionError("subprocess called")):
+        bundle = xcresult.Xcresults(SUCCESS_PATH, backend=_recorded_backend())
+
+        assert isinstance(bundle.actions_invocation_record, xcresult.ActionsInvocationRecord)
+        assert bundle.get_object("string") == "test"
+        assert bundle.list_ids() == ["file", "root", "string"]
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_path = os.path.join(temp_dir, "file")
+            bundle.export_attachment("file", "file", output_path)
+            assert os.path.exists(output_path)
+
+
+def test_xcresults_wraps_backend_in_cache():
+    """Test that passing a cache wraps the backend."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        bundle = xcresult.Xcresults(SUCCESS_PATH, DiskCache(temp_dir), backend=_recorded_backend())
+
+        assert isinstance(bundle.backend, CachingBackend)
+        assert isinstance(bundle.backend.backend, RecordedBackend)
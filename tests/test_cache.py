@@ -0,0 +1,133 @@
+"""Test the on disk cache."""
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+from unittest import mock
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+# pylint: disable=wrong-import-position
+import xcresult
+from xcresult.cache import DiskCache, ObjectCache, bundle_root_id
+
+# pylint: enable=wrong-import-position
+
+
+SUCCESS_PATH = os.path.join(os.path.dirname(__file__), "data", "Success.xcresult")
+SUCCESS_ROOT_ID = (
+    "0~zQQ1KbWJMHo48YLZaHuxPPaKTsIN3q8XhqtOPcdafxJVtJ_cc9p4noqIw-sg5vBGdOl_LBiR657QH8LpzMCH1Q=="
+)
+
+
+def test_bundle_root_id():
+    """Test reading the root id from a bundle."""
+    assert bundle_root_id(SUCCESS_PATH) == SUCCESS_ROOT_ID
+
+
+def test_bundle_root_id_missing():
+    """Test reading the root id from something that isn't a bundle."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        assert bundle_root_id(temp_dir) is None
+
+
+def test_key_is_stable_across_copies():
+    """Test that copies of the same bundle share cache keys."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        copy_path = os.path.join(temp_dir, "Copy.xcresult")
+        os.makedirs(copy_path)
+        shutil.copy(os.path.join(SUCCESS_PATH, "Info.plist"), copy_path)
+
+        cache = DiskCache(os.path.join(temp_dir, "cache"))
+        assert cache.key(SUCCESS_PATH, "abc") == cache.key(copy_path, "abc")
+        assert cache.key(SUCCESS_PATH, "abc") != cache.key(SUCCESS_PATH, "def")
+        assert cache.key(SUCCESS_PATH, None) != cache.key(SUCCESS_PATH, "abc")
+        assert cache.key(temp_dir, "abc") is None
+
+
+def test_read_write():
+    """Test reading and writing entries."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cache = DiskCache(temp_dir)
+        assert cache.read("abcdef") is None
+        cache.write("abcdef", b"data")
+        assert cache.read("abcdef") == b"data"
+        assert cache.size == 4
+        cache.clear()
+        assert cache.read("abcdef") is None
+        assert cache.size == 0
+
+
+def test_eviction_is_least_recently_used():
+    """Test that the least recently used entries are evicted first."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cache = DiskCache(temp_dir, max_size=10)
+        cache.write("aa1", b"12345")
+        cache.write("bb2", b"12345")
+
+        # Make the first entry the most recently used one
+        past = time.time() - 100
+        os.utime(cache._entry_path("bb2"), (past, past))  # pylint: disable=protected-access
+        assert cache.read("aa1") == b"12345"
+
+        cache.write("cc3", b"12345")
+
+        assert cache.read("aa1") == b"12345"
+        assert cache.read("bb2") is None
+        assert cache.read("cc3") == b"12345"
+        assert cache.size <= 10
+
+
+def test_oversized_entries_are_not_stored():
+    """Test that entries larger than the cache are skipped."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cache = DiskCache(temp_dir, max_size=2)
+        cache.write("aa1", b"12345")
+        assert cache.read("aa1") is None
+
+
+def test_xcresults_uses_cache():
+    """Test that Xcresults keeps xcresulttool responses in its cache."""
+    response = {"_type": {"_name": "String"}, "_value": "test"}
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        bundle = xcresult.Xcresults(SUCCESS_PATH, cache=DiskCache(temp_dir))
+
+        with mock.patch("xcresult.xcresulttool.subprocess.run") as mock_run:
+            mock_run.return_value = mock.Mock(stdout=json.dumps(response))
+            bundle.get("some-id")
+            xcresult.Xcresults(SUCCESS_PATH, cache=DiskCache(temp_dir)).get("some-id")
+            assert mock_run.call_count == 1
+
+
+def test_object_cache():
+    """Test the in memory object cache."""
+    cache = ObjectCache()
+
+    assert cache.lookup("a") == (False, None)
+    cache.store("a", 1)
+    assert cache.lookup("a") == (True, 1)
+    assert "a" in cache
+    assert len(cache) == 1
+    assert cache.hits == 1
+    assert cache.misses == 1
+
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.hits == 0
+    assert cache.misses == 0
+
+
+def test_object_cache_max_objects():
+    """Test that the object cache drops the least recently used objects."""
+    cache = ObjectCache(max_objects=2)
+    cache.store("a", 1)
+    cache.store("b", 2)
+    cache.lookup("a")
+    cache.store("c", 3)
+
+    assert "a" in cache
+    assert "b" not in cache
+    assert "c" in cache
@@ -109,6 +109,88 @@ def test_export_exception():
                 assert result == 1
 
 
+def test_export_options():
+    """Test passing the export options through to the export."""
+    test_data_path = os.path.join(
+        os.path.dirname(__file__), "data", "TestSuccess.xcresult"
+    )
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        with mock.patch(
+            "sys.argv",
+            [
+                "xcresult",
+                "-b",
+                test_data_path,
+                "export",
+                "-o",
+                temp_dir,
+                "--max-workers",
+                "3",
+                "--blob-store-path",
+                temp_dir,
+                "--manifest-path",
+                os.path.join(temp_dir, "manifest.jsonl"),
+                "--progress",
+            ],
+        ):
+            with mock.patch(
+                "xcresult.Xcresults.export_test_attachments"
+            ) as mock_export:
+                result = run()
+                assert result == 0
+
+                _, kwargs = mock_export.call_args
+                assert kwargs["max_workers"] == 3
+                assert kwargs["progress_callback"] is not None
+                assert kwargs["blob_store_path"] == temp_dir
+                assert kwargs["manifest_path"] == os.path.join(
+                    temp_dir, "manifest.jsonl"
+                )
+
+
+def test_export_filters():
+    """Test passing attachment filters to the export."""
+    test_data_path = os.path.join(
+        os.path.dirname(__file__), "data", "TestSuccess.xcresult"
+    )
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        with mock.patch(
+            "sys.argv",
+            [
+                "xcresult",
+                "-b",
+                test_data_path,
+                "export",
+                "-o",
+                temp_dir,
+                "--test-statuses",
+                "Failure",
+                "--exclude-types",
+                "public.plain-text",
+                "--names",
+                "Screenshot*",
+                "--max-bytes",
+                "1000",
+            ],
+        ):
+            with mock.patch(
+                "xcresult.Xcresults.export_test_attachments"
+            ) as mock_export:
+                result = run()
+                assert result == 0
+
+                attachment_filter = mock_export.call_args[1]["attachment_filter"]
+                assert attachment_filter.statuses == {"Failure"}
+                assert attachment_filter.type_identifiers is None
+                assert attachment_filter.excluded_type_identifiers == {
+                    "public.plain-text"
+                }
+                assert attachment_filter.name_patterns == ("Screenshot*",)
+                assert attachment_filter.max_bytes == 1000
+
+
 def test_junit_success():
     """Test successful junit command."""
     test_data_path = os.path.join(
@@ -27,10 +27,10 @@ def test_junit_writer_type_error():
         root = ET.Element("testsuites")
 
         # Create a mock testable summary whose single test group yields a
-        # non-ActionTestMetadata leaf from all_subtests() (what the writer
+        # non-ActionTestMetadata leaf from iter_subtests() (what the writer
         # actually iterates), so the isinstance guard raises.
         test_group = mock.Mock()
-        test_group.all_subtests = mock.Mock(return_value=["not_a_test_metadata"])
+        test_group.iter_subtests = mock.Mock(return_value=iter(["not_a_test_metadata"]))
 
         testable_summary = mock.Mock(spec=xcresult.ActionTestableSummary)
         testable_summary.name = "TestSuite"
@@ -101,7 +101,7 @@ def test_xcresults_export_attachment():
         output_path = os.path.join(temp_dir, "test.png")
 
         # Mock the underlying export_attachment function
-        with mock.patch("xcresult.xcresults.export_attachment") as mock_export:
+        with mock.patch("xcresult.xcresulttool.export_attachment") as mock_export:
             bundle.export_attachment("test-id", "file", output_path)
             # Should call the underlying function (line 51)
             mock_export.assert_called_once_with(test_data_path, "test-id", "file", output_path)
@@ -145,7 +145,7 @@ def test_xcresults_export_missing_summaries():
             mock_summaries = xcresult.ActionTestPlanRunSummaries()
             mock_summaries.summaries = None
 
-            with mock.patch("xcresult.xcresults.deserialize", return_value=mock_summaries):
+            with mock.patch("xcresult.xcresult_base.deserialize", return_value=mock_summaries):
                 try:
                     bundle.export_test_attachments(temp_dir)
                     # May succeed if there are no actions, or fail if there are
@@ -168,7 +168,7 @@ def test_xcresults_export_missing_testable_summaries():
         mock_summary.testableSummaries = None
         mock_summaries.summaries = [mock_summary]
 
-        with mock.patch("xcresult.xcresults.deserialize", return_value=mock_summaries):
+        with mock.patch("xcresult.xcresult_base.deserialize", return_value=mock_summaries):
             with mock.patch.object(bundle, "get"):
                 try:
                     bundle.export_test_attachments(temp_dir)
@@ -196,7 +196,7 @@ def test_xcresults_export_missing_tests():
         mock_summary.testableSummaries = [mock_testable]
         mock_summaries.summaries = [mock_summary]
 
-        with mock.patch("xcresult.xcresults.deserialize", return_value=mock_summaries):
+        with mock.patch("xcresult.xcresult_base.deserialize", return_value=mock_summaries):
             with mock.patch.object(bundle, "get"):
                 try:
                     bundle.export_test_attachments(temp_dir)
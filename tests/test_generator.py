@@ -0,0 +1,162 @@
+"""Test the model generator."""
+
+import copy
+import importlib.util
+import os
+import pickle
+import re
+import sys
+import tempfile
+from typing import Any
+from unittest import mock
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+# pylint: disable=wrong-import-position
+import generator
+import xcresult
+from xcresult import xcresulttool
+from xcresult.xcresulttool import _ModelDeserializer
+from .helpers import TEST_FAILURE_PATH, requires_zstd
+
+# pylint: enable=wrong-import-position
+
+
+FORMAT_DESCRIPTION = """Name: Xcode Result Types
+Types:
+  - Int
+    * Kind: value
+  - String
+    * Kind: value
+  - Named
+    * Kind: object
+    * Properties:
+      + name: String
+  - Counted
+    * Supertype: Named
+    * Kind: object
+    * Properties:
+      + count: Int
+"""
+
+
+def _real_format_description() -> str:
+    """Rebuild the format description the shipped models were generated from.
+
+    Each generated class keeps its part of the description in its docstring.
+    """
+    with open(xcresult.model.__file__, encoding="utf-8") as model_file:
+        source = model_file.read()
+
+    lines = ["Name: Xcode Result Types", "Types:"]
+
+    for match in re.finditer(r"^# Defined Type: (\w+) -> ", source, re.MULTILINE):
+        lines.extend([f"  - {match.group(1)}", "    * Kind: value"])
+
+    for match in re.finditer(
+        r'"""Generated from xcresulttool format description\.\n\n(.*?)"""', source, re.DOTALL
+    ):
+        # The docstrings are indented by four spaces rather than two
+        lines.extend("  " + line[4:] for line in match.group(1).rstrip().split("\n"))
+
+    return "\n".join(lines) + "\n"
+
+
+def _generate_module(frozen: bool, format_description: str = FORMAT_DESCRIPTION) -> Any:
+    with tempfile.TemporaryDirectory() as temp_dir:
+        output_path = os.path.join(temp_dir, "generated_model.py")
+
+        with mock.patch("generator.subprocess.run") as mock_run:
+            mock_run.return_value = mock.Mock(stdout=format_description)
+            generator.generate(output_path, frozen=frozen)
+
+        spec = importlib.util.spec_from_file_location("generated_model", output_path)
+        assert spec is not None and spec.loader is not None
+        module = importlib.util.module_from_spec(spec)
+
+        # The models look themselves up in sys.modules
+        with mock.patch.dict(sys.modules, {"generated_model": module}):
+            spec.loader.exec_module(module)
+
+    return module
+
+
+def test_generate_mutable():
+    """Test that models can be changed by default."""
+    module = _generate_module(frozen=False)
+    assert module.FROZEN is False
+
+    counted = module.Counted()
+    counted.name = "test"
+    counted.count = 1
+    assert counted == _ModelDeserializer(module.Counted).create({"name": "test", "count": 1})
+
+    # Nothing is cached, so the hash follows changes
+    before = hash(counted)
+    counted.count = 2
+    assert hash(counted) != before
+
+
+def test_generate_frozen():
+    """Test that frozen models can be deserialized but not changed."""
+    module = _generate_module(frozen=True)
+    assert module.FROZEN is True
+
+    with pytest.raises(AttributeError):
+        module.Counted().count = 1
+
+    counted = _ModelDeserializer(module.Counted).create({"name": "test", "count": 1})
+    assert counted.name == "test"
+    assert counted.count == 1
+
+    with pytest.raises(AttributeError):
+        counted.name = "changed"
+
+    with pytest.raises(AttributeError):
+        del counted.count
+
+    # The hash is cached, and equal objects can be shared as keys
+    same = _ModelDeserializer(module.Counted).create({"name": "test", "count": 1})
+    assert hash(counted) == hash(same)
+    assert {counted: 1}[same] == 1
+
+    with mock.patch.object(module.Counted, "_members", side_effect=AssertionError("recomputed")):
+        assert hash(counted) == hash(same)
+
+
+@requires_zstd
+def test_generate_frozen_copy_and_pickle():
+    """Test that frozen models read from a bundle can be copied and pickled."""
+    module = _generate_module(frozen=True, format_description=_real_format_description())
+
+    # Read the bundle into the frozen models rather than the shipped ones
+    with mock.patch.object(xcresulttool, "model", module), mock.patch.dict(
+        xcresulttool._MODEL_DESERIALIZERS, clear=True  # pylint: disable=protected-access
+    ):
+        bundle = xcresult.Xcresults(TEST_FAILURE_PATH, native=True)
+        record = bundle.actions_invocation_record
+        summaries = record.actions[0].actionResult.testsRef.resolve()
+
+    assert isinstance(record, module.ActionsInvocationRecord)
+    assert isinstance(summaries, module.ActionTestPlanRunSummaries)
+
+    # Unpickling looks the classes up by module name
+    with mock.patch.dict(sys.modules, {"generated_model": module}):
+        for original in [record, summaries]:
+            hash(original)
+
+            for duplicate in [
+                copy.copy(original),
+                copy.deepcopy(original),
+                pickle.loads(pickle.dumps(original)),
+            ]:
+                assert duplicate is not original
+                assert duplicate == original
+
+                # String hashes differ between processes, so the cached hash isn't kept
+                assert not hasattr(duplicate, "_hash")
+                assert hash(duplicate) == hash(original)
+
+                with pytest.raises(AttributeError):
+                    setattr(duplicate, duplicate.FIELDS[0][0], None)
@@ -0,0 +1,120 @@
+"""Test the index of tests by identifier."""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+# pylint: disable=wrong-import-position
+import xcresult
+from xcresult.identifier_index import IdentifierIndex
+from xcresult.xcresulttool import deserialize
+from .helpers import TEST_FAILURE_PATH, array, group, metadata, requires_zstd, value
+
+# pylint: enable=wrong-import-position
+
+
+def _summaries() -> xcresult.ActionTestPlanRunSummaries:
+    retried_group = group(
+        "All tests",
+        [
+            group(
+                "SuiteTests",
+                [metadata("SuiteTests/testOne()", "Failure"), metadata("SuiteTests/testTwo()")],
+            )
+        ],
+    )
+    retry_group = group("Selected tests", [metadata("SuiteTests/testOne()")])
+    testable = {
+        "_type": {"_name": "ActionTestableSummary"},
+        "name": value("AppTests"),
+        "tests": array([retried_group, retry_group]),
+    }
+    run_summary = {
+        "_type": {"_name": "ActionTestPlanRunSummary"},
+        "name": value("Configuration 1"),
+        "testableSummaries": array([testable]),
+    }
+    return deserialize(
+        {"_type": {"_name": "ActionTestPlanRunSummaries"}, "summaries": array([run_summary])}
+    )
+
+
+def test_lookup():
+    """Test looking tests up by identifier and identifier URL."""
+    summaries = _summaries()
+    index = IdentifierIndex.from_summaries([summaries])
+
+    [found] = index.lookup("SuiteTests/testTwo()")
+    assert found.test.identifier == "SuiteTests/testTwo()"
+    assert [group.name for group in found.groups] == ["All tests", "SuiteTests"]
+    assert found.testable.name == "AppTests"
+    assert found.run_summary is summaries.summaries[0]
+
+    assert index.lookup("test://com.apple.xcode/App/AppTests/SuiteTests/testTwo()") == [found]
+    assert index.lookup("SuiteTests/missing()") == []
+
+
+def test_lookup_retried():
+    """Test that every attempt of a retried test is found, in order."""
+    index = IdentifierIndex.from_summaries([_summaries()])
+
+    attempts = index.lookup("SuiteTests/testOne()")
+    assert [attempt.test.testStatus for attempt in attempts] == ["Failure", "Success"]
+    assert [group.name for group in attempts[1].groups] == ["Selected tests"]
+
+
+def test_lookup_issue():
+    """Test finding the tests which raised issues."""
+    index = IdentifierIndex.from_summaries([_summaries()])
+
+    def issue(test_case_name: str) -> xcresult.TestFailureIssueSummary:
+        return deserialize(
+            {
+                "_type": {"_name": "TestFailureIssueSummary"},
+                "issueType": value("Uncategorized"),
+                "message": value("Failed"),
+                "testCaseName": value(test_case_name),
+            }
+        )
+
+    [found] = index.lookup_issue(issue("SuiteTests.testTwo()"))
+    assert found.test.identifier == "SuiteTests/testTwo()"
+    assert len(index.lookup_issue(issue("SuiteTests.testOne()"))) == 2
+    assert index.lookup_issue(issue("-[SuiteTests testTwo]")) == []
+    assert index.lookup_issue(issue("SuiteTests.missing()")) == []
+
+
+def test_from_summaries_without_tests():
+    """Test summaries which have no run summaries, or no testable summaries."""
+    summaries = [
+        deserialize({"_type": {"_name": "ActionTestPlanRunSummaries"}}),
+        deserialize(
+            {
+                "_type": {"_name": "ActionTestPlanRunSummaries"},
+                "summaries": array([{"_type": {"_name": "ActionTestPlanRunSummary"}}]),
+            }
+        ),
+    ]
+    index = IdentifierIndex.from_summaries(summaries)
+
+    assert not index.by_identifier
+    assert not index.by_identifier_url
+
+
+@requires_zstd
+def test_identifier_index_from_bundle():
+    """Test indexing a bundle, and that the index is only built once."""
+    bundle = xcresult.Xcresults(TEST_FAILURE_PATH, native=True)
+    index = bundle.identifier_index()
+
+    [found] = index.lookup("WMFSubstringUtilsTests/testStopsAtLength")
+    assert found.test.testStatus == "Failure"
+    assert found.testable.name == "WikipediaUnitTests"
+    assert found.groups[-1].name == "WMFSubstringUtilsTests"
+    assert sum(len(tests) for tests in index.by_identifier.values()) == len(bundle.results_table())
+    assert bundle.identifier_index() is index
+
+    # Objective-C issues name the test as -[Class selector]
+    [issue] = bundle.actions_invocation_record.actions[0].actionResult.issues.testFailureSummaries
+    assert issue.testCaseName == "-[WMFSubstringUtilsTests testStopsAtLength]"
+    assert index.lookup_issue(issue) == [found]
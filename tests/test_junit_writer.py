@@ -4,6 +4,7 @@ import os
 import sys
 import tempfile
 from typing import cast
+from unittest import mock
 from lxml import etree as ET
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
@@ -833,3 +834,38 @@ def test_generate_test_suite_handles_missing_tests() -> None:
         root = ET.Element("testsuites")
         assert writer.generate_test_suite(root, summary, "Test Configuration") == (0, 0, 0)
         assert not root.findall("testsuite")
+
+
+def test_generate_test_suite_prefetches_failure_summaries() -> None:
+    """The summaries of every failing test are requested in a single batch."""
+    test_data_path = os.path.join(os.path.dirname(__file__), "data", "TestSuccess.xcresult")
+
+    summary = _retry_summary()
+    group = cast(xcresult.ActionTestSummaryGroup, summary.tests[0])
+    for index, subtest in enumerate(group.subtests):
+        leaf = cast(xcresult.ActionTestMetadata, subtest)
+        leaf.summaryRef = xcresult.Reference()
+        leaf.summaryRef.id = f"summary-{index}"
+
+    failure_summary = xcresult.ActionTestSummary()
+    failure_summary.failureSummaries = []
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        bundle = xcresult.Xcresults(test_data_path)
+        batches: list[list[str]] = []
+
+        def get_many(identifiers: list[str]) -> list[dict[str, object]]:
+            batches.append(identifiers)
+            return [{} for _ in identifiers]
+
+        bundle.get_many = get_many  # type: ignore[method-assign]
+        writer = JunitWriter(bundle, os.path.join(temp_dir, "junit.xml"))
+
+        with mock.patch("xcresult.xcresult_base.deserialize", return_value=failure_summary):
+            total_tests, total_failures, _ = writer.generate_test_suite(
+                ET.Element("testsuites"), summary, "Test Configuration"
+            )
+
+    assert total_tests == 6
+    assert total_failures == 3
+    assert batches == [["summary-0", "summary-3", "summary-4"]]
@@ -2,11 +2,17 @@
 
 import os
 import sys
+import typing
+from unittest import mock
+import urllib.parse
+
+import pytest
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 # pylint: disable=wrong-import-position
 import xcresult
 from xcresult.model import flatten, xchash, XcresultObject
+from xcresult.xcresulttool import deserialize
 
 # pylint: enable=wrong-import-position
 
@@ -133,6 +139,68 @@ def test_action_platform_record_hash():
     assert isinstance(result, int)
 
 
+def test_hash_follows_changes():
+    """Test that the hash of a mutable model tracks changes to it."""
+    record = xcresult.ActionPlatformRecord()
+    record.identifier = "test-id"
+    record.userDescription = "test-desc"
+    hash(record)
+
+    record.identifier = "changed"
+    same = xcresult.ActionPlatformRecord()
+    same.identifier = "changed"
+    same.userDescription = "test-desc"
+
+    assert record == same
+    assert hash(record) == hash(same)
+    assert hash(record) == hash((xchash("changed"), xchash("test-desc")))
+
+
+def test_nested_hash_follows_changes():
+    """Test that the hash of a parent tracks changes to its children."""
+    data = {
+        "_type": {"_name": "ActionTestSummaryGroup"},
+        "name": {"_type": {"_name": "String"}, "_value": "group"},
+        "subtests": {
+            "_type": {"_name": "Array"},
+            "_values": [{"_type": {"_name": "ActionTestMetadata"}}],
+        },
+    }
+    group = deserialize(data)
+    before = hash(group)
+
+    group.subtests[0].name = "changed"
+    assert hash(group) != before
+
+    same = deserialize(data)
+    same.subtests[0].name = "changed"
+    assert hash(group) == hash(same)
+
+
+def test_eq_identity():
+    """Test that an object equals itself without comparing members."""
+    record = xcresult.ActionPlatformRecord()
+
+    with mock.patch.object(
+        xcresult.ActionPlatformRecord, "_members", side_effect=AssertionError("compared")
+    ):
+        assert record == record  # pylint: disable=comparison-with-itself
+
+
+def test_members_include_inherited_properties():
+    """Test that _members lists inherited properties after the class' own."""
+    test = deserialize(
+        {
+            "_type": {"_name": "ActionTestMetadata"},
+            "testStatus": {"_type": {"_name": "String"}, "_value": "Success"},
+            "name": {"_type": {"_name": "String"}, "_value": "test()"},
+        }
+    )
+
+    members = test._members()
+    assert members.index("Success") < members.index("test()")
+
+
 def test_action_sdk_record_members():
     """Test ActionSDKRecord."""
     record = xcresult.ActionSDKRecord()
@@ -417,3 +485,103 @@ def test_activity_log_section():
     section.title = "Test Section"
 
     assert section.title == "Test Section"
+
+
+def _group(
+    identifier: str, subtests: list[xcresult.ActionTestSummaryIdentifiableObject]
+) -> xcresult.ActionTestSummaryGroup:
+    group = xcresult.ActionTestSummaryGroup()
+    group.identifier = identifier
+    group.subtests = subtests
+    return group
+
+
+def _metadata(identifier: str) -> xcresult.ActionTestMetadata:
+    test = xcresult.ActionTestMetadata()
+    test.identifier = identifier
+    return test
+
+
+def test_iter_subtests():
+    """Test that iter_subtests yields the leaves depth first."""
+    group = _group(
+        "root",
+        [
+            _metadata("a"),
+            _group("inner", [_metadata("b"), _group("empty", []), _metadata("c")]),
+            _metadata("d"),
+        ],
+    )
+
+    assert [test.identifier for test in group.iter_subtests()] == ["a", "b", "c", "d"]
+    assert list(group.iter_subtests()) == group.all_subtests()
+
+    testable = xcresult.ActionTestableSummary()
+    testable.tests = [group, _metadata("e")]
+    assert [test.identifier for test in testable.iter_tests()] == ["a", "b", "c", "d", "e"]
+    assert list(testable.iter_tests()) == testable.all_tests()
+
+
+def test_iter_subtests_deeply_nested():
+    """Test that deeply nested groups don't hit the recursion limit."""
+    group = _group("leaf group", [_metadata("leaf")])
+    for index in range(sys.getrecursionlimit() * 2):
+        group = _group(str(index), [group])
+
+    assert [test.identifier for test in group.iter_subtests()] == ["leaf"]
+
+
+def test_document_location_parsed_once():
+    """Test that the url of a DocumentLocation is only parsed once."""
+    location = xcresult.DocumentLocation()
+    location.url = "file:///a.swift#EndingLineNumber=4&StartingColumnNumber=2&StartingLineNumber=3"
+
+    with mock.patch("urllib.parse.parse_qs", wraps=urllib.parse.parse_qs) as mock_parse_qs:
+        assert location.path == "/a.swift"
+        assert location.starting_line_number == 4
+        assert location.starting_column_number == 3
+        assert location.ending_line_number == 5
+        assert location.ending_column_number is None
+        assert mock_parse_qs.call_count == 1
+
+        # Changing the url parses the new one
+        location.url = "file:///b.swift#StartingLineNumber=9"
+        assert location.path == "/b.swift"
+        assert location.starting_line_number == 10
+        assert location.ending_line_number is None
+        assert mock_parse_qs.call_count == 2
+
+
+def test_document_location_without_location():
+    """Test a DocumentLocation whose url has no location."""
+    location = xcresult.DocumentLocation()
+    location.url = "file:///a.swift"
+
+    assert location.path == "/a.swift"
+
+    with pytest.raises(IndexError):
+        _ = location.starting_line_number
+
+    with pytest.raises(IndexError):
+        _ = location.location_details
+
+
+def test_fields_match_annotations():
+    """Test that every model's FIELDS lists exactly its annotated properties."""
+    for model_class in xcresult.model.MODELS.values():
+        hints = {
+            name: hint
+            for name, hint in typing.get_type_hints(model_class).items()
+            if not name.startswith("_") and name != "FIELDS"
+        }
+        fields = {name: (kind, default) for name, kind, default in model_class.FIELDS}
+
+        assert set(fields) == set(hints), model_class.__name__
+
+        for name, (kind, default) in fields.items():
+            if kind in (xcresult.model.FIELD_LIST, xcresult.model.FIELD_OPTIONAL):
+                assert default is None
+            elif kind == xcresult.model.FIELD_OBJECT:
+                assert default is xcresult.model.REQUIRED
+            elif default is not xcresult.model.REQUIRED:
+                assert isinstance(default, hints[name])
@@ -0,0 +1,142 @@
+"""Test the native bundle reader."""
+
+import os
+import sys
+import tempfile
+from unittest import mock
+
+import pytest
+from lxml import etree as ET
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+# pylint: disable=wrong-import-position
+import xcresult
+from xcresult import native
+from xcresult.exceptions import XcresultException
+from xcresult.xcresulttool import deserialize
+from .helpers import TEST_FAILURE_PATH, TEST_SUCCESS_PATH, requires_zstd
+
+# pylint: enable=wrong-import-position
+
+
+def test_decode_object():
+    """Test decoding an object with primitive properties."""
+    data = (
+        b"[T[K2:_nV20:ActionPlatformRecord]"
+        b"K10:identifier[T[K2:_nV6:String]K2:_vV3:ios]"
+        b"K15:userDescription[S6:StringK2:_vV3:iOS]]"
+    )
+
+    assert native.decode(data) == {
+        "_type": {"_name": "ActionPlatformRecord"},
+        "identifier": {"_type": {"_name": "String"}, "_value": "ios"},
+        "userDescription": {"_type": {"_name": "String"}, "_value": "iOS"},
+    }
+
+
+def test_decode_array_and_supertype():
+    """Test decoding arrays, and types referred back to by name."""
+    data = (
+        b"[T[K2:_nV5:Array]"
+        b"[T[K2:_nV18:ActionTestMetadataK2:_s[K2:_nV35:ActionTestSummaryIdentifiableObject]]]"
+        b"[S18:ActionTestMetadata]]"
+    )
+
+    metadata_type = {
+        "_name": "ActionTestMetadata",
+        "_supertype": {"_name": "ActionTestSummaryIdentifiableObject"},
+    }
+
+    assert native.decode(data) == {
+        "_type": {"_name": "Array"},
+        "_values": [{"_type": metadata_type}, {"_type": metadata_type}],
+    }
+
+
+def test_decode_data_is_base64():
+    """Test that Data values are base64 encoded, like the JSON output."""
+    assert native.decode(b"[T[K2:_nV4:Data]K2:_vV3:\x00\x01\x02]") == {
+        "_type": {"_name": "Data"},
+        "_value": "AAEC",
+    }
+
+
+def test_decode_multibyte_strings():
+    """Test that string lengths are counted in bytes."""
+    value = "café ✓"
+    encoded = value.encode("utf-8")
+    data = b"[T[K2:_nV6:String]K2:_vV" + str(len(encoded)).encode() + b":" + encoded + b"]"
+    assert deserialize(native.decode(data)) == value
+
+
+def test_decode_malformed():
+    """Test that malformed data raises."""
+    for data in [b"", b"[K2:_nX]", b"[T[K2:_nV6:String]]extra", b"[T[K2:_nV6:String]K2:_v"]:
+        with pytest.raises(XcresultException):
+            native.decode(data)
+
+
+def test_unsupported_storage():
+    """Test that bundles which aren't fileBacked2 are rejected."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        with pytest.raises(XcresultException):
+            native.get(temp_dir)
+
+
+def test_invalid_identifier():
+    """Test that ids can't be used to escape the bundle."""
+    with pytest.raises(XcresultException):
+        native.get(TEST_SUCCESS_PATH, "../../Info.plist")
+
+
+def test_missing_object():
+    """Test that a missing object raises."""
+    with pytest.raises(XcresultException):
+        native.get(TEST_SUCCESS_PATH, "0~missing")
+
+
+def test_list_ids():
+    """Test listing the objects in a bundle."""
+    identifiers = native.list_ids(TEST_SUCCESS_PATH)
+    assert native.root_id(TEST_SUCCESS_PATH) in identifiers
+    assert identifiers == sorted(identifiers)
+
+
+@requires_zstd
+def test_get_root():
+    """Test reading the root object of a bundle."""
+    record = deserialize(native.get(TEST_SUCCESS_PATH))
+    assert isinstance(record, xcresult.ActionsInvocationRecord)
+    assert record.actions
+
+
+@requires_zstd
+def test_export():
+    """Test exporting an object to a file."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        output_path = os.path.join(temp_dir, "root")
+        native.export(TEST_SUCCESS_PATH, native.root_id(TEST_SUCCESS_PATH), "file", output_path)
+
+        with open(output_path, "rb") as output_file:
+            assert output_file.read() == native.read(
+                TEST_SUCCESS_PATH, native.root_id(TEST_SUCCESS_PATH)
+            )
+
+        with pytest.raises(XcresultException):
+            native.export(TEST_SUCCESS_PATH, "0~missing", "directory", output_path)
+
+
+@requires_zstd
+def test_xcresults_native_write_junit():
+    """Test writing a junit report without calling xcresulttool at all."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        output_path = os.path.join(temp_dir, "junit.xml")
+
+        with mock.patch("subprocess.run", side_effect=AssertionError("subprocess called")):
+            bundle = xcresult.Xcresults(TEST_FAILURE_PATH, native=True)
+            bundle.write_junit(output_path)
+
+        root = ET.parse(output_path).getroot()
+        assert int(root.get("tests")) > 0
+        assert int(root.get("failures")) > 0
+        assert root.xpath("//failure")
@@ -0,0 +1,97 @@
+"""Test recording and replaying xcresulttool responses."""
+
+import os
+import sys
+import tempfile
+import time
+from unittest import mock
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+# pylint: disable=wrong-import-position
+import xcresult
+from xcresult import recording, xcresulttool
+from xcresult.backends import NativeBackend, RecordedBackend
+from xcresult.exceptions import XcresultException
+from .helpers import TEST_FAILURE_PATH, requires_zstd
+
+# pylint: enable=wrong-import-position
+
+STRING = {"_type": {"_name": "String"}, "_value": "test"}
+
+
+def test_save_and_load():
+    """Test that a saved recording loads back the same."""
+    original = RecordedBackend("root", {"root": STRING}, {"file": b"\x00\x01"})
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        recording_path = os.path.join(temp_dir, "recording.json.gz")
+        original.save(recording_path)
+        loaded = RecordedBackend.load(recording_path)
+
+    assert loaded.root_id == original.root_id
+    assert loaded.objects == original.objects
+    assert loaded.files == original.files
+
+
+def test_replay_get_and_export():
+    """Test that xcresulttool calls are served from the recording while replaying."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        recording_path = os.path.join(temp_dir, "recording.json.gz")
+        RecordedBackend("root", {"root": STRING, "other": STRING}, {"file": b"data"}).save(
+            recording_path
+        )
+
+        with mock.patch("subprocess.run", side_effect=AssertionError("subprocess called")):
+            with recording.replay(recording_path):
+                assert xcresulttool.get("ignored") == STRING
+                assert xcresulttool.get("ignored", "other") == STRING
+
+                output_path = os.path.join(temp_dir, "output", "file")
+                xcresulttool.export_attachment("ignored", "file", "file", output_path)
+                with open(output_path, "rb") as output_file:
+                    assert output_file.read() == b"data"
+
+                with pytest.raises(XcresultException):
+                    xcresulttool.get("ignored", "missing")
+
+        # The default runner is restored afterwards
+        with mock.patch("xcresult.xcresulttool.subprocess.run") as mock_run:
+            mock_run.return_value = mock.Mock(stdout='{"_type": {"_name": "Int"}, "_value": "1"}')
+            assert xcresulttool.get("ignored")["_value"] == "1"
+
+
+def test_replay_latency():
+    """Test that replayed calls are delayed by the latency."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        recording_path = os.path.join(temp_dir, "recording.json.gz")
+        RecordedBackend("root", {"root": STRING}).save(recording_path)
+
+        with recording.replay(recording_path, latency=0.05):
+            start = time.monotonic()
+            xcresulttool.get("ignored")
+            xcresulttool.get("ignored")
+            assert time.monotonic() - start >= 0.1
+
+
+@requires_zstd
+def test_record_and_replay_junit():
+    """Test that replaying a recording gives the same junit as reading the bundle."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        recording_path = os.path.join(temp_dir, "recording.json.gz")
+        recorded = recording.record(TEST_FAILURE_PATH, recording_path, NativeBackend())
+
+        assert recorded.root_id in recorded.objects
+        assert len(recorded.objects) > 1
+
+        expected_path = os.path.join(temp_dir, "expected.xml")
+        xcresult.Xcresults(TEST_FAILURE_PATH, native=True).write_junit(expected_path)
+
+        replayed_path = os.path.join(temp_dir, "replayed.xml")
+        with mock.patch("subprocess.run", side_effect=AssertionError("subprocess called")):
+            with recording.replay(recording_path):
+                xcresult.Xcresults(TEST_FAILURE_PATH).write_junit(replayed_path)
+
+        with open(expected_path, "rb") as expected, open(replayed_path, "rb") as replayed:
+            assert replayed.read() == expected.read()
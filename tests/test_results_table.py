@@ -0,0 +1,175 @@
+"""Test the column oriented table of test results."""
+
+import math
+import os
+import sys
+from typing import Any
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+# pylint: disable=wrong-import-position
+import xcresult
+from xcresult.results_table import ResultsTable
+from xcresult.xcresulttool import deserialize
+from .helpers import (
+    TEST_BUILD_FAILURE_PATH,
+    TEST_FAILURE_PATH,
+    array,
+    group,
+    metadata,
+    requires_zstd,
+    value,
+)
+
+# pylint: enable=wrong-import-position
+
+
+def _testable(name: str, tests: list[dict[str, Any]]) -> dict[str, Any]:
+    return {
+        "_type": {"_name": "ActionTestableSummary"},
+        "name": value(name),
+        "tests": array([group("All tests", tests)]),
+    }
+
+
+def _summaries() -> xcresult.ActionTestPlanRunSummaries:
+    return deserialize(
+        {
+            "_type": {"_name": "ActionTestPlanRunSummaries"},
+            "summaries": array(
+                [
+                    {
+                        "_type": {"_name": "ActionTestPlanRunSummary"},
+                        "name": value("Configuration 1"),
+                        "testableSummaries": array(
+                            [
+                                _testable(
+                                    "AppTests",
+                                    [
+                                        metadata("A/testOne", "Success", duration=1.0),
+                                        metadata("A/testTwo", "Failure", duration=4.0),
+                                        metadata("A/testThree", "Success", duration=2.0),
+                                    ],
+                                ),
+                                _testable(
+                                    "UITests",
+                                    [
+                                        metadata("B/testOne", "Success", duration=10.0),
+                                        metadata("B/testTwo", "Skipped"),
+                                    ],
+                                ),
+                            ]
+                        ),
+                    }
+                ]
+            ),
+        }
+    )
+
+
+def test_from_summaries():
+    """Test that every leaf becomes a row."""
+    table = ResultsTable.from_summaries([_summaries()])
+
+    assert len(table) == 5
+    assert table.identifiers == ["A/testOne", "A/testTwo", "A/testThree", "B/testOne", "B/testTwo"]
+    assert table.names[0] == "testOne"
+    assert table.statuses[1] == "Failure"
+    assert table.testables == ["AppTests", "UITests"]
+    assert list(table.testable_indices) == [0, 0, 0, 1, 1]
+    assert table.configurations == ["Configuration 1"]
+    assert list(table.configuration_indices) == [0, 0, 0, 0, 0]
+    assert list(table.durations)[:4] == [1.0, 4.0, 2.0, 10.0]
+    assert math.isnan(table.durations[4])
+
+    # Repeated strings share one object
+    assert table.statuses[0] is table.statuses[2]
+
+
+def test_from_summaries_without_tests():
+    """Test summaries which have no run summaries, or no testable summaries."""
+    summaries = [
+        deserialize({"_type": {"_name": "ActionTestPlanRunSummaries"}}),
+        deserialize(
+            {
+                "_type": {"_name": "ActionTestPlanRunSummaries"},
+                "summaries": array(
+                    [
+                        {
+                            "_type": {"_name": "ActionTestPlanRunSummary"},
+                            "name": value("Configuration 1"),
+                        }
+                    ]
+                ),
+            }
+        ),
+    ]
+    table = ResultsTable.from_summaries(summaries)
+
+    assert len(table) == 0
+    assert table.configurations == ["Configuration 1"]
+
+
+def test_where():
+    """Test filtering rows."""
+    table = ResultsTable.from_summaries([_summaries()])
+
+    assert table.where(status="Success").identifiers == ["A/testOne", "A/testThree", "B/testOne"]
+    assert table.where(testable="UITests").identifiers == ["B/testOne", "B/testTwo"]
+    assert table.where(status="Success", testable="UITests").identifiers == ["B/testOne"]
+    assert table.where(min_duration=2.0).identifiers == ["A/testTwo", "A/testThree", "B/testOne"]
+    assert table.where(configuration="Configuration 1").identifiers == table.identifiers
+    assert len(table.where(testable="Missing")) == 0
+    assert len(table.where()) == len(table)
+
+    # Filtering a filtered table keeps the lookups
+    assert table.where(testable="UITests").where(status="Skipped").identifiers == ["B/testTwo"]
+
+
+def test_aggregates():
+    """Test aggregating the columns."""
+    table = ResultsTable.from_summaries([_summaries()])
+
+    assert table.count_by_status() == {"Success": 3, "Failure": 1, "Skipped": 1}
+    assert table.total_duration() == 17.0
+    assert table.duration_percentile(0) == 1.0
+    assert table.duration_percentile(50) == 3.0
+    assert table.duration_percentile(100) == 10.0
+    assert math.isnan(table.where(status="Skipped").duration_percentile(50))
+
+    with pytest.raises(ValueError):
+        table.duration_percentile(101)
+
+    assert table.slowest(2) == [("B/testOne", 10.0), ("A/testTwo", 4.0)]
+    assert table.slowest_by_testable(1) == {
+        "AppTests": [("A/testTwo", 4.0)],
+        "UITests": [("B/testOne", 10.0)],
+    }
+
+
+@requires_zstd
+def test_results_table_from_bundle():
+    """Test building the table from a bundle, and that it is only built once."""
+    bundle = xcresult.Xcresults(TEST_FAILURE_PATH, native=True)
+    table = bundle.results_table()
+
+    expected = [
+        test
+        for summary in bundle.actions_invocation_record.actions
+        if summary.actionResult.testsRef is not None
+        for run_summary in summary.actionResult.testsRef.resolve().summaries
+        for testable_summary in run_summary.testableSummaries
+        for test in testable_summary.all_tests()
+    ]
+
+    assert table.identifiers == [test.identifier for test in expected]
+    assert table.count_by_status() == {"Success": len(expected) - 1, "Failure": 1}
+    assert bundle.results_table() is table
+
+
+@requires_zstd
+def test_results_table_from_build_failure():
+    """Test building the table from a bundle where the tests never ran."""
+    bundle = xcresult.Xcresults(TEST_BUILD_FAILURE_PATH, native=True)
+    assert len(bundle.results_table()) == 0
@@ -0,0 +1,165 @@
+"""Test streaming xcresulttool output."""
+
+import json
+import os
+import subprocess
+import sys
+from typing import Any, Callable
+from unittest import mock
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+# pylint: disable=wrong-import-position
+import xcresult
+from xcresult import streaming, xcresulttool
+from xcresult.exceptions import XcresultException
+from xcresult.streaming import iter_json_objects
+from .helpers import group, metadata, value
+
+# pylint: enable=wrong-import-position
+
+
+DOCUMENT = group("outer", [group("inner", [metadata("a"), metadata("b")]), metadata("c")])
+
+
+def _chunks(data: dict[str, Any], size: int) -> list[bytes]:
+    encoded = json.dumps(data, indent=1).encode("utf-8")
+    return [encoded[index : index + size] for index in range(0, len(encoded), size)]
+
+
+def test_whole_document():
+    """Test that asking for the root type gives back the whole document."""
+    for size in [1, 3, 1000]:
+        objects = list(iter_json_objects(_chunks(DOCUMENT, size), ["ActionTestSummaryGroup"]))
+        assert objects == [
+            group("inner", [metadata("a"), metadata("b")]),
+            group("outer", [metadata("c")]),
+        ]
+
+
+def test_nested_objects_are_detached():
+    """Test that objects are yielded innermost first and dropped from their parents."""
+    objects = list(iter_json_objects(_chunks(DOCUMENT, 5), ["ActionTestMetadata"]))
+    assert objects == [metadata("a"), metadata("b"), metadata("c")]
+
+
+def test_strings_split_across_chunks():
+    """Test escapes and multibyte characters which are split between chunks."""
+    document = {"_type": {"_name": "ActionTestMetadata"}, "name": value('café "✓" \\ \n')}
+    for size in range(1, 8):
+        assert list(iter_json_objects(_chunks(document, size), ["ActionTestMetadata"])) == [
+            document
+        ]
+
+
+def test_long_strings():
+    """Test strings running over many chunks, with escapes split between them."""
+    document = {"_type": {"_name": "ActionTestMetadata"}, "name": value('a\\"b\\\\' * 10000)}
+    chunks = _chunks(document, 7)
+
+    token_pattern = streaming._TOKEN  # pylint: disable=protected-access
+    with mock.patch("xcresult.streaming._TOKEN", wraps=token_pattern) as token:
+        assert list(iter_json_objects(chunks, ["ActionTestMetadata"])) == [document]
+
+    # The string isn't matched again from its start as each chunk arrives
+    assert token.match.call_count < len(chunks) // 100
+
+
+def test_literals():
+    """Test numbers and other literals, including ones split across chunks."""
+    document = {"_type": {"_name": "Test"}, "values": [12345, -1.5e3, True, False, None]}
+    for size in range(1, 8):
+        assert list(iter_json_objects(_chunks(document, size), ["Test"])) == [document]
+
+
+def test_invalid_documents():
+    """Test that malformed documents raise."""
+    for document in [b"", b"{", b'{"a": 1}}', b"[}", b"{1: 2}", b'{"a": nope}', b"{} {}"]:
+        with pytest.raises(XcresultException):
+            list(iter_json_objects([document], ["Test"]))
+
+
+def test_stream_with_runner():
+    """Test streaming from a replacement runner."""
+
+    def run(_arguments: list[str]) -> str:
+        return json.dumps(DOCUMENT)
+
+    previous = xcresulttool.set_runner(run)
+
+    try:
+        names = [test.name for test in xcresulttool.stream("ignored", ["ActionTestMetadata"])]
+    finally:
+        xcresulttool.set_runner(previous)
+
+    assert names == ["a", "b", "c"]
+
+
+def _fake_popen(
+    output: str, return_code: int = 0, processes: list[subprocess.Popen[Any]] | None = None
+) -> Callable[..., subprocess.Popen[Any]]:
+    real_popen = subprocess.Popen
+    script = f"import sys; sys.stdout.write({output!r}); sys.exit({return_code})"
+
+    def popen(command: list[str], **kwargs: Any) -> subprocess.Popen[Any]:
+        assert command[:3] == ["xcrun", "xcresulttool", "get"]
+        # The caller closes the process
+        process = real_popen(  # pylint: disable=consider-using-with
+            [sys.executable, "-c", script], **kwargs
+        )
+        if processes is not None:
+            processes.append(process)
+        return process
+
+    return popen
+
+
+def test_stream_from_process():
+    """Test streaming the output of a process as it is read."""
+    with mock.patch(
+        "xcresult.xcresulttool.subprocess.Popen", side_effect=_fake_popen(json.dumps(DOCUMENT))
+    ):
+        tests = list(xcresulttool.stream("ignored", ["ActionTestMetadata"], chunk_size=16))
+
+    assert all(isinstance(test, xcresult.ActionTestMetadata) for test in tests)
+    assert [test.name for test in tests] == ["a", "b", "c"]
+
+
+def test_stream_from_failing_process():
+    """Test that a failing process raises once its output has been read."""
+    with mock.patch(
+        "xcresult.xcresulttool.subprocess.Popen", side_effect=_fake_popen("{}", return_code=1)
+    ):
+        with pytest.raises(subprocess.CalledProcessError):
+            list(xcresulttool.stream("ignored", ["ActionTestMetadata"]))
+
+
+def test_stream_process_kept_until_exit():
+    """Test that a process which is read to the end is waited for rather than killed."""
+    processes: list[subprocess.Popen[Any]] = []
+
+    with mock.patch(
+        "xcresult.xcresulttool.subprocess.Popen",
+        side_effect=_fake_popen(json.dumps(DOCUMENT), processes=processes),
+    ), mock.patch.object(subprocess.Popen, "kill") as kill:
+        assert len(list(xcresulttool.stream("ignored", ["ActionTestMetadata"]))) == 3
+
+    kill.assert_not_called()
+    assert processes[0].returncode == 0
+
+
+def test_stream_stopped_early():
+    """Test that a process is killed if the caller stops reading early."""
+    processes: list[subprocess.Popen[Any]] = []
+
+    with mock.patch(
+        "xcresult.xcresulttool.subprocess.Popen",
+        side_effect=_fake_popen(json.dumps(DOCUMENT) + " " * 100000, processes=processes),
+    ):
+        tests = xcresulttool.stream("ignored", ["ActionTestMetadata"], chunk_size=16)
+        assert next(tests).name == "a"
+        tests.close()
+
+    assert processes[0].returncode is not None
+    assert processes[0].returncode < 0
@@ -94,3 +94,86 @@ def test_actions_invocation_record_cached():
     """Test that _actions_invocation_record is initialized to None."""
     xcresults = MockXcresults("/test/path")
     assert xcresults._actions_invocation_record is None
+
+
+class CountingXcresults(MockXcresults):
+    """Mock implementation which counts how often each object is fetched."""
+
+    def __init__(self, path: str, max_cached_objects: int | None = None):
+        super().__init__(path)
+        self.object_cache.max_objects = max_cached_objects
+        self.calls: list[str] = []
+
+    def get(self, identifier: str):
+        """Return a string object named after the identifier."""
+        self.calls.append(identifier)
+        return {"_type": {"_name": "String"}, "_value": f"value-{identifier}"}
+
+
+def test_get_object_is_memoized():
+    """Test that get_object only fetches each object once."""
+    xcresults = CountingXcresults("/test/path")
+
+    assert xcresults.get_object("a") == "value-a"
+    assert xcresults.get_object("a") == "value-a"
+    assert xcresults.get_object("b") == "value-b"
+
+    assert xcresults.calls == ["a", "b"]
+    assert xcresults.object_cache.hits == 1
+    assert xcresults.object_cache.misses == 2
+
+
+def test_get_object_respects_max_cached_objects():
+    """Test that the least recently used objects are dropped."""
+    xcresults = CountingXcresults("/test/path", max_cached_objects=2)
+
+    xcresults.get_object("a")
+    xcresults.get_object("b")
+    xcresults.get_object("a")
+    xcresults.get_object("c")
+    xcresults.get_object("a")
+    xcresults.get_object("b")
+
+    assert xcresults.calls == ["a", "b", "c", "b"]
+    assert len(xcresults.object_cache) == 2
+
+
+def test_get_objects_fetches_missing_together():
+    """Test that get_objects only fetches the objects it hasn't seen, in one batch."""
+
+    class BatchingXcresults(CountingXcresults):
+        """Mock implementation which records batches."""
+
+        def __init__(self, path: str):
+            super().__init__(path)
+            self.batches: list[list[str]] = []
+
+        def get_many(self, identifiers: list[str]):
+            """Record the batch."""
+            self.batches.append(identifiers)
+            return super().get_many(identifiers)
+
+    xcresults = BatchingXcresults("/test/path")
+    xcresults.get_object("a")
+
+    assert xcresults.get_objects(["a", "b", "c", "b"]) == [
+        "value-a",
+        "value-b",
+        "value-c",
+        "value-b",
+    ]
+    assert xcresults.batches == [["b", "c"]]
+    assert xcresults.calls == ["a", "b", "c"]
+
+
+def test_get_objects_without_memoizing():
+    """Test that get_objects can reuse memoized objects without keeping new ones."""
+    xcresults = CountingXcresults("/test/path")
+    xcresults.get_object("a")
+
+    assert xcresults.get_objects(["a", "b"], memoize=False) == ["value-a", "value-b"]
+    assert xcresults.get_objects(["b"], memoize=False) == ["value-b"]
+
+    assert xcresults.calls == ["a", "b", "b"]
+    assert "a" in xcresults.object_cache
+    assert "b" not in xcresults.object_cache
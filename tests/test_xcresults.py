@@ -1,13 +1,21 @@
 """Test Xcresults class."""
 
+import copy
 import os
+import pickle
 import sys
 import tempfile
+from unittest import mock
+
+import pytest
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 # pylint: disable=wrong-import-position
 import xcresult
+from xcresult.backends import RecordedBackend
 from xcresult.exceptions import MissingPropertyException
+from xcresult.xcresulttool import deserialize
+from .helpers import metadata
 
 # pylint: enable=wrong-import-position
 
@@ -184,3 +192,51 @@ def test_write_junit_with_prefix_suffix():
             output_path, test_class_prefix="prefix", test_class_suffix="suffix"
         )
         assert os.path.exists(output_path)
+
+
+def test_reference_resolve():
+    """Test that references load their target lazily, and only once."""
+    backend = RecordedBackend(
+        "root",
+        {"test": metadata("test", summary_id="summary"), "summary": metadata("summary")},
+    )
+    bundle = xcresult.Xcresults("/path/to/bundle", backend=backend)
+
+    test = bundle.get_object("test")
+
+    with mock.patch.object(backend, "get", wraps=backend.get) as mock_get:
+        summary = test.summaryRef.resolve()
+        assert summary.name == "summary"
+        assert test.summaryRef.resolve() is summary
+        mock_get.assert_called_once_with("/path/to/bundle", "summary")
+
+
+def test_reference_resolve_without_bundle():
+    """Test resolving a reference which wasn't read from a bundle."""
+    test = deserialize(metadata("test", summary_id="summary"))
+
+    with pytest.raises(ValueError):
+        test.summaryRef.resolve()
+
+    results = mock.Mock()
+    assert test.summaryRef.resolve(results) is results.get_object.return_value
+    results.get_object.assert_called_once_with("summary")
+
+
+def test_reference_pickle_and_copy():
+    """Test that references are pickled and copied without their bundle."""
+    backend = RecordedBackend(
+        "root",
+        {"test": metadata("test", summary_id="summary"), "summary": metadata("summary")},
+    )
+    bundle = xcresult.Xcresults("/path/to/bundle", backend=backend)
+    test = bundle.get_object("test")
+
+    for copied in (pickle.loads(pickle.dumps(test)), copy.deepcopy(test)):
+        assert copied == test
+        assert copied.summaryRef.id == "summary"
+
+        with pytest.raises(ValueError):
+            copied.summaryRef.resolve()
+
+    assert test.summaryRef.resolve().name == "summary"
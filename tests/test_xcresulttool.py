@@ -1,16 +1,24 @@
 """Test xcresulttool functionality."""
 
+import copy
 import datetime
 import os
 import sys
 import tempfile
+import time
+from typing import Any
+from unittest import mock
+
+import pytest
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 # pylint: disable=wrong-import-position
 import xcresult
+from xcresult import xcresulttool
 from xcresult.xcresulttool import (
     deserialize,
     get,
+    get_many,
     get_actions_invocation_record,
     get_test_plan_run_summaries,
     get_action_test_summary,
@@ -66,6 +74,46 @@ def test_deserialize_date():
     )
 
 
+def test_deserialize_date_fixed_format():
+    """Test that dates in the usual fixed format match strptime."""
+    values = [
+        "2024-01-02T03:04:05.678+0000",
+        "2024-12-31T23:59:59.999+0530",
+        "1999-06-15T12:00:00.001-0800",
+    ]
+
+    for value in values:
+        expected = datetime.datetime.strptime(value, "%Y-%m-%dT%H:%M:%S.%f%z")
+        for parse in [xcresulttool._parse_date, xcresulttool._parse_date_fields]:
+            result = parse(value)
+            assert result == expected
+            assert result.utcoffset() == expected.utcoffset()
+
+
+def test_deserialize_date_invalid():
+    """Test that invalid dates raise just like strptime."""
+    for value in [
+        "2024-13-01T00:00:00.000+0000",
+        "2024x01-01T00:00:00.000+0000",
+        "2024-01-01T00:00:00.000+000a",
+        "2024-01-01T00:00:00.0_0+0000",
+        "2024-01-02T03:04:05.67870100",
+        "2024-01-02T03:04:05.678+01.0",
+        "2024-01-02T03:04:05.678+0180",
+        "2024-01-02T03:04:05.678-0060",
+        "not a date",
+    ]:
+        with pytest.raises(ValueError):
+            deserialize({"_type": {"_name": "Date"}, "_value": value})
+
+        with pytest.raises(ValueError):
+            xcresulttool._parse_date_fields(value)
+
+    for offset in ["+0060", "-0099", "+01", "0100", "+01.0"]:
+        with pytest.raises(ValueError):
+            xcresulttool._timezone(offset)
+
+
 def test_deserialize_array():
     """Test deserializing an array."""
     data = {
@@ -115,6 +163,107 @@ def test_deserialize_with_unsupported_property():
     assert result.identifier == "test"
 
 
+def test_deserialize_with_nested_unsupported_property():
+    """Test that an unsupported type nested in an array only drops that property."""
+    data = {
+        "_type": {"_name": "ActionPlatformRecord"},
+        "identifier": {"_type": {"_name": "String"}, "_value": "test"},
+        "unsupportedArray": {
+            "_type": {"_name": "Array"},
+            "_values": [{"_type": {"_name": "UnsupportedType"}}],
+        },
+    }
+    result = deserialize(data)
+    assert result.identifier == "test"
+    assert result.userDescription == ""
+    assert not hasattr(result, "unsupportedArray")
+
+
+def test_deserialize_leaves_data_untouched():
+    """Test that the same data can be deserialized repeatedly."""
+    data = {
+        "_type": {"_name": "ActionTestSummaryGroup"},
+        "name": {"_type": {"_name": "String"}, "_value": "group"},
+        "subtests": {
+            "_type": {"_name": "Array"},
+            "_values": [
+                {
+                    "_type": {"_name": "ActionTestMetadata"},
+                    "name": {"_type": {"_name": "String"}, "_value": "test"},
+                }
+            ],
+        },
+    }
+    original = copy.deepcopy(data)
+
+    first = deserialize(data)
+    second = deserialize(data)
+
+    assert data == original
+    assert first == second
+    assert first is not second
+    assert [test.name for test in second.subtests] == ["test"]
+
+
+def test_deserialize_skips_undeclared_properties():
+    """Test that properties a model doesn't declare are skipped."""
+    result = deserialize(
+        {
+            "_type": {"_name": "ActionPlatformRecord"},
+            "identifier": {"_type": {"_name": "String"}, "_value": "test"},
+            "extra": {"_type": {"_name": "String"}, "_value": "extra"},
+        }
+    )
+    assert result.identifier == "test"
+    assert not hasattr(result, "extra")
+    assert not hasattr(result, "__dict__")
+
+
+def test_deserialize_deeply_nested():
+    """Test that nesting deeper than the recursion limit can be deserialized."""
+    depth = sys.getrecursionlimit() * 2
+    data = {
+        "_type": {"_name": "ActionTestActivitySummary"},
+        "title": {"_type": {"_name": "String"}, "_value": "leaf"},
+    }
+
+    for index in range(depth):
+        data = {
+            "_type": {"_name": "ActionTestActivitySummary"},
+            "title": {"_type": {"_name": "String"}, "_value": str(index)},
+            "subactivities": {"_type": {"_name": "Array"}, "_values": [data]},
+        }
+
+    activity = deserialize(data)
+    count = 0
+
+    while activity.subactivities:
+        assert activity.title == str(depth - 1 - count)
+        activity = activity.subactivities[0]
+        count += 1
+
+    assert count == depth
+    assert activity.title == "leaf"
+
+
+def test_deserialize_objects_of_the_same_class():
+    """Test that objects of the same class don't share any state."""
+    first = deserialize(
+        {
+            "_type": {"_name": "ActionPlatformRecord"},
+            "identifier": {"_type": {"_name": "String"}, "_value": "first"},
+        }
+    )
+    second = deserialize(
+        {
+            "_type": {"_name": "ActionPlatformRecord"},
+            "userDescription": {"_type": {"_name": "String"}, "_value": "second"},
+        }
+    )
+    assert (first.identifier, first.userDescription) == ("first", "")
+    assert (second.identifier, second.userDescription) == ("", "second")
+
+
 def test_get_actions_invocation_record():
     """Test getting the actions invocation record."""
     test_data_path = os.path.join(
@@ -318,3 +467,66 @@ def test_export_action_test_summary_group_with_subtests():
                                     test_data_path, test, temp_dir
                                 )
                                 break
+
+
+def test_get_many_keeps_order():
+    """Test that get_many returns results in order and fetches each id once."""
+    calls: list[str] = []
+
+    def fake_get(_path: str, identifier: str) -> dict[str, Any]:
+        calls.append(identifier)
+        # Finish the earlier ids last to make sure ordering doesn't depend on timing
+        time.sleep(0.01 * (5 - int(identifier)))
+        return {"_type": {"_name": "String"}, "_value": identifier}
+
+    identifiers = ["1", "2", "3", "1", "4"]
+
+    with mock.patch("xcresult.xcresulttool.get", side_effect=fake_get):
+        results = get_many("/fake/path", identifiers, max_workers=4)
+
+    assert [result["_value"] for result in results] == identifiers
+    assert sorted(calls) == ["1", "2", "3", "4"]
+
+
+def test_get_many_single_worker():
+    """Test that get_many works without a thread pool."""
+
+    def fake_get(_path: str, identifier: str) -> dict[str, Any]:
+        return {"_value": identifier}
+
+    with mock.patch("xcresult.xcresulttool.get", side_effect=fake_get):
+        results = get_many("/fake/path", ["a", "b"], max_workers=1)
+
+    assert results == [{"_value": "a"}, {"_value": "b"}]
+
+
+def test_export_action_test_summary_group_prefetches_summaries():
+    """Test that the summaries of every test in a group are loaded in one batch."""
+    group = xcresult.ActionTestSummaryGroup()
+    group.identifier = "group"
+    group.identifierURL = "test://com.apple.xcode/group"
+    group.subtests = []
+
+    for index in range(3):
+        test = xcresult.ActionTestMetadata()
+        test.identifier = f"test{index}"
+        test.identifierURL = f"test://com.apple.xcode/group/test{index}"
+        test.testStatus = "Success"
+        test.summaryRef = xcresult.Reference()
+        test.summaryRef.id = f"summary-{index}"
+        group.subtests.append(test)
+
+    summary = xcresult.ActionTestSummary()
+    summary.activitySummaries = None
+    summary.failureSummaries = None
+
+    batches: list[list[str]] = []
+
+    def loader(identifiers: list[str]) -> list[Any]:
+        batches.append(identifiers)
+        return [summary for _ in identifiers]
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        export_action_test_summary_group("/fake/path", group, temp_dir, loader=loader)
+
+    assert batches == [["summary-0", "summary-1", "summary-2"]]
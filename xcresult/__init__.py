@@ -4,12 +4,28 @@
 # pylint: disable=unused-import
 # pyright: reportUnusedImport=false
 from xcresult import xcresulttool
+from xcresult.attachment_export import (
+    AttachmentExporter,
+    AttachmentFilter,
+    ExportManifest,
+    ExportProgress,
+)
+from xcresult.backends import (
+    CachingBackend,
+    NativeBackend,
+    RecordedBackend,
+    SubprocessBackend,
+    XcresultBackend,
+)
+from xcresult.cache import DiskCache, ObjectCache
 from xcresult.exceptions import (
     MissingPropertyException,
     UnsupportedTypeException,
     XcresultException,
 )
+from xcresult.identifier_index import IdentifierIndex, IndexedTest
 from xcresult.model import *
+from xcresult.results_table import ResultsTable
 from xcresult.xcresults import Xcresults
 
 # pylint: enable=unused-import
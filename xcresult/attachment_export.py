@@ -0,0 +1,594 @@
+"""Export the attachments of tests with a pipeline of worker threads."""
+
+import concurrent.futures
+import contextlib
+import fnmatch
+import functools
+import itertools
+import json
+import logging
+import os
+import shutil
+import threading
+from typing import IO, Any, Callable, Iterable, Sequence, cast
+
+from xcresult import model
+from xcresult.xcresulttool import (
+    DEFAULT_MAX_WORKERS,
+    exportable_tests,
+    payload_key,
+    plan_test_attachments,
+)
+
+DEFAULT_BATCH_SIZE = 50
+
+
+class ExportProgress:
+    """How far an export has got."""
+
+    __slots__ = (
+        "tests_discovered",
+        "attachments_discovered",
+        "attachments_exported",
+        "payloads_exported",
+        "attachments_skipped",
+        "discovery_complete",
+    )
+
+    tests_discovered: int
+    attachments_discovered: int
+    attachments_exported: int
+    payloads_exported: int
+    attachments_skipped: int
+    discovery_complete: bool
+
+    def __init__(self) -> None:
+        self.tests_discovered = 0
+        self.attachments_discovered = 0
+        self.attachments_exported = 0
+        self.payloads_exported = 0
+        self.attachments_skipped = 0
+        self.discovery_complete = False
+
+
+ProgressCallback = Callable[[ExportProgress], None]
+
+
+class AttachmentFilter:
+    """Which attachments to export.
+
+    Every condition which is set must hold for an attachment to be exported.
+    """
+
+    statuses: frozenset[str] | None
+    type_identifiers: frozenset[str] | None
+    excluded_type_identifiers: frozenset[str]
+    name_patterns: tuple[str, ...] | None
+    max_bytes: int | None
+
+    def __init__(
+        self,
+        *,
+        statuses: Iterable[str] | None = None,
+        type_identifiers: Iterable[str] | None = None,
+        excluded_type_identifiers: Iterable[str] = (),
+        name_patterns: Sequence[str] | None = None,
+        max_bytes: int | None = None,
+    ) -> None:
+        """Create a new instance.
+
+        :param statuses: Only export the attachments of tests with one of these
+            statuses (e.g. "Failure"). The summaries of any other tests are never
+            loaded.
+        :param type_identifiers: Only export attachments with one of these
+            uniform type identifiers (e.g. "public.png")
+        :param excluded_type_identifiers: Never export attachments with one of
+            these uniform type identifiers (e.g. "public.plain-text")
+        :param name_patterns: Only export attachments whose file name or name
+            matches one of these glob patterns (e.g. "Screenshot*"). Matching is
+            case sensitive.
+        :param max_bytes: Stop exporting attachments once their total
+            ``payloadSize`` would exceed this. Attachments which don't fit are
+            skipped, in the order they are found, so the same attachments are
+            always chosen.
+        """
+        self.statuses = None if statuses is None else frozenset(statuses)
+        self.type_identifiers = None if type_identifiers is None else frozenset(type_identifiers)
+        self.excluded_type_identifiers = frozenset(excluded_type_identifiers)
+        self.name_patterns = None if name_patterns is None else tuple(name_patterns)
+        self.max_bytes = max_bytes
+
+    def includes_test(self, test: model.ActionTestMetadata) -> bool:
+        """Check whether the attachments of a test may be exported.
+
+        :param test: The test
+
+        :returns: True if the test passes the status condition, False otherwise
+        """
+        return self.statuses is None or test.testStatus in self.statuses
+
+    def includes(self, attachment: model.ActionTestAttachment) -> bool:
+        """Check whether an attachment may be exported, ignoring ``max_bytes``.
+
+        :param attachment: The attachment
+
+        :returns: True if the attachment passes the type and name conditions,
+            False otherwise
+        """
+        type_identifier = attachment.uniformTypeIdentifier
+
+        if self.type_identifiers is not None and type_identifier not in self.type_identifiers:
+            return False
+
+        if type_identifier in self.excluded_type_identifiers:
+            return False
+
+        if self.name_patterns is None:
+            return True
+
+        names = [name for name in (attachment.filename, attachment.name) if name is not None]
+        return any(
+            fnmatch.fnmatchcase(name, pattern) for name in names for pattern in self.name_patterns
+        )
+
+
+class ExportManifest:
+    """A record of the files an export has written, so that it can be resumed.
+
+    The manifest is a file of JSON lines, each holding the payload ``id``, the
+    ``path`` of a file (relative to the manifest) and its ``size``. A line is
+    appended as soon as each file is complete, so the manifest stays up to date
+    even if the export is killed part way through.
+    """
+
+    path: str
+    entries: dict[str, tuple[str, int]]
+
+    def __init__(self, path: str) -> None:
+        """Create a new instance, reading the manifest if it exists.
+
+        :param path: The path of the manifest
+        """
+        self.path = path
+        self.entries = {}
+
+        self._folder = os.path.dirname(os.path.abspath(path))
+        self._lock = threading.Lock()
+        self._file: IO[str] | None = None
+        self._needs_newline = False
+
+        try:
+            with open(path, encoding="utf-8") as manifest_file:
+                contents = manifest_file.read()
+        except FileNotFoundError:
+            return
+
+        for line in contents.splitlines():
+            try:
+                entry = json.loads(line)
+                self.entries[entry["path"]] = (entry["id"], entry["size"])
+            except (ValueError, KeyError, TypeError):
+                # The last line is cut short if an export was killed while writing it
+                continue
+
+        self._needs_newline = bool(contents) and not contents.endswith("\n")
+
+    def _key(self, file_path: str) -> str:
+        return os.path.relpath(os.path.abspath(file_path), self._folder)
+
+    def is_complete(self, identifier: str, file_path: str) -> bool:
+        """Check whether a file was written by an earlier export and is still there.
+
+        Only the size of the file is checked, so this costs one ``stat``.
+
+        :param identifier: The id of the payload the file should hold
+        :param file_path: The path of the file
+
+        :returns: True if the file was recorded with that payload and still has
+            the recorded size, False otherwise
+        """
+        entry = self.entries.get(self._key(file_path))
+        if entry is None or entry[0] != identifier:
+            return False
+
+        try:
+            return os.stat(file_path).st_size == entry[1]
+        except OSError:
+            return False
+
+    def record(self, identifier: str, file_path: str) -> None:
+        """Record that a file is complete.
+
+        :param identifier: The id of the payload the file holds
+        :param file_path: The path of the file
+        """
+        size = os.stat(file_path).st_size
+        key = self._key(file_path)
+        line = json.dumps({"id": identifier, "path": key, "size": size}, separators=(",", ":"))
+
+        with self._lock:
+            self.entries[key] = (identifier, size)
+
+            if self._file is None:
+                os.makedirs(self._folder, exist_ok=True)
+                # pylint: disable=consider-using-with
+                self._file = open(self.path, "a", encoding="utf-8")
+                # pylint: enable=consider-using-with
+                if self._needs_newline:
+                    self._file.write("\n")
+
+            self._file.write(line + "\n")
+            self._file.flush()
+
+    def close(self) -> None:
+        """Close the manifest, if anything has been recorded."""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+                self._needs_newline = False
+
+
+def _link(source: str, destination: str) -> None:
+    """Hard link a file, replacing anything already at the destination.
+
+    :param source: The path of the file to link to
+    :param destination: The path of the link
+    """
+    os.makedirs(os.path.dirname(destination), exist_ok=True)
+
+    with contextlib.suppress(FileNotFoundError):
+        os.remove(destination)
+
+    try:
+        os.link(source, destination)
+    except OSError:
+        # Not every file system supports hard links, and none across devices
+        shutil.copyfile(source, destination)
+
+
+class AttachmentExporter:
+    """Exports the attachments of tests, overlapping discovery with exporting.
+
+    The summaries of the tests are loaded in batches. As each batch arrives, the
+    path of every attachment in it is chosen and the attachment is handed to a
+    pool of worker threads to export, while the next batch is loaded. The
+    number of exports waiting for a worker is bounded, so discovery never runs
+    too far ahead of them.
+
+    The output is laid out in the same way as ``export_action_test_summary_group``.
+    An ``AttachmentFilter`` narrows down which attachments are exported.
+    Since payload ids are content hashes, attachments with the same payload can
+    share one export by setting ``blob_store_path``. Setting ``manifest_path``
+    makes the export resumable: every file is recorded in an ``ExportManifest``
+    once it is written, and files recorded by an earlier export are skipped.
+    """
+
+    loader: Callable[[list[str]], list[Any]]
+    exporter: Callable[[str, str, str], None]
+    output_path: str
+    max_workers: int
+    batch_size: int
+    progress_callback: ProgressCallback | None
+    blob_store_path: str | None
+    manifest: ExportManifest | None
+    attachment_filter: AttachmentFilter | None
+    progress: ExportProgress
+
+    # pylint: disable=too-many-positional-arguments,too-many-arguments
+    def __init__(
+        self,
+        loader: Callable[[list[str]], list[Any]],
+        exporter: Callable[[str, str, str], None],
+        output_path: str,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        progress_callback: ProgressCallback | None = None,
+        blob_store_path: str | None = None,
+        manifest_path: str | None = None,
+        attachment_filter: AttachmentFilter | None = None,
+    ) -> None:
+        """Create a new instance.
+
+        :param loader: A callable which returns the deserialized objects for a
+            list of ids, in order, e.g. ``Xcresults.get_objects``
+        :param exporter: A callable which exports the object with an id, of a
+            type, to a path, e.g. ``Xcresults.export_attachment``. It is called
+            from the worker threads.
+        :param output_path: The root path to write the attachments to
+        :param max_workers: The maximum number of attachments to export at once
+        :param batch_size: The number of test summaries to load at once
+        :param progress_callback: An optional callable which is passed the
+            progress whenever it changes. It may be called from the worker
+            threads, but never from more than one at a time.
+        :param blob_store_path: When set, each payload is exported once, to a
+            file in this folder named after its hash, and every attachment with
+            that payload is a hard link to it (or a copy, where the file system
+            can't link it)
+        :param manifest_path: When set, the path of a manifest to record each
+            file in as it is written. Files an earlier export recorded in it are
+            skipped, as long as they still have the recorded size.
+        :param attachment_filter: When set, only the attachments it includes
+            are exported
+        """
+        self.loader = loader
+        self.exporter = exporter
+        self.output_path = output_path
+        self.max_workers = max(1, max_workers)
+        self.batch_size = max(1, batch_size)
+        self.progress_callback = progress_callback
+        self.blob_store_path = blob_store_path
+        self.manifest = None if manifest_path is None else ExportManifest(manifest_path)
+        self.attachment_filter = attachment_filter
+        self.progress = ExportProgress()
+
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(self.max_workers * 2)
+        self._reserved: set[str] = set()
+        self._payloads: dict[str, "concurrent.futures.Future[None]"] = {}
+        self._error: BaseException | None = None
+        self._remaining_bytes = None if attachment_filter is None else attachment_filter.max_bytes
+
+    # pylint: enable=too-many-positional-arguments,too-many-arguments
+
+    def _report(self) -> None:
+        """Pass the progress to the callback, if there is one.
+
+        Must be called with the lock held.
+        """
+        if self.progress_callback is not None:
+            self.progress_callback(self.progress)
+
+    def _fail(self, error: BaseException) -> None:
+        """Record an error, unless there already is one.
+
+        Must be called with the lock held.
+
+        :param error: The error
+        """
+        if self._error is None:
+            self._error = error
+
+    def _payload_done(self, future: "concurrent.futures.Future[None]") -> None:
+        """Record the result of exporting a payload.
+
+        :param future: The future of the export
+        """
+        try:
+            with self._lock:
+                error = future.exception()
+                if error is not None:
+                    self._fail(error)
+                    return
+
+                self.progress.payloads_exported += 1
+        finally:
+            self._slots.release()
+
+    def _attachment_done(self, future: "concurrent.futures.Future[None]") -> None:
+        """Record that an attachment is in place, once its payload is exported.
+
+        :param future: The future of the payload's export
+        """
+        if future.exception() is not None:
+            return
+
+        with self._lock:
+            self.progress.attachments_exported += 1
+            self._report()
+
+    def _export_file(self, identifier: str, output_file_path: str) -> None:
+        """Export a payload, then record it in the manifest.
+
+        :param identifier: The id of the payload
+        :param output_file_path: The path to export the payload to
+        """
+        self.exporter(identifier, "file", output_file_path)
+
+        if self.manifest is not None:
+            self.manifest.record(identifier, output_file_path)
+
+    def _skip(self) -> None:
+        """Record that an attachment was already exported by an earlier export."""
+        with self._lock:
+            self.progress.attachments_exported += 1
+            self.progress.attachments_skipped += 1
+            self._report()
+
+    def _export_payload(
+        self,
+        executor: concurrent.futures.ThreadPoolExecutor,
+        identifier: str,
+        output_file_path: str,
+    ) -> "concurrent.futures.Future[None] | None":
+        """Queue the export of a payload, once there is room in the queue.
+
+        :param executor: The pool to export the payload with
+        :param identifier: The id of the payload
+        :param output_file_path: The path to export the payload to
+
+        :returns: The future of the export, or None if another export has failed
+        """
+        self._slots.acquire()  # pylint: disable=consider-using-with
+
+        if self._error is not None:
+            self._slots.release()
+            return None
+
+        future = executor.submit(self._export_file, identifier, output_file_path)
+        future.add_done_callback(self._payload_done)
+        return future
+
+    def _place(
+        self,
+        identifier: str,
+        blob_path: str,
+        output_file_path: str,
+        future: "concurrent.futures.Future[None]",
+    ) -> None:
+        """Link an attachment to its payload in the blob store, once that is exported.
+
+        :param identifier: The id of the payload
+        :param blob_path: The path of the payload in the blob store
+        :param output_file_path: The path of the attachment
+        :param future: The future of the payload's export
+        """
+        if future.exception() is not None:
+            return
+
+        try:
+            _link(blob_path, output_file_path)
+            if self.manifest is not None:
+                self.manifest.record(identifier, output_file_path)
+        except OSError as error:
+            with self._lock:
+                self._fail(error)
+            return
+
+        self._attachment_done(future)
+
+    def _queue(
+        self,
+        executor: concurrent.futures.ThreadPoolExecutor,
+        identifier: str,
+        output_file_path: str,
+    ) -> bool:
+        """Queue the export of an attachment.
+
+        :param executor: The pool to export the attachment with
+        :param identifier: The id of the attachment's payload
+        :param output_file_path: The path to export the attachment to
+
+        :returns: False if another export has failed, True otherwise
+        """
+        if self.manifest is not None and self.manifest.is_complete(identifier, output_file_path):
+            self._skip()
+            return True
+
+        if self.blob_store_path is None:
+            future = self._export_payload(executor, identifier, output_file_path)
+            if future is None:
+                return False
+
+            future.add_done_callback(self._attachment_done)
+            return True
+
+        blob_path = os.path.join(self.blob_store_path, payload_key(identifier))
+
+        future = self._payloads.get(identifier)
+        if future is None:
+            if self.manifest is not None and self.manifest.is_complete(identifier, blob_path):
+                future = concurrent.futures.Future[None]()
+                future.set_result(None)
+            else:
+                future = self._export_payload(executor, identifier, blob_path)
+                if future is None:
+                    return False
+            self._payloads[identifier] = future
+
+        future.add_done_callback(
+            functools.partial(self._place, identifier, blob_path, output_file_path)
+        )
+        return True
+
+    def _include(self, attachment: model.ActionTestAttachment) -> bool:
+        """Check whether an attachment passes the filter, and if so take its size from the budget.
+
+        :param attachment: The attachment
+
+        :returns: True if the attachment is to be exported, False otherwise
+        """
+        if self.attachment_filter is None:
+            return True
+
+        if not self.attachment_filter.includes(attachment):
+            return False
+
+        if self._remaining_bytes is None:
+            return True
+
+        if attachment.payloadSize > self._remaining_bytes:
+            return False
+
+        self._remaining_bytes -= attachment.payloadSize
+        return True
+
+    def _submit(
+        self,
+        executor: concurrent.futures.ThreadPoolExecutor,
+        tests: list[tuple[model.ActionTestMetadata, int]],
+    ) -> None:
+        """Load the summaries of a batch of tests and queue their attachments.
+
+        :param executor: The pool to export the attachments with
+        :param tests: The tests along with the indentation level to log them at
+        """
+        summaries = self.loader([cast(model.Reference, test.summaryRef).id for test, _ in tests])
+
+        for (test, log_depth), summary in zip(tests, summaries):
+            planned = plan_test_attachments(
+                test,
+                summary,
+                self.output_path,
+                log_depth,
+                self._reserved,
+                include=self._include,
+            )
+
+            with self._lock:
+                self.progress.tests_discovered += 1
+                self.progress.attachments_discovered += len(planned)
+                self._report()
+
+            for identifier, output_file_path in planned:
+                if not self._queue(executor, identifier, output_file_path):
+                    return
+
+    def export(
+        self,
+        tests: Iterable[model.ActionTestSummaryIdentifiableObject],
+        log_depth: int = 0,
+    ) -> ExportProgress:
+        """Export the attachments of some tests.
+
+        Returns once every attachment has been exported. If any export fails, no
+        more are started and the first error is raised once the others finish.
+
+        :param tests: The tests or groups of tests to export the attachments of.
+            This is only iterated as the export progresses, so it can be lazy.
+        :param log_depth: The indentation level to log at
+
+        :returns: The final progress
+        """
+        leaves = (
+            (leaf, leaf_log_depth)
+            for test in tests
+            for leaf, leaf_log_depth in exportable_tests(test, log_depth)
+            if self.attachment_filter is None or self.attachment_filter.includes_test(leaf)
+        )
+
+        try:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                while self._error is None:
+                    batch = list(itertools.islice(leaves, self.batch_size))
+                    if not batch:
+                        break
+
+                    self._submit(executor, batch)
+
+                with self._lock:
+                    self.progress.discovery_complete = True
+                    self._report()
+        finally:
+            if self.manifest is not None:
+                self.manifest.close()
+
+        if self._error is not None:
+            raise self._error
+
+        logging.info(
+            f"Exported {self.progress.attachments_exported} attachments "
+            f"({self.progress.payloads_exported} payloads, "
+            f"{self.progress.attachments_skipped} already exported)"
+        )
+        return self.progress
@@ -0,0 +1,282 @@
+"""Backends for reading objects from xcresult bundles."""
+
+import abc
+import base64
+import gzip
+import json
+import os
+import time
+from typing import Any, cast
+
+from xcresult import native, xcresulttool
+from xcresult.cache import DiskCache
+from xcresult.exceptions import XcresultException
+
+
+class XcresultBackend(abc.ABC):
+    """The interface for reading objects from xcresult bundles.
+
+    A backend returns objects in the same structure as ``xcresulttool get
+    --format json --legacy`` prints, so anything it returns can be passed to
+    ``xcresulttool.deserialize``.
+    """
+
+    @abc.abstractmethod
+    def get(self, path: str, identifier: str | None = None) -> dict[str, Any]:
+        """Get an object from a bundle.
+
+        :param path: The path to the xcresult bundle
+        :param identifier: The id of the object to get (the root object if None)
+
+        :returns: The object data
+        """
+
+    def get_many(self, path: str, identifiers: list[str]) -> list[dict[str, Any]]:
+        """Get several objects from a bundle.
+
+        :param path: The path to the xcresult bundle
+        :param identifiers: The ids of the objects to get
+
+        :returns: The data for each id, in the same order as the ids
+        """
+        return [self.get(path, identifier) for identifier in identifiers]
+
+    @abc.abstractmethod
+    def export_file(self, path: str, identifier: str, output_path: str) -> None:
+        """Export a file from a bundle.
+
+        :param path: The path to the xcresult bundle
+        :param identifier: The id of the file to export
+        :param output_path: The path to write the file to
+        """
+
+    @abc.abstractmethod
+    def export_directory(self, path: str, identifier: str, output_path: str) -> None:
+        """Export a directory from a bundle.
+
+        :param path: The path to the xcresult bundle
+        :param identifier: The id of the directory to export
+        :param output_path: The path to write the directory to
+        """
+
+    @abc.abstractmethod
+    def list_ids(self, path: str) -> list[str]:
+        """List the ids of every object stored in a bundle.
+
+        :param path: The path to the xcresult bundle
+
+        :returns: The ids, sorted
+        """
+
+
+class SubprocessBackend(XcresultBackend):
+    """Reads bundles by running ``xcrun xcresulttool``."""
+
+    max_workers: int
+
+    def __init__(self, max_workers: int = xcresulttool.DEFAULT_MAX_WORKERS) -> None:
+        self.max_workers = max_workers
+
+    def get(self, path: str, identifier: str | None = None) -> dict[str, Any]:
+        return xcresulttool.get(path, identifier)
+
+    def get_many(self, path: str, identifiers: list[str]) -> list[dict[str, Any]]:
+        return xcresulttool.get_many(path, identifiers, self.max_workers)
+
+    def export_file(self, path: str, identifier: str, output_path: str) -> None:
+        xcresulttool.export_attachment(path, identifier, "file", output_path)
+
+    def export_directory(self, path: str, identifier: str, output_path: str) -> None:
+        xcresulttool.export_attachment(path, identifier, "directory", output_path)
+
+    def list_ids(self, path: str) -> list[str]:
+        # xcresulttool has no way to list objects, but the listing doesn't need
+        # to decode anything so it works for any bundle
+        return native.list_ids(path)
+
+
+class NativeBackend(XcresultBackend):
+    """Reads fileBacked2 bundles directly from disk, without Xcode."""
+
+    def get(self, path: str, identifier: str | None = None) -> dict[str, Any]:
+        return native.get(path, identifier)
+
+    def export_file(self, path: str, identifier: str, output_path: str) -> None:
+        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        native.export(path, identifier, "file", output_path)
+
+    def export_directory(self, path: str, identifier: str, output_path: str) -> None:
+        native.export(path, identifier, "directory", output_path)
+
+    def list_ids(self, path: str) -> list[str]:
+        return native.list_ids(path)
+
+
+class CachingBackend(XcresultBackend):
+    """Wraps another backend, keeping the objects it returns in a ``DiskCache``.
+
+    Exports and listings are passed straight through to the wrapped backend.
+    """
+
+    backend: XcresultBackend
+    cache: DiskCache
+
+    def __init__(self, backend: XcresultBackend, cache: DiskCache) -> None:
+        self.backend = backend
+        self.cache = cache
+
+    def _read(self, key: str | None) -> dict[str, Any] | None:
+        if key is None:
+            return None
+
+        cached = self.cache.read(key)
+        if cached is None:
+            return None
+
+        return cast(dict[str, Any], json.loads(cached))
+
+    def _write(self, key: str | None, data: dict[str, Any]) -> None:
+        if key is not None:
+            self.cache.write(key, json.dumps(data, separators=(",", ":")).encode("utf-8"))
+
+    def get(self, path: str, identifier: str | None = None) -> dict[str, Any]:
+        key = self.cache.key(path, identifier)
+
+        data = self._read(key)
+        if data is not None:
+            return data
+
+        data = self.backend.get(path, identifier)
+        self._write(key, data)
+        return data
+
+    def get_many(self, path: str, identifiers: list[str]) -> list[dict[str, Any]]:
+        results: dict[str, dict[str, Any]] = {}
+        missing: list[str] = []
+
+        for identifier in dict.fromkeys(identifiers):
+            data = self._read(self.cache.key(path, identifier))
+            if data is None:
+                missing.append(identifier)
+            else:
+                results[identifier] = data
+
+        if missing:
+            for identifier, data in zip(missing, self.backend.get_many(path, missing)):
+                self._write(self.cache.key(path, identifier), data)
+                results[identifier] = data
+
+        return [results[identifier] for identifier in identifiers]
+
+    def export_file(self, path: str, identifier: str, output_path: str) -> None:
+        self.backend.export_file(path, identifier, output_path)
+
+    def export_directory(self, path: str, identifier: str, output_path: str) -> None:
+        self.backend.export_directory(path, identifier, output_path)
+
+    def list_ids(self, path: str) -> list[str]:
+        return self.backend.list_ids(path)
+
+
+class RecordedBackend(XcresultBackend):
+    """Replays objects and files from a recording, ignoring the bundle path.
+
+    This is useful for tests and benchmarks on machines without Xcode. Setting
+    ``latency`` delays every call by that many seconds, to stand in for the
+    cost of launching xcresulttool.
+    """
+
+    root_id: str
+    objects: dict[str, dict[str, Any]]
+    files: dict[str, bytes]
+    latency: float
+
+    def __init__(
+        self,
+        root_id: str,
+        objects: dict[str, dict[str, Any]],
+        files: dict[str, bytes] | None = None,
+        latency: float = 0.0,
+    ) -> None:
+        self.root_id = root_id
+        self.objects = objects
+        self.files = files or {}
+        self.latency = latency
+
+    @staticmethod
+    def load(recording_path: str, latency: float = 0.0) -> "RecordedBackend":
+        """Load a recording from a JSON file, which may be gzip compressed.
+
+        The file holds ``rootId``, ``objects`` (a map of id to object data) and
+        optionally ``files`` (a map of id to base64 encoded file contents).
+
+        :param recording_path: The path to the recording
+        :param latency: The number of seconds to delay every call by
+
+        :returns: The backend
+        """
+        with open(recording_path, "rb") as recording_file:
+            contents = recording_file.read()
+
+        if contents.startswith(b"\x1f\x8b"):
+            contents = gzip.decompress(contents)
+
+        recording: dict[str, Any] = json.loads(contents)
+
+        return RecordedBackend(
+            recording["rootId"],
+            recording["objects"],
+            {
+                identifier: base64.b64decode(encoded)
+                for identifier, encoded in recording.get("files", {}).items()
+            },
+            latency,
+        )
+
+    def save(self, recording_path: str) -> None:
+        """Save the recording as gzip compressed JSON, in the format ``load`` reads.
+
+        :param recording_path: The path to write the recording to
+        """
+        recording = {
+            "rootId": self.root_id,
+            "objects": self.objects,
+            "files": {
+                identifier: base64.b64encode(contents).decode("ascii")
+                for identifier, contents in self.files.items()
+            },
+        }
+
+        with gzip.open(recording_path, "wt", encoding="utf-8") as recording_file:
+            json.dump(recording, recording_file, separators=(",", ":"))
+
+    def _wait(self) -> None:
+        if self.latency > 0:
+            time.sleep(self.latency)
+
+    def get(self, path: str, identifier: str | None = None) -> dict[str, Any]:
+        self._wait()
+
+        if identifier is None:
+            identifier = self.root_id
+
+        if identifier not in self.objects:
+            raise XcresultException(f"Object not found in recording: {identifier}")
+
+        return self.objects[identifier]
+
+    def export_file(self, path: str, identifier: str, output_path: str) -> None:
+        self._wait()
+
+        if identifier not in self.files:
+            raise XcresultException(f"File not found in recording: {identifier}")
+
+        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        with open(output_path, "wb") as output_file:
+            output_file.write(self.files[identifier])
+
+    def export_directory(self, path: str, identifier: str, output_path: str) -> None:
+        raise XcresultException("Recordings do not contain directories")
+
+    def list_ids(self, path: str) -> list[str]:
+        return sorted(set(self.objects) | set(self.files))
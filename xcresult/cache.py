@@ -0,0 +1,260 @@
+"""Caching for xcresulttool responses and the objects deserialized from them."""
+
+from collections import OrderedDict
+import hashlib
+import os
+import plistlib
+import tempfile
+import threading
+from typing import Any, cast
+
+
+DEFAULT_MAX_SIZE = 512 * 1024 * 1024
+
+
+def bundle_root_id(path: str) -> str | None:
+    """Get the root object id of an xcresult bundle.
+
+    The root id is the content hash of the bundle's top level object, so it
+    uniquely identifies the bundle contents no matter where the bundle lives on
+    disk.
+
+    :param path: The path to the xcresult bundle
+
+    :returns: The root id if it could be read, None otherwise
+    """
+    try:
+        with open(os.path.join(path, "Info.plist"), "rb") as info_file:
+            info: dict[str, Any] = plistlib.load(info_file)
+    except (OSError, plistlib.InvalidFileException):
+        return None
+
+    root_id: Any = info.get("rootId")
+
+    if isinstance(root_id, dict):
+        root_id = cast(dict[str, Any], root_id).get("hash")
+
+    if not isinstance(root_id, str) or not root_id:
+        return None
+
+    return root_id
+
+
+class DiskCache:
+    """A persistent, size bounded cache of raw xcresulttool responses.
+
+    Entries are keyed by the bundle's root id and the object id requested. Since
+    xcresult object ids are content hashes, an entry never goes stale and can be
+    shared between every copy of the same bundle. When the total size of the
+    cache exceeds ``max_size`` the least recently used entries are evicted.
+    """
+
+    directory: str
+    max_size: int
+
+    def __init__(self, directory: str, max_size: int = DEFAULT_MAX_SIZE) -> None:
+        self.directory = os.path.abspath(directory)
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._root_ids: dict[str, str | None] = {}
+        self._total_size: int | None = None
+
+    def key(self, path: str, identifier: str | None) -> str | None:
+        """Get the cache key for an object in a bundle.
+
+        :param path: The path to the xcresult bundle
+        :param identifier: The id of the object, or None for the root object
+
+        :returns: The key if the bundle can be cached, None otherwise
+        """
+        with self._lock:
+            if path not in self._root_ids:
+                self._root_ids[path] = bundle_root_id(path)
+            root_id = self._root_ids[path]
+
+        if root_id is None:
+            return None
+
+        return hashlib.sha256(f"{root_id}\x00{identifier or ''}".encode("utf-8")).hexdigest()
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], key)
+
+    def read(self, key: str) -> bytes | None:
+        """Read an entry from the cache.
+
+        :param key: The key of the entry
+
+        :returns: The cached data if present, None otherwise
+        """
+        entry_path = self._entry_path(key)
+
+        try:
+            with open(entry_path, "rb") as entry_file:
+                data = entry_file.read()
+        except FileNotFoundError:
+            return None
+
+        # The modification time doubles as the last access time for eviction
+        try:
+            os.utime(entry_path)
+        except FileNotFoundError:
+            pass
+
+        return data
+
+    def write(self, key: str, data: bytes) -> None:
+        """Write an entry to the cache, evicting old entries if required.
+
+        :param key: The key of the entry
+        :param data: The data to store
+        """
+        if len(data) > self.max_size:
+            return
+
+        entry_path = self._entry_path(key)
+        os.makedirs(os.path.dirname(entry_path), exist_ok=True)
+
+        try:
+            previous_size = os.path.getsize(entry_path)
+        except FileNotFoundError:
+            previous_size = 0
+
+        # Write then rename so that concurrent readers never see a partial entry
+        file_descriptor, temp_path = tempfile.mkstemp(prefix=".", dir=os.path.dirname(entry_path))
+        with os.fdopen(file_descriptor, "wb") as temp_file:
+            temp_file.write(data)
+        os.replace(temp_path, entry_path)
+
+        with self._lock:
+            if self._total_size is None:
+                self._total_size = self._scan_size()
+            else:
+                self._total_size += len(data) - previous_size
+
+            if self._total_size > self.max_size:
+                self._evict()
+
+    def clear(self) -> None:
+        """Remove every entry from the cache."""
+        with self._lock:
+            for entry_path, _, _ in self._entries():
+                try:
+                    os.remove(entry_path)
+                except FileNotFoundError:
+                    pass
+            self._total_size = 0
+
+    @property
+    def size(self) -> int:
+        """Get the total size of all entries in the cache.
+
+        :returns: The size in bytes
+        """
+        with self._lock:
+            self._total_size = self._scan_size()
+            return self._total_size
+
+    def _entries(self) -> list[tuple[str, float, int]]:
+        entries: list[tuple[str, float, int]] = []
+
+        if not os.path.isdir(self.directory):
+            return entries
+
+        for bucket in os.scandir(self.directory):
+            if not bucket.is_dir():
+                continue
+            for entry in os.scandir(bucket.path):
+                if entry.name.startswith(".") or not entry.is_file():
+                    continue
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((entry.path, stat.st_mtime, stat.st_size))
+
+        return entries
+
+    def _scan_size(self) -> int:
+        return sum(size for _, _, size in self._entries())
+
+    def _evict(self) -> None:
+        entries = sorted(self._entries(), key=lambda entry: entry[1])
+        total_size = sum(size for _, _, size in entries)
+
+        for entry_path, _, size in entries:
+            if total_size <= self.max_size:
+                break
+            try:
+                os.remove(entry_path)
+            except FileNotFoundError:
+                pass
+            total_size -= size
+
+        self._total_size = total_size
+
+
+class ObjectCache:
+    """An in memory cache of deserialized objects from a single bundle.
+
+    Objects are keyed by their id. When ``max_objects`` is set, no more than
+    that many objects are kept and the least recently used ones are dropped
+    first. This caps the number of objects rather than the memory they use, as
+    the size of a deserialized object isn't known cheaply.
+    """
+
+    max_objects: int | None
+    hits: int
+    misses: int
+
+    def __init__(self, max_objects: int | None = None) -> None:
+        self.max_objects = max_objects
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._objects: OrderedDict[str, Any] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._objects)
+
+    def __contains__(self, identifier: str) -> bool:
+        return identifier in self._objects
+
+    def lookup(self, identifier: str) -> tuple[bool, Any]:
+        """Look up an object, counting the hit or miss.
+
+        :param identifier: The id of the object
+
+        :returns: A tuple of whether the object was found and the object itself
+        """
+        with self._lock:
+            if identifier not in self._objects:
+                self.misses += 1
+                return False, None
+
+            self.hits += 1
+            self._objects.move_to_end(identifier)
+            return True, self._objects[identifier]
+
+    def store(self, identifier: str, value: Any) -> None:
+        """Store an object.
+
+        :param identifier: The id of the object
+        :param value: The deserialized object
+        """
+        with self._lock:
+            self._objects[identifier] = value
+            self._objects.move_to_end(identifier)
+
+            if self.max_objects is None:
+                return
+
+            while len(self._objects) > self.max_objects:
+                self._objects.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove every object and reset the counters."""
+        with self._lock:
+            self._objects.clear()
+            self.hits = 0
+            self.misses = 0
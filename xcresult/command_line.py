@@ -27,6 +27,38 @@ class IssueType(enum.Enum):
     TEST_WARNING = "test-warning"
 
 
+def _open_bundle(args: argparse.Namespace) -> xcresult.Xcresults:
+    """Open the bundle the arguments point at."""
+
+    cache = None
+    if args.cache_dir and args.cache_max_size is not None:
+        cache = xcresult.DiskCache(args.cache_dir, args.cache_max_size)
+    elif args.cache_dir:
+        cache = xcresult.DiskCache(args.cache_dir)
+
+    return xcresult.Xcresults(args.bundle_path, cache=cache)
+
+
+def _print_export_progress(progress: xcresult.ExportProgress) -> None:
+    """Print how far an export has got, overwriting the previous line."""
+
+    total = f"{progress.attachments_discovered}"
+    if not progress.discovery_complete:
+        total += "+"
+
+    finished = (
+        progress.discovery_complete
+        and progress.attachments_exported == progress.attachments_discovered
+    )
+    end = "\n" if finished else ""
+    print(
+        f"\rExported {progress.attachments_exported} of {total} attachments",
+        end=end,
+        file=sys.stderr,
+        flush=True,
+    )
+
+
 def _handle_export(args: argparse.Namespace) -> int:
     """Handle the export sub command."""
 
@@ -34,9 +66,34 @@ def _handle_export(args: argparse.Namespace) -> int:
         print("Output folder does not exist")
         return 1
 
+    progress_callback = _print_export_progress if args.progress else None
+
+    attachment_filter = None
+    if (
+        args.test_statuses is not None
+        or args.types is not None
+        or args.exclude_types is not None
+        or args.names is not None
+        or args.max_bytes is not None
+    ):
+        attachment_filter = xcresult.AttachmentFilter(
+            statuses=args.test_statuses,
+            type_identifiers=args.types,
+            excluded_type_identifiers=args.exclude_types or (),
+            name_patterns=args.names,
+            max_bytes=args.max_bytes,
+        )
+
     try:
-        bundle = xcresult.Xcresults(args.bundle_path)
-        bundle.export_test_attachments(args.output_path)
+        bundle = _open_bundle(args)
+        bundle.export_test_attachments(
+            args.output_path,
+            max_workers=args.max_workers,
+            progress_callback=progress_callback,
+            blob_store_path=args.blob_store_path,
+            manifest_path=args.manifest_path,
+            attachment_filter=attachment_filter,
+        )
         # pylint: disable=broad-exception-caught
     except Exception as ex:
         # pylint: enable=broad-exception-caught
@@ -54,7 +111,7 @@ def _handle_junit(args: argparse.Namespace) -> int:
         return 1
 
     try:
-        bundle = xcresult.Xcresults(args.bundle_path)
+        bundle = _open_bundle(args)
         bundle.write_junit(
             args.output_path,
             args.export_attachments_path,
@@ -100,7 +157,7 @@ def _check_summary_type(
 def _handle_check_issues(args: argparse.Namespace) -> int:
     """Handle the check-issues sub command."""
 
-    bundle = xcresult.Xcresults(args.bundle_path)
+    bundle = _open_bundle(args)
 
     found_issues = False
 
@@ -157,6 +214,27 @@ def _handle_arguments() -> int:
         help="Set the path to the xcresults bundle",
     )
 
+    parser.add_argument(
+        "--cache-dir",
+        dest="cache_dir",
+        action="store",
+        help=(
+            "Cache xcresulttool responses in this folder so that reading the same "
+            "bundle again does not need to call xcresulttool"
+        ),
+    )
+
+    parser.add_argument(
+        "--cache-max-size",
+        dest="cache_max_size",
+        action="store",
+        type=int,
+        help=(
+            "Set the maximum size of the cache in bytes, evicting the least recently used "
+            "entries when it is exceeded. Default: 512MB."
+        ),
+    )
+
     subparsers = parser.add_subparsers()
 
     export_parser = subparsers.add_parser("export", help="Export attachments from a bundle")
@@ -170,6 +248,87 @@ def _handle_arguments() -> int:
         help="Set the output path for the attachments to be written to",
     )
 
+    export_parser.add_argument(
+        "--max-workers",
+        dest="max_workers",
+        action="store",
+        type=int,
+        default=xcresult.xcresulttool.DEFAULT_MAX_WORKERS,
+        help=(
+            "Set the maximum number of attachments to export at once. "
+            f"Default: {xcresult.xcresulttool.DEFAULT_MAX_WORKERS}."
+        ),
+    )
+
+    export_parser.add_argument(
+        "--blob-store-path",
+        dest="blob_store_path",
+        action="store",
+        help=(
+            "Export each distinct attachment payload only once, into this folder, and "
+            "hard link the attachments of every test to it"
+        ),
+    )
+
+    export_parser.add_argument(
+        "--manifest-path",
+        dest="manifest_path",
+        action="store",
+        help=(
+            "Record every exported file in this manifest, and skip the files an earlier "
+            "export recorded in it. Use this to resume an export which was interrupted."
+        ),
+    )
+
+    export_parser.add_argument(
+        "--test-statuses",
+        dest="test_statuses",
+        nargs="+",
+        help=(
+            "Only export the attachments of tests with one of these statuses "
+            "(e.g. Failure). Exports the attachments of every test if not specified."
+        ),
+    )
+
+    export_parser.add_argument(
+        "--types",
+        dest="types",
+        nargs="+",
+        help="Only export attachments with one of these uniform type identifiers (e.g. public.png)",
+    )
+
+    export_parser.add_argument(
+        "--exclude-types",
+        dest="exclude_types",
+        nargs="+",
+        help="Don't export attachments with any of these uniform type identifiers",
+    )
+
+    export_parser.add_argument(
+        "--names",
+        dest="names",
+        nargs="+",
+        help="Only export attachments whose file name or name matches one of these glob patterns",
+    )
+
+    export_parser.add_argument(
+        "--max-bytes",
+        dest="max_bytes",
+        action="store",
+        type=int,
+        help=(
+            "Skip any attachment which would take the total size of the exported "
+            "attachments over this many bytes"
+        ),
+    )
+
+    export_parser.add_argument(
+        "--progress",
+        dest="progress",
+        action="store_true",
+        help="Print the progress of the export to stderr",
+    )
+
     export_parser.set_defaults(subcommand="export")
 
     junit_parser = subparsers.add_parser("junit", help="Export test results as a .junit file")
@@ -0,0 +1,162 @@
+"""An index of the tests in a bundle by their identifiers."""
+
+from typing import Iterable, Iterator
+
+from xcresult.model import (
+    ActionTestableSummary,
+    ActionTestMetadata,
+    ActionTestPlanRunSummaries,
+    ActionTestPlanRunSummary,
+    ActionTestSummaryGroup,
+    ActionTestSummaryIdentifiableObject,
+    TestFailureIssueSummary,
+    TestIssueSummary,
+)
+
+
+class IndexedTest:
+    """A test along with where it sits in the bundle."""
+
+    __slots__ = ("test", "groups", "testable", "run_summary")
+
+    test: ActionTestMetadata
+    groups: tuple[ActionTestSummaryGroup, ...]
+    testable: ActionTestableSummary
+    run_summary: ActionTestPlanRunSummary
+
+    def __init__(
+        self,
+        test: ActionTestMetadata,
+        groups: tuple[ActionTestSummaryGroup, ...],
+        testable: ActionTestableSummary,
+        run_summary: ActionTestPlanRunSummary,
+    ) -> None:
+        """Create a new instance.
+
+        :param test: The test
+        :param groups: The groups containing the test, outermost first
+        :param testable: The testable summary the test is in
+        :param run_summary: The run summary (configuration) the test is in
+        """
+        self.test = test
+        self.groups = groups
+        self.testable = testable
+        self.run_summary = run_summary
+
+
+def _iter_indexed_tests(
+    testable: ActionTestableSummary, run_summary: ActionTestPlanRunSummary
+) -> Iterator[IndexedTest]:
+    """Iterate over the tests of a testable summary, depth first.
+
+    :param testable: The testable summary
+    :param run_summary: The run summary the testable summary is in
+
+    :returns: An iterator over the tests along with where they are
+    """
+    stack: list[
+        tuple[tuple[ActionTestSummaryGroup, ...], Iterator[ActionTestSummaryIdentifiableObject]]
+    ] = [((), iter(testable.tests or []))]
+
+    while stack:
+        groups, tests = stack[-1]
+        for test in tests:
+            if isinstance(test, ActionTestSummaryGroup):
+                stack.append((groups + (test,), iter(test.subtests or [])))
+                break
+            if isinstance(test, ActionTestMetadata):
+                yield IndexedTest(test, groups, testable, run_summary)
+        else:
+            stack.pop()
+
+
+def _test_case_identifier(test_case_name: str) -> str:
+    """Get the identifier of the test named by an issue's ``testCaseName``.
+
+    Issues name Objective-C tests like ``-[MyTests testSomething]`` and Swift
+    tests like ``MyTests.testSomething()``, whereas their identifiers are
+    ``MyTests/testSomething`` and ``MyTests/testSomething()``.
+
+    :param test_case_name: The test case name
+
+    :returns: The identifier, or the name unchanged if it is in neither form
+    """
+    if test_case_name.startswith(("-[", "+[")) and test_case_name.endswith("]"):
+        class_name, _, selector = test_case_name[2:-1].partition(" ")
+        if class_name and selector:
+            return f"{class_name}/{selector}"
+        return test_case_name
+
+    # Only look for the dot before any arguments
+    type_name, _, method = test_case_name.partition("(")[0].rpartition(".")
+    if type_name and method:
+        return f"{type_name}/{test_case_name[len(type_name) + 1 :]}"
+
+    return test_case_name
+
+
+class IdentifierIndex:
+    """The tests of a bundle, indexed by ``identifier`` and ``identifierURL``.
+
+    The same test can appear more than once, e.g. when it ran in several
+    configurations or was retried, so each key maps to every matching test in
+    the order they appear in the bundle.
+    """
+
+    by_identifier: dict[str, list[IndexedTest]]
+    by_identifier_url: dict[str, list[IndexedTest]]
+
+    def __init__(self) -> None:
+        self.by_identifier = {}
+        self.by_identifier_url = {}
+
+    @staticmethod
+    def from_summaries(summaries: Iterable[ActionTestPlanRunSummaries]) -> "IdentifierIndex":
+        """Index the tests of some run summaries.
+
+        :param summaries: The run summaries, one for each action which ran tests
+
+        :returns: The index
+        """
+        index = IdentifierIndex()
+
+        for summary in summaries:
+            for run_summary in summary.summaries or []:
+                for testable in run_summary.testableSummaries or []:
+                    for indexed in _iter_indexed_tests(testable, run_summary):
+                        index.add(indexed)
+
+        return index
+
+    def add(self, indexed: IndexedTest) -> None:
+        """Add a test to the index.
+
+        :param indexed: The test along with where it is
+        """
+        if indexed.test.identifier is not None:
+            self.by_identifier.setdefault(indexed.test.identifier, []).append(indexed)
+
+        if indexed.test.identifierURL is not None:
+            self.by_identifier_url.setdefault(indexed.test.identifierURL, []).append(indexed)
+
+    def lookup(self, identifier: str) -> list[IndexedTest]:
+        """Find the tests with an identifier or identifier URL.
+
+        :param identifier: The ``identifier`` (e.g. "MyTests/testSomething()") or
+            ``identifierURL`` of the test
+
+        :returns: Every matching test, or an empty list if there are none
+        """
+        found = self.by_identifier.get(identifier)
+        if found is None:
+            found = self.by_identifier_url.get(identifier, [])
+        return list(found)
+
+    def lookup_issue(self, issue: TestFailureIssueSummary | TestIssueSummary) -> list[IndexedTest]:
+        """Find the tests an issue was raised by.
+
+        :param issue: The issue, e.g. from ``ResultIssueSummaries.testFailureSummaries``
+
+        :returns: Every matching test, or an empty list if there are none
+        """
+        return self.lookup(_test_case_identifier(issue.testCaseName))
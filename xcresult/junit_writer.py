@@ -14,7 +14,6 @@ from xcresult.model import (
     ActionTestPlanRunSummaries,
 )
 from xcresult.xcresult_base import XcresultsBase
-from xcresult.xcresulttool import deserialize
 
 # lxml exposes its element type only via the underscore-prefixed name.
 Element = ET._Element  # pylint: disable=protected-access  # pyright: ignore[reportPrivateUsage]
@@ -155,7 +154,7 @@ class JunitWriter:
             failure_element.set("message", "Unknown failure due to missing summary ref.")
             return 1, 1, 0
 
-        base_failure = cast(ActionTestSummary, deserialize(self.results.get(test.summaryRef.id)))
+        base_failure = cast(ActionTestSummary, test.summaryRef.resolve(self.results))
 
         for failure in base_failure.failureSummaries:
             if (
@@ -220,17 +219,17 @@ class JunitWriter:
         total_failures = 0
         total_skipped = 0
 
-        # Flatten every top level group up front. `summary.tests` is typed as the
-        # base identifiable object (generated model); the runtime elements are
-        # groups/metadata that implement all_subtests.
+        # Flatten every top level group up front into a single list, noting where
+        # each group's leaves start. `summary.tests` is typed as the base
+        # identifiable object (generated model); the runtime elements are
+        # groups/metadata that implement iter_subtests.
         groups = list(summary.tests or [])
-        group_subtests = [
-            cast(
-                list[ActionTestSummaryIdentifiableObject],
-                group.all_subtests(),  # type: ignore[attr-defined]
-            )
-            for group in groups
-        ]
+        leaves: list[ActionTestSummaryIdentifiableObject] = []
+        group_starts: list[int] = []
+        for group in groups:
+            group_starts.append(len(leaves))
+            leaves.extend(group.iter_subtests())  # type: ignore[attr-defined]
+        group_starts.append(len(leaves))
 
         # Retries have to be collapsed across the whole testable summary rather
         # than per top level group. `xcodebuild ... -retry-tests-on-failure`
@@ -243,21 +242,24 @@ class JunitWriter:
         # actually ran in.
         retained_indices: set[int] | None = None
         if self.collapse_retries:
-            retained_indices = self._collapse_retry_indices(
-                [subtest for subtests in group_subtests for subtest in subtests]
-            )
+            retained_indices = self._collapse_retry_indices(leaves)
+
+        suite_tests: list[
+            tuple[ActionTestSummaryIdentifiableObject, list[ActionTestSummaryIdentifiableObject]]
+        ] = []
 
-        group_start = 0
+        for group_index, test in enumerate(groups):
+            group_start = group_starts[group_index]
+            group_end = group_starts[group_index + 1]
 
-        for test, group_leaves in zip(groups, group_subtests):
-            subtests = group_leaves
-            if retained_indices is not None:
+            if retained_indices is None:
+                subtests = leaves[group_start:group_end]
+            else:
                 subtests = [
-                    subtest
-                    for index, subtest in enumerate(group_leaves, start=group_start)
+                    leaves[index]
+                    for index in range(group_start, group_end)
                     if index in retained_indices
                 ]
-            group_start += len(group_leaves)
 
             # Drop any tests the caller asked to exclude. Doing it here keeps the
             # emitted XML and the suite/root counts consistent without a second
@@ -271,6 +273,23 @@ class JunitWriter:
             if not subtests:
                 continue
 
+            suite_tests.append((test, subtests))
+
+        # Every failing test needs its summary to describe the failure. Fetch them
+        # all at once so that they can be loaded concurrently rather than one by
+        # one as each test case is written.
+        self.results.get_objects(
+            [
+                subtest.summaryRef.id
+                for _, subtests in suite_tests
+                for subtest in subtests
+                if isinstance(subtest, ActionTestMetadata)
+                and subtest.testStatus not in ("Success", "Skipped")
+                and subtest.summaryRef is not None
+            ]
+        )
+
+        for test, subtests in suite_tests:
             suite = ET.SubElement(root, "testsuite")  # type: ignore[arg-type]
             suite.set("name", f"{summary.name}/{test.identifier}" or "Unknown Suite")
 
@@ -319,10 +338,7 @@ class JunitWriter:
         test_identifiers = [tr.id for tr in test_refs]
 
         summaries = [
-            cast(
-                ActionTestPlanRunSummaries,
-                deserialize(self.results.get(test_identifier)),
-            )
+            cast(ActionTestPlanRunSummaries, self.results.get_object(test_identifier))
             for test_identifier in test_identifiers
         ]
 
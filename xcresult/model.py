@@ -2,13 +2,25 @@
 
 import datetime
 import sys
-from typing import Any, Optional
+from typing import Any, ClassVar, Iterator, Optional
 import urllib.parse
 
 
 # pylint: disable=too-many-lines
 # pylint: disable=invalid-name
 
+# The kinds of field listed in the FIELDS of each model
+FIELD_PRIMITIVE = "primitive"
+FIELD_LIST = "list"
+FIELD_OPTIONAL = "optional"
+FIELD_OBJECT = "object"
+
+# The default value of fields which must be present in the data
+REQUIRED: Any = object()
+
+# Whether the models reject changes once they have been deserialized
+FROZEN = False
+
 
 def flatten(list_of_lists: list[Any]) -> list[Any]:
     """Flatten a list of lists."""
@@ -30,26 +42,24 @@ def xchash(item: Any) -> int:
             all_hashes.append(xchash(value))
         return hash(tuple(all_hashes))
 
-    if not hasattr(item, "_members"):
-        return hash(item)
-
-    members_call = getattr(item, "_members", None)
-    if members_call is None:
-        return hash(item)
-
-    for member in members_call():
-        all_hashes.append(xchash(member))
-
-    return hash(tuple(all_hashes))
+    # Models hash their members themselves
+    return hash(item)
 
 
 class XcresultObject:
     """Generated from xcresulttool format description."""
 
+    __slots__ = ()
+
+    FIELDS: ClassVar[tuple[tuple[str, str, Any], ...]] = ()
+
     def _members(self) -> tuple[Any, ...]:
         return ()
 
     def __eq__(self, other: Any) -> bool:
+        if self is other:
+            return True
+
         if not isinstance(other, self.__class__):
             return False
 
@@ -58,7 +68,7 @@ class XcresultObject:
         # pylint: enable=protected-access
 
     def __hash__(self) -> int:
-        return xchash(self)
+        return hash(tuple(xchash(member) for member in self._members()))
 
 
 # Defined Type: Bool -> bool
@@ -119,26 +129,24 @@ class ActionPlatformRecord(XcresultObject):
         + userDescription: String
     """
 
+    __slots__ = (
+        "identifier",
+        "userDescription",
+    )
+
     identifier: str
     userDescription: str
 
+    FIELDS: ClassVar[tuple[tuple[str, str, Any], ...]] = (
+        ("identifier", FIELD_PRIMITIVE, ""),
+        ("userDescription", FIELD_PRIMITIVE, ""),
+    )
+
     def _members(self) -> tuple[Any, ...]:
-        properties: list[Any] = [
+        return (
             self.identifier,
             self.userDescription,
-        ]
-        return tuple(properties + list(super()._members()))
-
-    def __eq__(self, other: Any) -> bool:
-        if not isinstance(other, self.__class__):
-            return False
-
-        # pylint: disable=protected-access
-        return self._members() == other._members()
-        # pylint: enable=protected-access
-
-    def __hash__(self) -> int:
-        return xchash(self)
+        )
 
 
 class ActionSDKRecord(XcresultObject):
@@ -153,30 +161,32 @@ class ActionSDKRecord(XcresultObject):
         + isInternal: Bool
     """
 
+    __slots__ = (
+        "name",
+        "identifier",
+        "operatingSystemVersion",
+        "isInternal",
+    )
+
     name: str
     identifier: str
     operatingSystemVersion: str
     isInternal: bool
 
+    FIELDS: ClassVar[tuple[tuple[str, str, Any], ...]] = (
+        ("name", FIELD_PRIMITIVE, ""),
+        ("identifier", FIELD_PRIMITIVE, ""),
+        ("operatingSystemVersion", FIELD_PRIMITIVE, ""),
+        ("isInternal", FIELD_PRIMITIVE, False),
+    )
+
     def _members(self) -> tuple[Any, ...]:
-        properties: list[Any] = [
+        return (
             self.name,
             self.identifier,
             self.operatingSystemVersion,
             self.isInternal,
-        ]
-        return tuple(properties + list(super()._members()))
-
-    def __eq__(self, other: Any) -> bool:
-        if not isinstance(other, self.__class__):
-            return False
-
-        # pylint: disable=protected-access
-        return self._members() == other._members()
-        # pylint: enable=protected-access
-
-    def __hash__(self) -> int:
-        return xchash(self)
+        )
 
 
 class ActivityLogAnalyzerStep(XcresultObject):
@@ -188,24 +198,14 @@ class ActivityLogAnalyzerStep(XcresultObject):
         + parentIndex: Int
     """
 
-    parentIndex: int
-
-    def _members(self) -> tuple[Any, ...]:
-        properties: list[Any] = [
-            self.parentIndex,
-        ]
-        return tuple(properties + list(super()._members()))
+    __slots__ = ("parentIndex",)
 
-    def __eq__(self, other: Any) -> bool:
-        if not isinstance(other, self.__class__):
-            return False
+    parentIndex: int
 
-        # pylint: disable=protected-access
-        return self._members() == other._members()
-        # pylint: enable=protected-access
+    FIELDS: ClassVar[tuple[tuple[str, str, Any], ...]] = (("parentIndex", FIELD_PRIMITIVE, 0),)
 
-    def __hash__(self) -> int:
-        return xchash(self)
+    def _members(self) -> tuple[Any, ...]:
+        return (self.parentIndex,)
 
 
 class ActivityLogSectionAttachment(XcresultObject):
@@ -220,30 +220,32 @@ class ActivityLogSectionAttachment(XcresultObject):
         + data: Data
     """
 
+    __slots__ = (
+        "identifier",
+        "majorVersion",
+        "minorVersion",
+        "data",
+    )
+
     identifier: str
     majorVersion: int
     minorVersion: int
     data: bytes
 
+    FIELDS: ClassVar[tuple[tuple[str, str, Any], ...]] = (
+        ("identifier", FIELD_PRIMITIVE, ""),
+        ("majorVersion", FIELD_PRIMITIVE, 0),
+        ("minorVersion", FIELD_PRIMITIVE, 0),
+        ("data", FIELD_PRIMITIVE, REQUIRED),
+    )
+
     def _members(self) -> tuple[Any, ...]:
-        properties: list[Any] = [
+        return (
             self.identifier,
             self.majorVersion,
             self.minorVersion,
             self.data,
-        ]
-        return tuple(properties + list(super()._members()))
-
-    def __eq__(self, other: Any) -> bool:
-        if not isinstance(other, self.__class__):
-            return False
-
-        # pylint: disable=protected-access
-        return self._members() == other._members()
-        # pylint: enable=protected-access
-
-    def __hash__(self) -> int:
-        return xchash(self)
+        )
 
 
 class DocumentLocation(XcresultObject):
@@ -256,9 +258,26 @@ class DocumentLocation(XcresultObject):
         + concreteTypeName: String
     """
 
+    __slots__ = (
+        "url",
+        "concreteTypeName",
+        "_parsed",
+    )
+
     url: str
     concreteTypeName: str
 
+    FIELDS: ClassVar[tuple[tuple[str, str, Any], ...]] = (
+        ("url", FIELD_PRIMITIVE, ""),
+        ("concreteTypeName", FIELD_PRIMITIVE, ""),
+    )
+
+    # The url along with its path, location, location details and the integer
+    # values of the location details (the last three None if the url has no
+    # location). Filled in the first time any of them are needed, and again if
+    # the url changes.
+    _parsed: tuple[str, str, str | None, dict[str, list[str]] | None, dict[str, int] | None]
+
     @staticmethod
     def empty() -> "DocumentLocation":
         """Create a new "empty" instance
@@ -266,17 +285,58 @@ class DocumentLocation(XcresultObject):
         :returns: A new instance
         """
         instance = DocumentLocation.__new__(DocumentLocation)
-        instance.concreteTypeName = ""
-        instance.url = "file://#CharacterRangeLen=0&EndingColumnNumber=0&EndingLineNumber=0&StartingColumnNumber=0&StartingLineNumber=0"
+        # Bypasses __setattr__, which frozen models don't allow
+        object.__setattr__(instance, "concreteTypeName", "")
+        object.__setattr__(
+            instance,
+            "url",
+            "file://#CharacterRangeLen=0&EndingColumnNumber=0&EndingLineNumber=0&StartingColumnNumber=0&StartingLineNumber=0",
+        )
         return instance
 
+    def _parse(
+        self,
+    ) -> tuple[str, str, str | None, dict[str, list[str]] | None, dict[str, int] | None]:
+        """Parse the url, unless it has been parsed already.
+
+        :returns: The url, path, location, location details and the integer values
+            of the location details
+        """
+        try:
+            parsed = self._parsed
+            if parsed[0] == self.url:
+                return parsed
+        except AttributeError:
+            pass
+
+        url = self.url
+        components = url.split("#")
+        path = components[0].replace("file://", "")
+
+        if len(components) < 2:
+            parsed = (url, path, None, None, None)
+        else:
+            location = components[1]
+            details = urllib.parse.parse_qs(location)
+            values: dict[str, int] = {}
+            for key, value in details.items():
+                try:
+                    values[key] = int(value[0])
+                except ValueError:
+                    pass
+            parsed = (url, path, location, details, values)
+
+        # Bypasses __setattr__, which frozen models don't allow
+        object.__setattr__(self, "_parsed", parsed)
+        return parsed
+
     @property
     def path(self) -> str:
         """Get the path of the document if set, empty string otherwise.
 
         :returns: The path of the document
         """
-        return self.url.split("#", maxsplit=1)[0].replace("file://", "")
+        return self._parse()[1]
 
     @property
     def location(self) -> str:
@@ -284,7 +344,10 @@ class DocumentLocation(XcresultObject):
 
         :returns: The location inside the document
         """
-        return self.url.split("#")[1]
+        location = self._parse()[2]
+        if location is None:
+            raise IndexError(f"No location in {self.url}")
+        return location
 
     @property
     def location_details(self) -> dict[str, list[str]]:
@@ -292,7 +355,20 @@ class DocumentLocation(XcresultObject):
 
         :returns: The location parametersinside the document
         """
-        return urllib.parse.parse_qs(self.location)
+        details = self._parse()[3]
+        if details is None:
+            raise IndexError(f"No location in {self.url}")
+        return details
+
+    def _location_values(self) -> dict[str, int]:
+        """Get the integer values of the location details.
+
+        :returns: The values, by key
+        """
+        values = self._parse()[4]
+        if values is None:
+            raise IndexError(f"No location in {self.url}")
+        return values
 
     def _get_property(self, key: str, *, offset: int = 0) -> int | None:
         """Get a property from the location details.
@@ -302,10 +378,10 @@ class DocumentLocation(XcresultObject):
 
         :returns: The property as an int value if found, None otherwise
         """
-        value = self.location_details.get(key)
+        value = self._location_values().get(key)
         if value is None:
             return None
-        return int(value[0]) + offset
+        return value + offset
 
     @property
     def character_range_length(self) -> int:
@@ -313,7 +389,7 @@ class DocumentLocation(XcresultObject):
 
         :returns: The character range length
         """
-        return int(self.location_details["CharacterRangeLen"][0]) + 1
+        return self._location_values()["CharacterRangeLen"] + 1
 
     @property
     def character_range_location(self) -> int | None:
@@ -364,22 +440,10 @@ class DocumentLocation(XcresultObject):
         return self._get_property("StartingLineNumber", offset=1)
 
     def _members(self) -> tuple[Any, ...]:
-        properties: list[Any] = [
+        return (
             self.url,
             self.concreteTypeName,
-        ]
-        return tuple(properties + list(super()._members()))
-
-    def __eq__(self, other: Any) -> bool:
-        if not isinstance(other, self.__class__):
-            return False
-
-        # pylint: disable=protected-access
-        return self._members() == other._members()
-        # pylint: enable=protected-access
-
-    def __hash__(self) -> int:
-        return xchash(self)
+        )
 
 
 class EntityIdentifier(XcresultObject):
@@ -394,30 +458,32 @@ class EntityIdentifier(XcresultObject):
         + sharedState: String
     """
 
+    __slots__ = (
+        "entityName",
+        "containerName",
+        "entityType",
+        "sharedState",
+    )
+
     entityName: str
     containerName: str
     entityType: str
     sharedState: str
 
+    FIELDS: ClassVar[tuple[tuple[str, str, Any], ...]] = (
+        ("entityName", FIELD_PRIMITIVE, ""),
+        ("containerName", FIELD_PRIMITIVE, ""),
+        ("entityType", FIELD_PRIMITIVE, ""),
+        ("sharedState", FIELD_PRIMITIVE, ""),
+    )
+
     def _members(self) -> tuple[Any, ...]:
-        properties: list[Any] = [
+        return (
             self.entityName,
             self.containerName,
             self.entityType,
             self.sharedState,
-        ]
-        return tuple(properties + list(super()._members()))
-
-    def __eq__(self, other: Any) -> bool:
-        if not isinstance(other, self.__class__):
-            return False
-
-        # pylint: disable=protected-access
-        return self._members() == other._members()
-        # pylint: enable=protected-access
-
-    def __hash__(self) -> int:
-        return xchash(self)
+        )
 
 
 class ObjectID(XcresultObject):
@@ -429,24 +495,14 @@ class ObjectID(XcresultObject):
         + hash: String
     """
 
-    hash: str
-
-    def _members(self) -> tuple[Any, ...]:
-        properties: list[Any] = [
-            self.hash,
-        ]
-        return tuple(properties + list(super()._members()))
+    __slots__ = ("hash",)
 
-    def __eq__(self, other: Any) -> bool:
-        if not isinstance(other, self.__class__):
-            return False
+    hash: str
 
-        # pylint: disable=protected-access
-        return self._members() == other._members()
-        # pylint: enable=protected-access
+    FIELDS: ClassVar[tuple[tuple[str, str, Any], ...]] = (("hash", FIELD_PRIMITIVE, ""),)
 
-    def __hash__(self) -> int:
-        return xchash(self)
+    def _members(self) -> tuple[Any, ...]:
+        return (self.hash,)
 
 
 class SortedKeyValueArrayPair(XcresultObject):
@@ -459,26 +515,24 @@ class SortedKeyValueArrayPair(XcresultObject):
         + value: SchemaSerializable
     """
 
+    __slots__ = (
+        "key",
+        "value",
+    )
+
     key: str
     value: Any
 
+    FIELDS: ClassVar[tuple[tuple[str, str, Any], ...]] = (
+        ("key", FIELD_PRIMITIVE, ""),
+        ("value", FIELD_PRIMITIVE, REQUIRED),
+    )
+
     def _members(self) -> tuple[Any, ...]:
-        properties: list[Any] = [
+        return (
             self.key,
             self.value,
-        ]
-        return tuple(properties + list(super()._members()))
-
-    def __eq__(self, other: Any) -> bool:
-        if not isinstance(other, self.__class__):
-            return False
-
-        # pylint: disable=protected-access
-        return self._members() == other._members()
-        # pylint: enable=protected-access
-
-    def __hash__(self) -> int:
-        return xchash(self)
+        )
 
 
 class TestDocumentation(XcresultObject):
@@ -491,26 +545,24 @@ class TestDocumentation(XcresultObject):
         + format: String
     """
 
+    __slots__ = (
+        "content",
+        "format",
+    )
+
     content: str
     format: str
 
+    FIELDS: ClassVar[tuple[tuple[str, str, Any], ...]] = (
+        ("content", FIELD_PRIMITIVE, ""),
+        ("format", FIELD_PRIMITIVE, ""),
+    )
+
     def _members(self) -> tuple[Any, ...]:
-        properties: list[Any] = [
+        return (
             self.content,
             self.format,
-        ]
-        return tuple(properties + list(super()._members()))
-
-    def __eq__(self, other: Any) -> bool:
-        if not isinstance(other, self.__class__):
-            return False
-
-        # pylint: disable=protected-access
-        return self._members() == other._members()
-        # pylint: enable=protected-access
-
-    def __hash__(self) -> int:
-        return xchash(self)
+        )
 
 
 class TypeDefinition(XcresultObject):
@@ -523,26 +575,24 @@ class TypeDefinition(XcresultObject):
         + supertype: TypeDefinition?
     """
 
+    __slots__ = (
+        "name",
+        "supertype",
+    )
+
     name: str
     supertype: Optional["TypeDefinition"]
 
+    FIELDS: ClassVar[tuple[tuple[str, str, Any], ...]] = (
+        ("name", FIELD_PRIMITIVE, ""),
+        ("supertype", FIELD_OPTIONAL, None),
+    )
+
     def _members(self) -> tuple[Any, ...]:
-        properties: list[Any] = [
+        return (
             self.name,
             self.supertype,
-        ]
-        return tuple(properties + list(super()._members()))
-
-    def __eq__(self, other: Any) -> bool:
-        if not isinstance(other, self.__class__):
-            return False
-
-        # pylint: disable=protected-access
-        return self._members() == other._members()
-        # pylint: enable=protected-access
-
-    def __hash__(self) -> int:
-        return xchash(self)
+        )
 
 
 class ActionAbstractTestSummary(XcresultObject):
@@ -554,24 +604,14 @@ class ActionAbstractTestSummary(XcresultObject):
         + name: String?
     """
 
-    name: str | None
-
-    def _members(self) -> tuple[Any, ...]:
-        properties: list[Any] = [
-            self.name,
-        ]
-        return tuple(properties + list(super()._members()))
+    __slots__ = ("name",)
 
-    def __eq__(self, other: Any) -> bool:
-        if not isinstance(other, self.__class__):
-            return False
+    name: str | None
 
-        # pylint: disable=protected-access
-        return self._members() == other._members()
-        # pylint: enable=protected-access
+    FIELDS: ClassVar[tuple[tuple[str, str, Any], ...]] = (("name", FIELD_OPTIONAL, None),)
 
-    def __hash__(self) -> int:
-        return xchash(self)
+    def _members(self) -> tuple[Any, ...]:
+        return (self.name,)
 
 
 class ActionDeviceRecord(XcresultObject):
@@ -600,6 +640,27 @@ class ActionDeviceRecord(XcresultObject):
         + platformRecord: ActionPlatformRecord
     """
 
+    __slots__ = (
+        "name",
+        "isConcreteDevice",
+        "operatingSystemVersion",
+        "operatingSystemVersionWithBuildNumber",
+        "nativeArchitecture",
+        "modelName",
+        "modelCode",
+        "modelUTI",
+        "identifier",
+        "isWireless",
+        "cpuKind",
+        "cpuCount",
+        "cpuSpeedInMHz",
+        "busSpeedInMHz",
+        "ramSizeInMegabytes",
+        "physicalCPUCoresPerPackage",
+        "logicalCPUCoresPerPackage",
+        "platformRecord",
+    )
+
     name: str
     isConcreteDevice: bool
     operatingSystemVersion: str
@@ -619,8 +680,29 @@ class ActionDeviceRecord(XcresultObject):
     logicalCPUCoresPerPackage: int | None
     platformRecord: ActionPlatformRecord
 
+    FIELDS: ClassVar[tuple[tuple[str, str, Any], ...]] = (
+        ("name", FIELD_PRIMITIVE, ""),
+        ("isConcreteDevice", FIELD_PRIMITIVE, False),
+        ("operatingSystemVersion", FIELD_PRIMITIVE, ""),
+        ("operatingSystemVersionWithBuildNumber", FIELD_PRIMITIVE, ""),
+        ("nativeArchitecture", FIELD_PRIMITIVE, ""),
+        ("modelName", FIELD_PRIMITIVE, ""),
+        ("modelCode", FIELD_PRIMITIVE, ""),
+        ("modelUTI", FIELD_PRIMITIVE, ""),
+        ("identifier", FIELD_PRIMITIVE, ""),
+        ("isWireless", FIELD_PRIMITIVE, False),
+        ("cpuKind", FIELD_PRIMITIVE, ""),
+        ("cpuCount", FIELD_OPTIONAL, None),
+        ("cpuSpeedInMHz", FIELD_OPTIONAL, None),
+        ("busSpeedInMHz", FIELD_OPTIONAL, None),
+        ("ramSizeInMegabytes", FIELD_OPTIONAL, None),
+        ("physicalCPUCoresPerPackage", FIELD_OPTIONAL, None),
+        ("logicalCPUCoresPerPackage", FIELD_OPTIONAL, None),
+        ("platformRecord", FIELD_OBJECT, REQUIRED),
+    )
+
     def _members(self) -> tuple[Any, ...]:
-        properties: list[Any] = [
+        return (
             self.name,
             self.isConcreteDevice,
             self.operatingSystemVersion,
@@ -639,19 +721,7 @@ class ActionDeviceRecord(XcresultObject):
             self.physicalCPUCoresPerPackage,
             self.logicalCPUCoresPerPackage,
             self.platformRecord,
-        ]
-        return tuple(properties + list(super()._members()))
-
-    def __eq__(self, other: Any) -> bool:
-        if not isinstance(other, self.__class__):
-            return False
-
-        # pylint: disable=protected-access
-        return self._members() == other._members()
-        # pylint: enable=protected-access
-
-    def __hash__(self) -> int:
-        return xchash(self)
+        )
 
 
 class ActionTestNoticeSummary(XcresultObject):
@@ -666,30 +736,32 @@ class ActionTestNoticeSummary(XcresultObject):
         + timestamp: Date?
     """
 
+    __slots__ = (
+        "message",
+        "fileName",
+        "lineNumber",
+        "timestamp",
+    )
+
     message: str | None
     fileName: str
     lineNumber: int
     timestamp: datetime.datetime | None
 
+    FIELDS: ClassVar[tuple[tuple[str, str, Any], ...]] = (
+        ("message", FIELD_OPTIONAL, None),
+        ("fileName", FIELD_PRIMITIVE, ""),
+        ("lineNumber", FIELD_PRIMITIVE, 0),
+        ("timestamp", FIELD_OPTIONAL, None),
+    )
+
     def _members(self) -> tuple[Any, ...]:
-        properties: list[Any] = [
+        return (
             self.message,
             self.fileName,
             self.lineNumber,
             self.timestamp,
-        ]
-        return tuple(properties + list(super()._members()))
-
-    def __eq__(self, other: Any) -> bool:
-        if not isinstance(other, self.__class__):
-            return False
-
-        # pylint: disable=protected-access
-        return self._members() == other._members()
-        # pylint: enable=protected-access
-
-    def __hash__(self) -> int:
-        return xchash(self)
+        )
 
 
 class ActionTestPerformanceMetricSummary(XcresultObject):
@@ -711,6 +783,20 @@ class ActionTestPerformanceMetricSummary(XcresultObject):
         + polarity: String?
     """
 
+    __slots__ = (
+        "displayName",
+        "unitOfMeasurement",
+        "measurements",
+        "identifier",
+        "baselineName",
+        "baselineAverage",
+        "maxPercentRegression",
+        "maxPercentRelativeStandardDeviation",
+        "maxRegression",
+        "maxStandardDeviation",
+        "polarity",
+    )
+
     displayName: str
     unitOfMeasurement: str
     measurements: list[float]
@@ -723,8 +809,22 @@ class ActionTestPerformanceMetricSummary(XcresultObject):
     maxStandardDeviation: float | None
     polarity: str | None
 
+    FIELDS: ClassVar[tuple[tuple[str, str, Any], ...]] = (
+        ("displayName", FIELD_PRIMITIVE, ""),
+        ("unitOfMeasurement", FIELD_PRIMITIVE, ""),
+        ("measurements", FIELD_LIST, None),
+        ("identifier", FIELD_OPTIONAL, None),
+        ("baselineName", FIELD_OPTIONAL, None),
+        ("baselineAverage", FIELD_OPTIONAL, None),
+        ("maxPercentRegression", FIELD_OPTIONAL, None),
+        ("maxPercentRelativeStandardDeviation", FIELD_OPTIONAL, None),
+        ("maxRegression", FIELD_OPTIONAL, None),
+        ("maxStandardDeviation", FIELD_OPTIONAL, None),
+        ("polarity", FIELD_OPTIONAL, None),
+    )
+
     def _members(self) -> tuple[Any, ...]:
-        properties: list[Any] = [
+        return (
             self.displayName,
             self.unitOfMeasurement,
             self.measurements,
@@ -736,19 +836,7 @@ class ActionTestPerformanceMetricSummary(XcresultObject):
             self.maxRegression,
             self.maxStandardDeviation,
             self.polarity,
-        ]
-        return tuple(properties + list(super()._members()))
-
-    def __eq__(self, other: Any) -> bool:
-        if not isinstance(other, self.__class__):
-            return False
-
-        # pylint: disable=protected-access
-        return self._members() == other._members()
-        # pylint: enable=protected-access
-
-    def __hash__(self) -> int:
-        return xchash(self)
+        )
 
 
 class ActionTestRepetitionPolicySummary(XcresultObject):
@@ -762,28 +850,28 @@ class ActionTestRepetitionPolicySummary(XcresultObject):
         + repetitionMode: String?
     """
 
+    __slots__ = (
+        "iteration",
+        "totalIterations",
+        "repetitionMode",
+    )
+
     iteration: int | None
     totalIterations: int | None
     repetitionMode: str | None
 
+    FIELDS: ClassVar[tuple[tuple[str, str, Any], ...]] = (
+        ("iteration", FIELD_OPTIONAL, None),
+        ("totalIterations", FIELD_OPTIONAL, None),
+        ("repetitionMode", FIELD_OPTIONAL, None),
+    )
+
     def _members(self) -> tuple[Any, ...]:
-        properties: list[Any] = [
+        return (
             self.iteration,
             self.totalIterations,
             self.repetitionMode,
-        ]
-        return tuple(properties + list(super()._members()))
-
-    def __eq__(self, other: Any) -> bool:
-        if not isinstance(other, self.__class__):
-            return False
-
-        # pylint: disable=protected-access
-        return self._members() == other._members()
-        # pylint: enable=protected-access
-
-    def __hash__(self) -> int:
-        return xchash(self)
+        )
 
 
 class ActionsInvocationMetadata(XcresultObject):
@@ -797,28 +885,28 @@ class ActionsInvocationMetadata(XcresultObject):
         + schemeIdentifier: EntityIdentifier?
     """
 
+    __slots__ = (
+        "creatingWorkspaceFilePath",
+        "uniqueIdentifier",
+        "schemeIdentifier",
+    )
+
     creatingWorkspaceFilePath: str
     uniqueIdentifier: str
     schemeIdentifier: EntityIdentifier | None
 
+    FIELDS: ClassVar[tuple[tuple[str, str, Any], ...]] = (
+        ("creatingWorkspaceFilePath", FIELD_PRIMITIVE, ""),
+        ("uniqueIdentifier", FIELD_PRIMITIVE, ""),
+        ("schemeIdentifier", FIELD_OPTIONAL, None),
+    )
+
     def _members(self) -> tuple[Any, ...]:
-        properties: list[Any] = [
+        return (
             self.creatingWorkspaceFilePath,
             self.uniqueIdentifier,
             self.schemeIdentifier,
-        ]
-        return tuple(properties + list(super()._members()))
-
-    def __eq__(self, other: Any) -> bool:
-        if not isinstance(other, self.__class__):
-            return False
-
-        # pylint: disable=protected-access
-        return self._members() == other._members()
-        # pylint: enable=protected-access
-
-    def __hash__(self) -> int:
-        return xchash(self)
+        )
 
 
 class ActivityLogAnalyzerControlFlowStepEdge(XcresultObject):
@@ -831,26 +919,24 @@ class ActivityLogAnalyzerControlFlowStepEdge(XcresultObject):
         + endLocation: DocumentLocation?
     """
 
+    __slots__ = (
+        "startLocation",
+        "endLocation",
+    )
+
     startLocation: DocumentLocation | None
     endLocation: DocumentLocation | None
 
+    FIELDS: ClassVar[tuple[tuple[str, str, Any], ...]] = (
+        ("startLocation", FIELD_OPTIONAL, None),
+        ("endLocation", FIELD_OPTIONAL, None),
+    )
+
     def _members(self) -> tuple[Any, ...]:
-        properties: list[Any] = [
+        return (
             self.startLocation,
             self.endLocation,
-        ]
-        return tuple(properties + list(super()._members()))
-
-    def __eq__(self, other: Any) -> bool:
-        if not isinstance(other, self.__class__):
-            return False
-
-        # pylint: disable=protected-access
-        return self._members() == other._members()
-        # pylint: enable=protected-access
-
-    def __hash__(self) -> int:
-        return xchash(self)
+        )
 
 
 class ActivityLogAnalyzerEventStep(ActivityLogAnalyzerStep):
@@ -866,30 +952,34 @@ class ActivityLogAnalyzerEventStep(ActivityLogAnalyzerStep):
         + callDepth: Int
     """
 
+    __slots__ = (
+        "title",
+        "location",
+        "description",
+        "callDepth",
+    )
+
     title: str
     location: DocumentLocation | None
     description: str
     callDepth: int
 
+    FIELDS: ClassVar[tuple[tuple[str, str, Any], ...]] = (
+        ("title", FIELD_PRIMITIVE, ""),
+        ("location", FIELD_OPTIONAL, None),
+        ("description", FIELD_PRIMITIVE, ""),
+        ("callDepth", FIELD_PRIMITIVE, 0),
+        ("parentIndex", FIELD_PRIMITIVE, 0),
+    )
+
     def _members(self) -> tuple[Any, ...]:
-        properties: list[Any] = [
+        return (
             self.title,
             self.location,
             self.description,
             self.callDepth,
-        ]
-        return tuple(properties + list(super()._members()))
-
-    def __eq__(self, other: Any) -> bool:
-        if not isinstance(other, self.__class__):
-            return False
-
-        # pylint: disable=protected-access
-        return self._members() == other._members()
-        # pylint: enable=protected-access
-
-    def __hash__(self) -> int:
-        return xchash(self)
+            self.parentIndex,
+        )
 
 
 class ActivityLogMessageAnnotation(XcresultObject):
@@ -902,26 +992,24 @@ class ActivityLogMessageAnnotation(XcresultObject):
         + location: DocumentLocation?
     """
 
+    __slots__ = (
+        "title",
+        "location",
+    )
+
     title: str
     location: DocumentLocation | None
 
+    FIELDS: ClassVar[tuple[tuple[str, str, Any], ...]] = (
+        ("title", FIELD_PRIMITIVE, ""),
+        ("location", FIELD_OPTIONAL, None),
+    )
+
     def _members(self) -> tuple[Any, ...]:
-        properties: list[Any] = [
+        return (
             self.title,
             self.location,
-        ]
-        return tuple(properties + list(super()._members()))
-
-    def __eq__(self, other: Any) -> bool:
-        if not isinstance(other, self.__class__):
-            return False
-
-        # pylint: disable=protected-access
-        return self._members() == other._members()
-        # pylint: enable=protected-access
-
-    def __hash__(self) -> int:
-        return xchash(self)
+        )
 
 
 class ArchiveInfo(XcresultObject):
@@ -933,24 +1021,14 @@ class ArchiveInfo(XcresultObject):
         + path: String?
     """
 
-    path: str | None
+    __slots__ = ("path",)
 
-    def _members(self) -> tuple[Any, ...]:
-        properties: list[Any] = [
-            self.path,
-        ]
-        return tuple(properties + list(super()._members()))
-
-    def __eq__(self, other: Any) -> bool:
-        if not isinstance(other, self.__class__):
-            return False
+    path: str | None
 
-        # pylint: disable=protected-access
-        return self._members() == other._members()
-        # pylint: enable=protected-access
+    FIELDS: ClassVar[tuple[tuple[str, str, Any], ...]] = (("path", FIELD_OPTIONAL, None),)
 
-    def __hash__(self) -> int:
-        return xchash(self)
+    def _members(self) -> tuple[Any, ...]:
+        return (self.path,)
 
 
 class ConsoleLogItemLogData(XcresultObject):
@@ -977,6 +1055,25 @@ class ConsoleLogItemLogData(XcresultObject):
         + timeZone: String?
     """
 
+    __slots__ = (
+        "message",
+        "subsystem",
+        "category",
+        "library",
+        "format",
+        "backtrace",
+        "pid",
+        "processName",
+        "sessionUUID",
+        "tid",
+        "messageType",
+        "senderImagePath",
+        "senderImageUUID",
+        "senderImageOffset",
+        "unixTimeInterval",
+        "timeZone",
+    )
+
     message: str | None
     subsystem: str | None
     category: str | None
@@ -994,8 +1091,27 @@ class ConsoleLogItemLogData(XcresultObject):
     unixTimeInterval: float
     timeZone: str | None
 
+    FIELDS: ClassVar[tuple[tuple[str, str, Any], ...]] = (
+        ("message", FIELD_OPTIONAL, None),
+        ("subsystem", FIELD_OPTIONAL, None),
+        ("category", FIELD_OPTIONAL, None),
+        ("library", FIELD_OPTIONAL, None),
+        ("format", FIELD_OPTIONAL, None),
+        ("backtrace", FIELD_OPTIONAL, None),
+        ("pid", FIELD_PRIMITIVE, 0),
+        ("processName", FIELD_OPTIONAL, None),
+        ("sessionUUID", FIELD_OPTIONAL, None),
+        ("tid", FIELD_PRIMITIVE, 0),
+        ("messageType", FIELD_PRIMITIVE, 0),
+        ("senderImagePath", FIELD_OPTIONAL, None),
+        ("senderImageUUID", FIELD_OPTIONAL, None),
+        ("senderImageOffset", FIELD_PRIMITIVE, 0),
+        ("unixTimeInterval", FIELD_PRIMITIVE, 0.0),
+        ("timeZone", FIELD_OPTIONAL, None),
+    )
+
     def _members(self) -> tuple[Any, ...]:
-        properties: list[Any] = [
+        return (
             self.message,
             self.subsystem,
             self.category,
@@ -1012,19 +1128,7 @@ class ConsoleLogItemLogData(XcresultObject):
             self.senderImageOffset,
             self.unixTimeInterval,
             self.timeZone,
-        ]
-        return tuple(properties + list(super()._members()))
-
-    def __eq__(self, other: Any) -> bool:
-        if not isinstance(other, self.__class__):
-            return False
-
-        # pylint: disable=protected-access
-        return self._members() == other._members()
-        # pylint: enable=protected-access
-
-    def __hash__(self) -> int:
-        return xchash(self)
+        )
 
 
 class IssueSummary(XcresultObject):
@@ -1040,12 +1144,28 @@ class IssueSummary(XcresultObject):
         + documentLocationInCreatingWorkspace: DocumentLocation?
     """
 
+    __slots__ = (
+        "issueType",
+        "message",
+        "compactMessage",
+        "producingTarget",
+        "documentLocationInCreatingWorkspace",
+    )
+
     issueType: str
     message: str
     compactMessage: str | None
     producingTarget: str | None
     documentLocationInCreatingWorkspace: DocumentLocation | None
 
+    FIELDS: ClassVar[tuple[tuple[str, str, Any], ...]] = (
+        ("issueType", FIELD_PRIMITIVE, ""),
+        ("message", FIELD_PRIMITIVE, ""),
+        ("compactMessage", FIELD_OPTIONAL, None),
+        ("producingTarget", FIELD_OPTIONAL, None),
+        ("documentLocationInCreatingWorkspace", FIELD_OPTIONAL, None),
+    )
+
     def pretty_message(self, path_prefix: str | None) -> str:
         """Format the message nicely for review.
 
@@ -1064,25 +1184,13 @@ class IssueSummary(XcresultObject):
         return f"* [ERROR] {self.message}\n  Found in {relative_path}:{self.documentLocationInCreatingWorkspace.starting_line_number}:{self.documentLocationInCreatingWorkspace.starting_column_number}"
 
     def _members(self) -> tuple[Any, ...]:
-        properties: list[Any] = [
+        return (
             self.issueType,
             self.message,
             self.compactMessage,
             self.producingTarget,
             self.documentLocationInCreatingWorkspace,
-        ]
-        return tuple(properties + list(super()._members()))
-
-    def __eq__(self, other: Any) -> bool:
-        if not isinstance(other, self.__class__):
-            return False
-
-        # pylint: disable=protected-access
-        return self._members() == other._members()
-        # pylint: enable=protected-access
-
-    def __hash__(self) -> int:
-        return xchash(self)
+        )
 
 
 class IssueTrackingMetadata(XcresultObject):
@@ -1097,30 +1205,32 @@ class IssueTrackingMetadata(XcresultObject):
         + summary: String
     """
 
+    __slots__ = (
+        "identifier",
+        "url",
+        "comment",
+        "summary",
+    )
+
     identifier: str
     url: str | None
     comment: str | None
     summary: str
 
+    FIELDS: ClassVar[tuple[tuple[str, str, Any], ...]] = (
+        ("identifier", FIELD_PRIMITIVE, ""),
+        ("url", FIELD_OPTIONAL, None),
+        ("comment", FIELD_OPTIONAL, None),
+        ("summary", FIELD_PRIMITIVE, ""),
+    )
+
     def _members(self) -> tuple[Any, ...]:
-        properties: list[Any] = [
+        return (
             self.identifier,
             self.url,
             self.comment,
             self.summary,
-        ]
-        return tuple(properties + list(super()._members()))
-
-    def __eq__(self, other: Any) -> bool:
-        if not isinstance(other, self.__class__):
-            return False
-
-        # pylint: disable=protected-access
-        return self._members() == other._members()
-        # pylint: enable=protected-access
-
-    def __hash__(self) -> int:
-        return xchash(self)
+        )
 
 
 class Reference(XcresultObject):
@@ -1133,26 +1243,57 @@ class Reference(XcresultObject):
         + targetType: TypeDefinition?
     """
 
+    __slots__ = (
+        "id",
+        "targetType",
+        "_results",
+    )
+
     id: str
     targetType: TypeDefinition | None
 
-    def _members(self) -> tuple[Any, ...]:
-        properties: list[Any] = [
-            self.id,
-            self.targetType,
-        ]
-        return tuple(properties + list(super()._members()))
+    FIELDS: ClassVar[tuple[tuple[str, str, Any], ...]] = (
+        ("id", FIELD_PRIMITIVE, ""),
+        ("targetType", FIELD_OPTIONAL, None),
+    )
 
-    def __eq__(self, other: Any) -> bool:
-        if not isinstance(other, self.__class__):
-            return False
+    # The Xcresults this reference was read from, if any
+    _results: Any
 
-        # pylint: disable=protected-access
-        return self._members() == other._members()
-        # pylint: enable=protected-access
+    def resolve(self, results: Any = None) -> Any:
+        """Get the object this reference points to.
 
-    def __hash__(self) -> int:
-        return xchash(self)
+        The object is only fetched and deserialized when first asked for. After
+        that it comes from the object cache of the Xcresults, so resolving the
+        same reference again is free.
+
+        :param results: The Xcresults to load the object from. Defaults to the one
+            this reference was read from.
+
+        :returns: The deserialized object
+        """
+        if results is None:
+            results = getattr(self, "_results", None)
+
+        if results is None:
+            raise ValueError(f"Reference {self.id} was not read from an xcresult bundle")
+
+        return results.get_object(self.id)
+
+    def __getstate__(self) -> dict[str, Any]:
+        # The Xcresults holds locks and every cached object, so pickling or copying
+        # a reference leaves it out
+        return {name: getattr(self, name) for name, _, _ in self.FIELDS if hasattr(self, name)}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+
+    def _members(self) -> tuple[Any, ...]:
+        return (
+            self.id,
+            self.targetType,
+        )
 
 
 class ResultMetrics(XcresultObject):
@@ -1170,6 +1311,16 @@ class ResultMetrics(XcresultObject):
         + totalCoveragePercentage: Double?
     """
 
+    __slots__ = (
+        "analyzerWarningCount",
+        "errorCount",
+        "testsCount",
+        "testsFailedCount",
+        "testsSkippedCount",
+        "warningCount",
+        "totalCoveragePercentage",
+    )
+
     analyzerWarningCount: int
     errorCount: int
     testsCount: int
@@ -1178,8 +1329,18 @@ class ResultMetrics(XcresultObject):
     warningCount: int
     totalCoveragePercentage: float | None
 
+    FIELDS: ClassVar[tuple[tuple[str, str, Any], ...]] = (
+        ("analyzerWarningCount", FIELD_PRIMITIVE, 0),
+        ("errorCount", FIELD_PRIMITIVE, 0),
+        ("testsCount", FIELD_PRIMITIVE, 0),
+        ("testsFailedCount", FIELD_PRIMITIVE, 0),
+        ("testsSkippedCount", FIELD_PRIMITIVE, 0),
+        ("warningCount", FIELD_PRIMITIVE, 0),
+        ("totalCoveragePercentage", FIELD_OPTIONAL, None),
+    )
+
     def _members(self) -> tuple[Any, ...]:
-        properties: list[Any] = [
+        return (
             self.analyzerWarningCount,
             self.errorCount,
             self.testsCount,
@@ -1187,19 +1348,7 @@ class ResultMetrics(XcresultObject):
             self.testsSkippedCount,
             self.warningCount,
             self.totalCoveragePercentage,
-        ]
-        return tuple(properties + list(super()._members()))
-
-    def __eq__(self, other: Any) -> bool:
-        if not isinstance(other, self.__class__):
-            return False
-
-        # pylint: disable=protected-access
-        return self._members() == other._members()
-        # pylint: enable=protected-access
-
-    def __hash__(self) -> int:
-        return xchash(self)
+        )
 
 
 class SortedKeyValueArray(XcresultObject):
@@ -1211,24 +1360,14 @@ class SortedKeyValueArray(XcresultObject):
         + storage: [SortedKeyValueArrayPair]
     """
 
-    storage: list[SortedKeyValueArrayPair]
+    __slots__ = ("storage",)
 
-    def _members(self) -> tuple[Any, ...]:
-        properties: list[Any] = [
-            self.storage,
-        ]
-        return tuple(properties + list(super()._members()))
-
-    def __eq__(self, other: Any) -> bool:
-        if not isinstance(other, self.__class__):
-            return False
+    storage: list[SortedKeyValueArrayPair]
 
-        # pylint: disable=protected-access
-        return self._members() == other._members()
-        # pylint: enable=protected-access
+    FIELDS: ClassVar[tuple[tuple[str, str, Any], ...]] = (("storage", FIELD_LIST, None),)
 
-    def __hash__(self) -> int:
-        return xchash(self)
+    def _members(self) -> tuple[Any, ...]:
+        return (self.storage,)
 
 
 class SourceCodeLocation(XcresultObject):
@@ -1241,26 +1380,24 @@ class SourceCodeLocation(XcresultObject):
         + lineNumber: Int?
     """
 
+    __slots__ = (
+        "filePath",
+        "lineNumber",
+    )
+
     filePath: str | None
     lineNumber: int | None
 
+    FIELDS: ClassVar[tuple[tuple[str, str, Any], ...]] = (
+        ("filePath", FIELD_OPTIONAL, None),
+        ("lineNumber", FIELD_OPTIONAL, None),
+    )
+
     def _members(self) -> tuple[Any, ...]:
-        properties: list[Any] = [
+        return (
             self.filePath,
             self.lineNumber,
-        ]
-        return tuple(properties + list(super()._members()))
-
-    def __eq__(self, other: Any) -> bool:
-        if not isinstance(other, self.__class__):
-            return False
-
-        # pylint: disable=protected-access
-        return self._members() == other._members()
-        # pylint: enable=protected-access
-
-    def __hash__(self) -> int:
-        return xchash(self)
+        )
 
 
 class TestParameter(XcresultObject):
@@ -1275,30 +1412,32 @@ class TestParameter(XcresultObject):
         + fullyQualifiedTypeName: String?
     """
 
+    __slots__ = (
+        "label",
+        "name",
+        "typeName",
+        "fullyQualifiedTypeName",
+    )
+
     label: str
     name: str | None
     typeName: str | None
     fullyQualifiedTypeName: str | None
 
+    FIELDS: ClassVar[tuple[tuple[str, str, Any], ...]] = (
+        ("label", FIELD_PRIMITIVE, ""),
+        ("name", FIELD_OPTIONAL, None),
+        ("typeName", FIELD_OPTIONAL, None),
+        ("fullyQualifiedTypeName", FIELD_OPTIONAL, None),
+    )
+
     def _members(self) -> tuple[Any, ...]:
-        properties: list[Any] = [
+        return (
             self.label,
             self.name,
             self.typeName,
             self.fullyQualifiedTypeName,
-        ]
-        return tuple(properties + list(super()._members()))
-
-    def __eq__(self, other: Any) -> bool:
-        if not isinstance(other, self.__class__):
-            return False
-
-        # pylint: disable=protected-access
-        return self._members() == other._members()
-        # pylint: enable=protected-access
-
-    def __hash__(self) -> int:
-        return xchash(self)
+        )
 
 
 class TestTag(XcresultObject):
@@ -1312,28 +1451,28 @@ class TestTag(XcresultObject):
         + anchors: [String]
     """
 
+    __slots__ = (
+        "identifier",
+        "name",
+        "anchors",
+    )
+
     identifier: str
     name: str
     anchors: list[str]
 
+    FIELDS: ClassVar[tuple[tuple[str, str, Any], ...]] = (
+        ("identifier", FIELD_PRIMITIVE, ""),
+        ("name", FIELD_PRIMITIVE, ""),
+        ("anchors", FIELD_LIST, None),
+    )
+
     def _members(self) -> tuple[Any, ...]:
-        properties: list[Any] = [
+        return (
             self.identifier,
             self.name,
             self.anchors,
-        ]
-        return tuple(properties + list(super()._members()))
-
-    def __eq__(self, other: Any) -> bool:
-        if not isinstance(other, self.__class__):
-            return False
-
-        # pylint: disable=protected-access
-        return self._members() == other._members()
-        # pylint: enable=protected-access
-
-    def __hash__(self) -> int:
-        return xchash(self)
+        )
 
 
 class TestValue(XcresultObject):
@@ -1351,6 +1490,16 @@ class TestValue(XcresultObject):
         + children: TestValue?
     """
 
+    __slots__ = (
+        "description",
+        "debugDescription",
+        "typeName",
+        "fullyQualifiedTypeName",
+        "label",
+        "isCollection",
+        "children",
+    )
+
     description: str
     debugDescription: str | None
     typeName: str | None
@@ -1359,8 +1508,18 @@ class TestValue(XcresultObject):
     isCollection: bool
     children: Optional["TestValue"]
 
+    FIELDS: ClassVar[tuple[tuple[str, str, Any], ...]] = (
+        ("description", FIELD_PRIMITIVE, ""),
+        ("debugDescription", FIELD_OPTIONAL, None),
+        ("typeName", FIELD_OPTIONAL, None),
+        ("fullyQualifiedTypeName", FIELD_OPTIONAL, None),
+        ("label", FIELD_OPTIONAL, None),
+        ("isCollection", FIELD_PRIMITIVE, False),
+        ("children", FIELD_OPTIONAL, None),
+    )
+
     def _members(self) -> tuple[Any, ...]:
-        properties: list[Any] = [
+        return (
             self.description,
             self.debugDescription,
             self.typeName,
@@ -1368,19 +1527,7 @@ class TestValue(XcresultObject):
             self.label,
             self.isCollection,
             self.children,
-        ]
-        return tuple(properties + list(super()._members()))
-
-    def __eq__(self, other: Any) -> bool:
-        if not isinstance(other, self.__class__):
-            return False
-
-        # pylint: disable=protected-access
-        return self._members() == other._members()
-        # pylint: enable=protected-access
-
-    def __hash__(self) -> int:
-        return xchash(self)
+        )
 
 
 class ActionRunDestinationRecord(XcresultObject):
@@ -1396,32 +1543,36 @@ class ActionRunDestinationRecord(XcresultObject):
         + targetSDKRecord: ActionSDKRecord
     """
 
+    __slots__ = (
+        "displayName",
+        "targetArchitecture",
+        "targetDeviceRecord",
+        "localComputerRecord",
+        "targetSDKRecord",
+    )
+
     displayName: str
     targetArchitecture: str
     targetDeviceRecord: ActionDeviceRecord
     localComputerRecord: ActionDeviceRecord
     targetSDKRecord: ActionSDKRecord
 
+    FIELDS: ClassVar[tuple[tuple[str, str, Any], ...]] = (
+        ("displayName", FIELD_PRIMITIVE, ""),
+        ("targetArchitecture", FIELD_PRIMITIVE, ""),
+        ("targetDeviceRecord", FIELD_OBJECT, REQUIRED),
+        ("localComputerRecord", FIELD_OBJECT, REQUIRED),
+        ("targetSDKRecord", FIELD_OBJECT, REQUIRED),
+    )
+
     def _members(self) -> tuple[Any, ...]:
-        properties: list[Any] = [
+        return (
             self.displayName,
             self.targetArchitecture,
             self.targetDeviceRecord,
             self.localComputerRecord,
             self.targetSDKRecord,
-        ]
-        return tuple(properties + list(super()._members()))
-
-    def __eq__(self, other: Any) -> bool:
-        if not isinstance(other, self.__class__):
-            return False
-
-        # pylint: disable=protected-access
-        return self._members() == other._members()
-        # pylint: enable=protected-access
-
-    def __hash__(self) -> int:
-        return xchash(self)
+        )
 
 
 class ActionTestAttachment(XcresultObject):
@@ -1442,6 +1593,19 @@ class ActionTestAttachment(XcresultObject):
         + payloadSize: Int
     """
 
+    __slots__ = (
+        "uniformTypeIdentifier",
+        "name",
+        "uuid",
+        "timestamp",
+        "userInfo",
+        "lifetime",
+        "inActivityIdentifier",
+        "filename",
+        "payloadRef",
+        "payloadSize",
+    )
+
     uniformTypeIdentifier: str
     name: str | None
     uuid: str | None
@@ -1453,8 +1617,21 @@ class ActionTestAttachment(XcresultObject):
     payloadRef: Reference | None
     payloadSize: int
 
+    FIELDS: ClassVar[tuple[tuple[str, str, Any], ...]] = (
+        ("uniformTypeIdentifier", FIELD_PRIMITIVE, ""),
+        ("name", FIELD_OPTIONAL, None),
+        ("uuid", FIELD_OPTIONAL, None),
+        ("timestamp", FIELD_OPTIONAL, None),
+        ("userInfo", FIELD_OPTIONAL, None),
+        ("lifetime", FIELD_PRIMITIVE, ""),
+        ("inActivityIdentifier", FIELD_PRIMITIVE, 0),
+        ("filename", FIELD_OPTIONAL, None),
+        ("payloadRef", FIELD_OPTIONAL, None),
+        ("payloadSize", FIELD_PRIMITIVE, 0),
+    )
+
     def _members(self) -> tuple[Any, ...]:
-        properties: list[Any] = [
+        return (
             self.uniformTypeIdentifier,
             self.name,
             self.uuid,
@@ -1465,19 +1642,7 @@ class ActionTestAttachment(XcresultObject):
             self.filename,
             self.payloadRef,
             self.payloadSize,
-        ]
-        return tuple(properties + list(super()._members()))
-
-    def __eq__(self, other: Any) -> bool:
-        if not isinstance(other, self.__class__):
-            return False
-
-        # pylint: disable=protected-access
-        return self._members() == other._members()
-        # pylint: enable=protected-access
-
-    def __hash__(self) -> int:
-        return xchash(self)
+        )
 
 
 class ActionTestConfiguration(XcresultObject):
@@ -1489,24 +1654,14 @@ class ActionTestConfiguration(XcresultObject):
         + values: SortedKeyValueArray
     """
 
-    values: SortedKeyValueArray
-
-    def _members(self) -> tuple[Any, ...]:
-        properties: list[Any] = [
-            self.values,
-        ]
-        return tuple(properties + list(super()._members()))
+    __slots__ = ("values",)
 
-    def __eq__(self, other: Any) -> bool:
-        if not isinstance(other, self.__class__):
-            return False
+    values: SortedKeyValueArray
 
-        # pylint: disable=protected-access
-        return self._members() == other._members()
-        # pylint: enable=protected-access
+    FIELDS: ClassVar[tuple[tuple[str, str, Any], ...]] = (("values", FIELD_OBJECT, REQUIRED),)
 
-    def __hash__(self) -> int:
-        return xchash(self)
+    def _members(self) -> tuple[Any, ...]:
+        return (self.values,)
 
 
 class ActionTestSummaryIdentifiableObject(ActionAbstractTestSummary):
@@ -1520,26 +1675,26 @@ class ActionTestSummaryIdentifiableObject(ActionAbstractTestSummary):
         + identifierURL: String?
     """
 
+    __slots__ = (
+        "identifier",
+        "identifierURL",
+    )
+
     identifier: str | None
     identifierURL: str | None
 
+    FIELDS: ClassVar[tuple[tuple[str, str, Any], ...]] = (
+        ("identifier", FIELD_OPTIONAL, None),
+        ("identifierURL", FIELD_OPTIONAL, None),
+        ("name", FIELD_OPTIONAL, None),
+    )
+
     def _members(self) -> tuple[Any, ...]:
-        properties: list[Any] = [
+        return (
             self.identifier,
             self.identifierURL,
-        ]
-        return tuple(properties + list(super()._members()))
-
-    def __eq__(self, other: Any) -> bool:
-        if not isinstance(other, self.__class__):
-            return False
-
-        # pylint: disable=protected-access
-        return self._members() == other._members()
-        # pylint: enable=protected-access
-
-    def __hash__(self) -> int:
-        return xchash(self)
+            self.name,
+        )
 
 
 class ActivityLogAnalyzerControlFlowStep(ActivityLogAnalyzerStep):
@@ -1555,30 +1710,34 @@ class ActivityLogAnalyzerControlFlowStep(ActivityLogAnalyzerStep):
         + edges: [ActivityLogAnalyzerControlFlowStepEdge]
     """
 
+    __slots__ = (
+        "title",
+        "startLocation",
+        "endLocation",
+        "edges",
+    )
+
     title: str
     startLocation: DocumentLocation | None
     endLocation: DocumentLocation | None
     edges: list[ActivityLogAnalyzerControlFlowStepEdge]
 
+    FIELDS: ClassVar[tuple[tuple[str, str, Any], ...]] = (
+        ("title", FIELD_PRIMITIVE, ""),
+        ("startLocation", FIELD_OPTIONAL, None),
+        ("endLocation", FIELD_OPTIONAL, None),
+        ("edges", FIELD_LIST, None),
+        ("parentIndex", FIELD_PRIMITIVE, 0),
+    )
+
     def _members(self) -> tuple[Any, ...]:
-        properties: list[Any] = [
+        return (
             self.title,
             self.startLocation,
             self.endLocation,
             self.edges,
-        ]
-        return tuple(properties + list(super()._members()))
-
-    def __eq__(self, other: Any) -> bool:
-        if not isinstance(other, self.__class__):
-            return False
-
-        # pylint: disable=protected-access
-        return self._members() == other._members()
-        # pylint: enable=protected-access
-
-    def __hash__(self) -> int:
-        return xchash(self)
+            self.parentIndex,
+        )
 
 
 class ActivityLogMessage(XcresultObject):
@@ -1595,6 +1754,15 @@ class ActivityLogMessage(XcresultObject):
         + annotations: [ActivityLogMessageAnnotation]
     """
 
+    __slots__ = (
+        "type",
+        "title",
+        "shortTitle",
+        "category",
+        "location",
+        "annotations",
+    )
+
     type: str
     title: str
     shortTitle: str | None
@@ -1602,27 +1770,24 @@ class ActivityLogMessage(XcresultObject):
     location: DocumentLocation | None
     annotations: list[ActivityLogMessageAnnotation]
 
+    FIELDS: ClassVar[tuple[tuple[str, str, Any], ...]] = (
+        ("type", FIELD_PRIMITIVE, ""),
+        ("title", FIELD_PRIMITIVE, ""),
+        ("shortTitle", FIELD_OPTIONAL, None),
+        ("category", FIELD_OPTIONAL, None),
+        ("location", FIELD_OPTIONAL, None),
+        ("annotations", FIELD_LIST, None),
+    )
+
     def _members(self) -> tuple[Any, ...]:
-        properties: list[Any] = [
+        return (
             self.type,
             self.title,
             self.shortTitle,
             self.category,
             self.location,
-            self.annotations,
-        ]
-        return tuple(properties + list(super()._members()))
-
-    def __eq__(self, other: Any) -> bool:
-        if not isinstance(other, self.__class__):
-            return False
-
-        # pylint: disable=protected-access
-        return self._members() == other._members()
-        # pylint: enable=protected-access
-
-    def __hash__(self) -> int:
-        return xchash(self)
+            self.annotations,
+        )
 
 
 class CodeCoverageInfo(XcresultObject):
@@ -1636,28 +1801,28 @@ class CodeCoverageInfo(XcresultObject):
         + archiveRef: Reference?
     """
 
+    __slots__ = (
+        "hasCoverageData",
+        "reportRef",
+        "archiveRef",
+    )
+
     hasCoverageData: bool
     reportRef: Reference | None
     archiveRef: Reference | None
 
+    FIELDS: ClassVar[tuple[tuple[str, str, Any], ...]] = (
+        ("hasCoverageData", FIELD_PRIMITIVE, False),
+        ("reportRef", FIELD_OPTIONAL, None),
+        ("archiveRef", FIELD_OPTIONAL, None),
+    )
+
     def _members(self) -> tuple[Any, ...]:
-        properties: list[Any] = [
+        return (
             self.hasCoverageData,
             self.reportRef,
             self.archiveRef,
-        ]
-        return tuple(properties + list(super()._members()))
-
-    def __eq__(self, other: Any) -> bool:
-        if not isinstance(other, self.__class__):
-            return False
-
-        # pylint: disable=protected-access
-        return self._members() == other._members()
-        # pylint: enable=protected-access
-
-    def __hash__(self) -> int:
-        return xchash(self)
+        )
 
 
 class ConsoleLogItem(XcresultObject):
@@ -1673,32 +1838,36 @@ class ConsoleLogItem(XcresultObject):
         + logData: ConsoleLogItemLogData?
     """
 
+    __slots__ = (
+        "adaptorType",
+        "kind",
+        "timestamp",
+        "content",
+        "logData",
+    )
+
     adaptorType: str | None
     kind: str | None
     timestamp: float
     content: str
     logData: ConsoleLogItemLogData | None
 
+    FIELDS: ClassVar[tuple[tuple[str, str, Any], ...]] = (
+        ("adaptorType", FIELD_OPTIONAL, None),
+        ("kind", FIELD_OPTIONAL, None),
+        ("timestamp", FIELD_PRIMITIVE, 0.0),
+        ("content", FIELD_PRIMITIVE, ""),
+        ("logData", FIELD_OPTIONAL, None),
+    )
+
     def _members(self) -> tuple[Any, ...]:
-        properties: list[Any] = [
+        return (
             self.adaptorType,
             self.kind,
             self.timestamp,
             self.content,
             self.logData,
-        ]
-        return tuple(properties + list(super()._members()))
-
-    def __eq__(self, other: Any) -> bool:
-        if not isinstance(other, self.__class__):
-            return False
-
-        # pylint: disable=protected-access
-        return self._members() == other._members()
-        # pylint: enable=protected-access
-
-    def __hash__(self) -> int:
-        return xchash(self)
+        )
 
 
 class SourceCodeSymbolInfo(XcresultObject):
@@ -1712,28 +1881,28 @@ class SourceCodeSymbolInfo(XcresultObject):
         + location: SourceCodeLocation?
     """
 
+    __slots__ = (
+        "imageName",
+        "symbolName",
+        "location",
+    )
+
     imageName: str | None
     symbolName: str | None
     location: SourceCodeLocation | None
 
+    FIELDS: ClassVar[tuple[tuple[str, str, Any], ...]] = (
+        ("imageName", FIELD_OPTIONAL, None),
+        ("symbolName", FIELD_OPTIONAL, None),
+        ("location", FIELD_OPTIONAL, None),
+    )
+
     def _members(self) -> tuple[Any, ...]:
-        properties: list[Any] = [
+        return (
             self.imageName,
             self.symbolName,
             self.location,
-        ]
-        return tuple(properties + list(super()._members()))
-
-    def __eq__(self, other: Any) -> bool:
-        if not isinstance(other, self.__class__):
-            return False
-
-        # pylint: disable=protected-access
-        return self._members() == other._members()
-        # pylint: enable=protected-access
-
-    def __hash__(self) -> int:
-        return xchash(self)
+        )
 
 
 class TestArgument(XcresultObject):
@@ -1750,6 +1919,15 @@ class TestArgument(XcresultObject):
         + value: TestValue
     """
 
+    __slots__ = (
+        "parameter",
+        "identifier",
+        "description",
+        "debugDescription",
+        "typeName",
+        "value",
+    )
+
     parameter: TestParameter | None
     identifier: str | None
     description: str
@@ -1757,27 +1935,24 @@ class TestArgument(XcresultObject):
     typeName: str | None
     value: TestValue
 
+    FIELDS: ClassVar[tuple[tuple[str, str, Any], ...]] = (
+        ("parameter", FIELD_OPTIONAL, None),
+        ("identifier", FIELD_OPTIONAL, None),
+        ("description", FIELD_PRIMITIVE, ""),
+        ("debugDescription", FIELD_OPTIONAL, None),
+        ("typeName", FIELD_OPTIONAL, None),
+        ("value", FIELD_OBJECT, REQUIRED),
+    )
+
     def _members(self) -> tuple[Any, ...]:
-        properties: list[Any] = [
+        return (
             self.parameter,
             self.identifier,
             self.description,
             self.debugDescription,
             self.typeName,
             self.value,
-        ]
-        return tuple(properties + list(super()._members()))
-
-    def __eq__(self, other: Any) -> bool:
-        if not isinstance(other, self.__class__):
-            return False
-
-        # pylint: disable=protected-access
-        return self._members() == other._members()
-        # pylint: enable=protected-access
-
-    def __hash__(self) -> int:
-        return xchash(self)
+        )
 
 
 class TestAssociatedError(XcresultObject):
@@ -1791,28 +1966,28 @@ class TestAssociatedError(XcresultObject):
         + userInfo: SortedKeyValueArray?
     """
 
+    __slots__ = (
+        "domain",
+        "code",
+        "userInfo",
+    )
+
     domain: str | None
     code: int | None
     userInfo: SortedKeyValueArray | None
 
+    FIELDS: ClassVar[tuple[tuple[str, str, Any], ...]] = (
+        ("domain", FIELD_OPTIONAL, None),
+        ("code", FIELD_OPTIONAL, None),
+        ("userInfo", FIELD_OPTIONAL, None),
+    )
+
     def _members(self) -> tuple[Any, ...]:
-        properties: list[Any] = [
+        return (
             self.domain,
             self.code,
             self.userInfo,
-        ]
-        return tuple(properties + list(super()._members()))
-
-    def __eq__(self, other: Any) -> bool:
-        if not isinstance(other, self.__class__):
-            return False
-
-        # pylint: disable=protected-access
-        return self._members() == other._members()
-        # pylint: enable=protected-access
-
-    def __hash__(self) -> int:
-        return xchash(self)
+        )
 
 
 class TestExpression(XcresultObject):
@@ -1826,28 +2001,28 @@ class TestExpression(XcresultObject):
         + subexpressions: [TestExpression]
     """
 
+    __slots__ = (
+        "sourceCode",
+        "value",
+        "subexpressions",
+    )
+
     sourceCode: str
     value: TestValue | None
     subexpressions: list["TestExpression"]
 
+    FIELDS: ClassVar[tuple[tuple[str, str, Any], ...]] = (
+        ("sourceCode", FIELD_PRIMITIVE, ""),
+        ("value", FIELD_OPTIONAL, None),
+        ("subexpressions", FIELD_LIST, None),
+    )
+
     def _members(self) -> tuple[Any, ...]:
-        properties: list[Any] = [
+        return (
             self.sourceCode,
             self.value,
             self.subexpressions,
-        ]
-        return tuple(properties + list(super()._members()))
-
-    def __eq__(self, other: Any) -> bool:
-        if not isinstance(other, self.__class__):
-            return False
-
-        # pylint: disable=protected-access
-        return self._members() == other._members()
-        # pylint: enable=protected-access
-
-    def __hash__(self) -> int:
-        return xchash(self)
+        )
 
 
 class TestFailureIssueSummary(IssueSummary):
@@ -1860,8 +2035,19 @@ class TestFailureIssueSummary(IssueSummary):
         + testCaseName: String
     """
 
+    __slots__ = ("testCaseName",)
+
     testCaseName: str
 
+    FIELDS: ClassVar[tuple[tuple[str, str, Any], ...]] = (
+        ("testCaseName", FIELD_PRIMITIVE, ""),
+        ("issueType", FIELD_PRIMITIVE, ""),
+        ("message", FIELD_PRIMITIVE, ""),
+        ("compactMessage", FIELD_OPTIONAL, None),
+        ("producingTarget", FIELD_OPTIONAL, None),
+        ("documentLocationInCreatingWorkspace", FIELD_OPTIONAL, None),
+    )
+
     def pretty_message(self, path_prefix: str | None) -> str:
         """Format the message nicely for review.
 
@@ -1892,21 +2078,14 @@ class TestFailureIssueSummary(IssueSummary):
         # pylint: enable=no-member
 
     def _members(self) -> tuple[Any, ...]:
-        properties: list[Any] = [
+        return (
             self.testCaseName,
-        ]
-        return tuple(properties + list(super()._members()))
-
-    def __eq__(self, other: Any) -> bool:
-        if not isinstance(other, self.__class__):
-            return False
-
-        # pylint: disable=protected-access
-        return self._members() == other._members()
-        # pylint: enable=protected-access
-
-    def __hash__(self) -> int:
-        return xchash(self)
+            self.issueType,
+            self.message,
+            self.compactMessage,
+            self.producingTarget,
+            self.documentLocationInCreatingWorkspace,
+        )
 
 
 class TestIssueSummary(IssueSummary):
@@ -1919,24 +2098,28 @@ class TestIssueSummary(IssueSummary):
         + testCaseName: String
     """
 
+    __slots__ = ("testCaseName",)
+
     testCaseName: str
 
+    FIELDS: ClassVar[tuple[tuple[str, str, Any], ...]] = (
+        ("testCaseName", FIELD_PRIMITIVE, ""),
+        ("issueType", FIELD_PRIMITIVE, ""),
+        ("message", FIELD_PRIMITIVE, ""),
+        ("compactMessage", FIELD_OPTIONAL, None),
+        ("producingTarget", FIELD_OPTIONAL, None),
+        ("documentLocationInCreatingWorkspace", FIELD_OPTIONAL, None),
+    )
+
     def _members(self) -> tuple[Any, ...]:
-        properties: list[Any] = [
+        return (
             self.testCaseName,
-        ]
-        return tuple(properties + list(super()._members()))
-
-    def __eq__(self, other: Any) -> bool:
-        if not isinstance(other, self.__class__):
-            return False
-
-        # pylint: disable=protected-access
-        return self._members() == other._members()
-        # pylint: enable=protected-access
-
-    def __hash__(self) -> int:
-        return xchash(self)
+            self.issueType,
+            self.message,
+            self.compactMessage,
+            self.producingTarget,
+            self.documentLocationInCreatingWorkspace,
+        )
 
 
 class ActionTestActivitySummary(XcresultObject):
@@ -1957,6 +2140,19 @@ class ActionTestActivitySummary(XcresultObject):
         + warningSummaryIDs: [String]
     """
 
+    __slots__ = (
+        "title",
+        "activityType",
+        "uuid",
+        "start",
+        "finish",
+        "attachments",
+        "subactivities",
+        "failureSummaryIDs",
+        "expectedFailureIDs",
+        "warningSummaryIDs",
+    )
+
     title: str
     activityType: str
     uuid: str
@@ -1968,8 +2164,21 @@ class ActionTestActivitySummary(XcresultObject):
     expectedFailureIDs: list[str]
     warningSummaryIDs: list[str]
 
+    FIELDS: ClassVar[tuple[tuple[str, str, Any], ...]] = (
+        ("title", FIELD_PRIMITIVE, ""),
+        ("activityType", FIELD_PRIMITIVE, ""),
+        ("uuid", FIELD_PRIMITIVE, ""),
+        ("start", FIELD_OPTIONAL, None),
+        ("finish", FIELD_OPTIONAL, None),
+        ("attachments", FIELD_LIST, None),
+        ("subactivities", FIELD_LIST, None),
+        ("failureSummaryIDs", FIELD_LIST, None),
+        ("expectedFailureIDs", FIELD_LIST, None),
+        ("warningSummaryIDs", FIELD_LIST, None),
+    )
+
     def _members(self) -> tuple[Any, ...]:
-        properties: list[Any] = [
+        return (
             self.title,
             self.activityType,
             self.uuid,
@@ -1980,19 +2189,7 @@ class ActionTestActivitySummary(XcresultObject):
             self.failureSummaryIDs,
             self.expectedFailureIDs,
             self.warningSummaryIDs,
-        ]
-        return tuple(properties + list(super()._members()))
-
-    def __eq__(self, other: Any) -> bool:
-        if not isinstance(other, self.__class__):
-            return False
-
-        # pylint: disable=protected-access
-        return self._members() == other._members()
-        # pylint: enable=protected-access
-
-    def __hash__(self) -> int:
-        return xchash(self)
+        )
 
 
 class ActionTestMetadata(ActionTestSummaryIdentifiableObject):
@@ -2010,6 +2207,15 @@ class ActionTestMetadata(ActionTestSummaryIdentifiableObject):
         + activitySummariesCount: Int
     """
 
+    __slots__ = (
+        "testStatus",
+        "duration",
+        "summaryRef",
+        "performanceMetricsCount",
+        "failureSummariesCount",
+        "activitySummariesCount",
+    )
+
     testStatus: str
     duration: float | None
     summaryRef: Reference | None
@@ -2017,6 +2223,25 @@ class ActionTestMetadata(ActionTestSummaryIdentifiableObject):
     failureSummariesCount: int
     activitySummariesCount: int
 
+    FIELDS: ClassVar[tuple[tuple[str, str, Any], ...]] = (
+        ("testStatus", FIELD_PRIMITIVE, ""),
+        ("duration", FIELD_OPTIONAL, None),
+        ("summaryRef", FIELD_OPTIONAL, None),
+        ("performanceMetricsCount", FIELD_PRIMITIVE, 0),
+        ("failureSummariesCount", FIELD_PRIMITIVE, 0),
+        ("activitySummariesCount", FIELD_PRIMITIVE, 0),
+        ("identifier", FIELD_OPTIONAL, None),
+        ("identifierURL", FIELD_OPTIONAL, None),
+        ("name", FIELD_OPTIONAL, None),
+    )
+
+    def iter_subtests(self) -> Iterator[ActionTestSummaryIdentifiableObject]:
+        """Iterate over all subtests.
+
+        :returns: An iterator over all subtests - just self in this case
+        """
+        yield self
+
     def all_subtests(self) -> list[ActionTestSummaryIdentifiableObject]:
         """Get all subtests.
 
@@ -2025,26 +2250,17 @@ class ActionTestMetadata(ActionTestSummaryIdentifiableObject):
         return [self]
 
     def _members(self) -> tuple[Any, ...]:
-        properties: list[Any] = [
+        return (
             self.testStatus,
             self.duration,
             self.summaryRef,
             self.performanceMetricsCount,
             self.failureSummariesCount,
             self.activitySummariesCount,
-        ]
-        return tuple(properties + list(super()._members()))
-
-    def __eq__(self, other: Any) -> bool:
-        if not isinstance(other, self.__class__):
-            return False
-
-        # pylint: disable=protected-access
-        return self._members() == other._members()
-        # pylint: enable=protected-access
-
-    def __hash__(self) -> int:
-        return xchash(self)
+            self.identifier,
+            self.identifierURL,
+            self.name,
+        )
 
 
 class ActivityLogAnalyzerResultMessage(ActivityLogMessage):
@@ -2059,28 +2275,40 @@ class ActivityLogAnalyzerResultMessage(ActivityLogMessage):
         + keyEventIndex: Int
     """
 
+    __slots__ = (
+        "steps",
+        "resultType",
+        "keyEventIndex",
+    )
+
     steps: list[ActivityLogAnalyzerStep]
     resultType: str | None
     keyEventIndex: int
 
+    FIELDS: ClassVar[tuple[tuple[str, str, Any], ...]] = (
+        ("steps", FIELD_LIST, None),
+        ("resultType", FIELD_OPTIONAL, None),
+        ("keyEventIndex", FIELD_PRIMITIVE, 0),
+        ("type", FIELD_PRIMITIVE, ""),
+        ("title", FIELD_PRIMITIVE, ""),
+        ("shortTitle", FIELD_OPTIONAL, None),
+        ("category", FIELD_OPTIONAL, None),
+        ("location", FIELD_OPTIONAL, None),
+        ("annotations", FIELD_LIST, None),
+    )
+
     def _members(self) -> tuple[Any, ...]:
-        properties: list[Any] = [
+        return (
             self.steps,
             self.resultType,
             self.keyEventIndex,
-        ]
-        return tuple(properties + list(super()._members()))
-
-    def __eq__(self, other: Any) -> bool:
-        if not isinstance(other, self.__class__):
-            return False
-
-        # pylint: disable=protected-access
-        return self._members() == other._members()
-        # pylint: enable=protected-access
-
-    def __hash__(self) -> int:
-        return xchash(self)
+            self.type,
+            self.title,
+            self.shortTitle,
+            self.category,
+            self.location,
+            self.annotations,
+        )
 
 
 class ActivityLogAnalyzerWarningMessage(ActivityLogMessage):
@@ -2091,16 +2319,7 @@ class ActivityLogAnalyzerWarningMessage(ActivityLogMessage):
       * Kind: object
     """
 
-    def __eq__(self, other: Any) -> bool:
-        if not isinstance(other, self.__class__):
-            return False
-
-        # pylint: disable=protected-access
-        return self._members() == other._members()
-        # pylint: enable=protected-access
-
-    def __hash__(self) -> int:
-        return xchash(self)
+    __slots__ = ()
 
 
 class ActivityLogSection(XcresultObject):
@@ -2120,6 +2339,18 @@ class ActivityLogSection(XcresultObject):
         + attachments: [ActivityLogSectionAttachment]
     """
 
+    __slots__ = (
+        "domainType",
+        "title",
+        "startTime",
+        "duration",
+        "result",
+        "location",
+        "subsections",
+        "messages",
+        "attachments",
+    )
+
     domainType: str
     title: str
     startTime: datetime.datetime | None
@@ -2130,8 +2361,20 @@ class ActivityLogSection(XcresultObject):
     messages: list[ActivityLogMessage]
     attachments: list[ActivityLogSectionAttachment]
 
+    FIELDS: ClassVar[tuple[tuple[str, str, Any], ...]] = (
+        ("domainType", FIELD_PRIMITIVE, ""),
+        ("title", FIELD_PRIMITIVE, ""),
+        ("startTime", FIELD_OPTIONAL, None),
+        ("duration", FIELD_PRIMITIVE, 0.0),
+        ("result", FIELD_OPTIONAL, None),
+        ("location", FIELD_OPTIONAL, None),
+        ("subsections", FIELD_LIST, None),
+        ("messages", FIELD_LIST, None),
+        ("attachments", FIELD_LIST, None),
+    )
+
     def _members(self) -> tuple[Any, ...]:
-        properties: list[Any] = [
+        return (
             self.domainType,
             self.title,
             self.startTime,
@@ -2141,19 +2384,7 @@ class ActivityLogSection(XcresultObject):
             self.subsections,
             self.messages,
             self.attachments,
-        ]
-        return tuple(properties + list(super()._members()))
-
-    def __eq__(self, other: Any) -> bool:
-        if not isinstance(other, self.__class__):
-            return False
-
-        # pylint: disable=protected-access
-        return self._members() == other._members()
-        # pylint: enable=protected-access
-
-    def __hash__(self) -> int:
-        return xchash(self)
+        )
 
 
 class ConsoleLogSection(XcresultObject):
@@ -2166,26 +2397,24 @@ class ConsoleLogSection(XcresultObject):
         + items: [ConsoleLogItem]
     """
 
+    __slots__ = (
+        "title",
+        "items",
+    )
+
     title: str
     items: list[ConsoleLogItem]
 
+    FIELDS: ClassVar[tuple[tuple[str, str, Any], ...]] = (
+        ("title", FIELD_PRIMITIVE, ""),
+        ("items", FIELD_LIST, None),
+    )
+
     def _members(self) -> tuple[Any, ...]:
-        properties: list[Any] = [
+        return (
             self.title,
             self.items,
-        ]
-        return tuple(properties + list(super()._members()))
-
-    def __eq__(self, other: Any) -> bool:
-        if not isinstance(other, self.__class__):
-            return False
-
-        # pylint: disable=protected-access
-        return self._members() == other._members()
-        # pylint: enable=protected-access
-
-    def __hash__(self) -> int:
-        return xchash(self)
+        )
 
 
 class ResultIssueSummaries(XcresultObject):
@@ -2201,32 +2430,36 @@ class ResultIssueSummaries(XcresultObject):
         + testWarningSummaries: [TestIssueSummary]
     """
 
+    __slots__ = (
+        "analyzerWarningSummaries",
+        "errorSummaries",
+        "testFailureSummaries",
+        "warningSummaries",
+        "testWarningSummaries",
+    )
+
     analyzerWarningSummaries: list[IssueSummary]
     errorSummaries: list[IssueSummary]
     testFailureSummaries: list[TestFailureIssueSummary]
     warningSummaries: list[IssueSummary]
     testWarningSummaries: list[TestIssueSummary]
 
+    FIELDS: ClassVar[tuple[tuple[str, str, Any], ...]] = (
+        ("analyzerWarningSummaries", FIELD_LIST, None),
+        ("errorSummaries", FIELD_LIST, None),
+        ("testFailureSummaries", FIELD_LIST, None),
+        ("warningSummaries", FIELD_LIST, None),
+        ("testWarningSummaries", FIELD_LIST, None),
+    )
+
     def _members(self) -> tuple[Any, ...]:
-        properties: list[Any] = [
+        return (
             self.analyzerWarningSummaries,
             self.errorSummaries,
             self.testFailureSummaries,
             self.warningSummaries,
             self.testWarningSummaries,
-        ]
-        return tuple(properties + list(super()._members()))
-
-    def __eq__(self, other: Any) -> bool:
-        if not isinstance(other, self.__class__):
-            return False
-
-        # pylint: disable=protected-access
-        return self._members() == other._members()
-        # pylint: enable=protected-access
-
-    def __hash__(self) -> int:
-        return xchash(self)
+        )
 
 
 class SourceCodeFrame(XcresultObject):
@@ -2239,26 +2472,24 @@ class SourceCodeFrame(XcresultObject):
         + symbolInfo: SourceCodeSymbolInfo?
     """
 
+    __slots__ = (
+        "addressString",
+        "symbolInfo",
+    )
+
     addressString: str | None
     symbolInfo: SourceCodeSymbolInfo | None
 
+    FIELDS: ClassVar[tuple[tuple[str, str, Any], ...]] = (
+        ("addressString", FIELD_OPTIONAL, None),
+        ("symbolInfo", FIELD_OPTIONAL, None),
+    )
+
     def _members(self) -> tuple[Any, ...]:
-        properties: list[Any] = [
+        return (
             self.addressString,
             self.symbolInfo,
-        ]
-        return tuple(properties + list(super()._members()))
-
-    def __eq__(self, other: Any) -> bool:
-        if not isinstance(other, self.__class__):
-            return False
-
-        # pylint: disable=protected-access
-        return self._members() == other._members()
-        # pylint: enable=protected-access
-
-    def __hash__(self) -> int:
-        return xchash(self)
+        )
 
 
 class ActionResult(XcresultObject):
@@ -2279,6 +2510,19 @@ class ActionResult(XcresultObject):
         + consoleLogRef: Reference?
     """
 
+    __slots__ = (
+        "resultName",
+        "status",
+        "metrics",
+        "issues",
+        "coverage",
+        "timelineRef",
+        "logRef",
+        "testsRef",
+        "diagnosticsRef",
+        "consoleLogRef",
+    )
+
     resultName: str
     status: str
     metrics: ResultMetrics
@@ -2290,8 +2534,21 @@ class ActionResult(XcresultObject):
     diagnosticsRef: Reference | None
     consoleLogRef: Reference | None
 
+    FIELDS: ClassVar[tuple[tuple[str, str, Any], ...]] = (
+        ("resultName", FIELD_PRIMITIVE, ""),
+        ("status", FIELD_PRIMITIVE, ""),
+        ("metrics", FIELD_OBJECT, REQUIRED),
+        ("issues", FIELD_OBJECT, REQUIRED),
+        ("coverage", FIELD_OBJECT, REQUIRED),
+        ("timelineRef", FIELD_OPTIONAL, None),
+        ("logRef", FIELD_OPTIONAL, None),
+        ("testsRef", FIELD_OPTIONAL, None),
+        ("diagnosticsRef", FIELD_OPTIONAL, None),
+        ("consoleLogRef", FIELD_OPTIONAL, None),
+    )
+
     def _members(self) -> tuple[Any, ...]:
-        properties: list[Any] = [
+        return (
             self.resultName,
             self.status,
             self.metrics,
@@ -2302,19 +2559,7 @@ class ActionResult(XcresultObject):
             self.testsRef,
             self.diagnosticsRef,
             self.consoleLogRef,
-        ]
-        return tuple(properties + list(super()._members()))
-
-    def __eq__(self, other: Any) -> bool:
-        if not isinstance(other, self.__class__):
-            return False
-
-        # pylint: disable=protected-access
-        return self._members() == other._members()
-        # pylint: enable=protected-access
-
-    def __hash__(self) -> int:
-        return xchash(self)
+        )
 
 
 class ActivityLogCommandInvocationSection(ActivityLogSection):
@@ -2329,28 +2574,46 @@ class ActivityLogCommandInvocationSection(ActivityLogSection):
         + exitCode: Int?
     """
 
+    __slots__ = (
+        "commandDetails",
+        "emittedOutput",
+        "exitCode",
+    )
+
     commandDetails: str
     emittedOutput: str
     exitCode: int | None
 
+    FIELDS: ClassVar[tuple[tuple[str, str, Any], ...]] = (
+        ("commandDetails", FIELD_PRIMITIVE, ""),
+        ("emittedOutput", FIELD_PRIMITIVE, ""),
+        ("exitCode", FIELD_OPTIONAL, None),
+        ("domainType", FIELD_PRIMITIVE, ""),
+        ("title", FIELD_PRIMITIVE, ""),
+        ("startTime", FIELD_OPTIONAL, None),
+        ("duration", FIELD_PRIMITIVE, 0.0),
+        ("result", FIELD_OPTIONAL, None),
+        ("location", FIELD_OPTIONAL, None),
+        ("subsections", FIELD_LIST, None),
+        ("messages", FIELD_LIST, None),
+        ("attachments", FIELD_LIST, None),
+    )
+
     def _members(self) -> tuple[Any, ...]:
-        properties: list[Any] = [
+        return (
             self.commandDetails,
             self.emittedOutput,
             self.exitCode,
-        ]
-        return tuple(properties + list(super()._members()))
-
-    def __eq__(self, other: Any) -> bool:
-        if not isinstance(other, self.__class__):
-            return False
-
-        # pylint: disable=protected-access
-        return self._members() == other._members()
-        # pylint: enable=protected-access
-
-    def __hash__(self) -> int:
-        return xchash(self)
+            self.domainType,
+            self.title,
+            self.startTime,
+            self.duration,
+            self.result,
+            self.location,
+            self.subsections,
+            self.messages,
+            self.attachments,
+        )
 
 
 class ActivityLogMajorSection(ActivityLogSection):
@@ -2363,24 +2626,36 @@ class ActivityLogMajorSection(ActivityLogSection):
         + subtitle: String
     """
 
+    __slots__ = ("subtitle",)
+
     subtitle: str
 
+    FIELDS: ClassVar[tuple[tuple[str, str, Any], ...]] = (
+        ("subtitle", FIELD_PRIMITIVE, ""),
+        ("domainType", FIELD_PRIMITIVE, ""),
+        ("title", FIELD_PRIMITIVE, ""),
+        ("startTime", FIELD_OPTIONAL, None),
+        ("duration", FIELD_PRIMITIVE, 0.0),
+        ("result", FIELD_OPTIONAL, None),
+        ("location", FIELD_OPTIONAL, None),
+        ("subsections", FIELD_LIST, None),
+        ("messages", FIELD_LIST, None),
+        ("attachments", FIELD_LIST, None),
+    )
+
     def _members(self) -> tuple[Any, ...]:
-        properties: list[Any] = [
+        return (
             self.subtitle,
-        ]
-        return tuple(properties + list(super()._members()))
-
-    def __eq__(self, other: Any) -> bool:
-        if not isinstance(other, self.__class__):
-            return False
-
-        # pylint: disable=protected-access
-        return self._members() == other._members()
-        # pylint: enable=protected-access
-
-    def __hash__(self) -> int:
-        return xchash(self)
+            self.domainType,
+            self.title,
+            self.startTime,
+            self.duration,
+            self.result,
+            self.location,
+            self.subsections,
+            self.messages,
+            self.attachments,
+        )
 
 
 class ActivityLogUnitTestSection(ActivityLogSection):
@@ -2401,6 +2676,18 @@ class ActivityLogUnitTestSection(ActivityLogSection):
         + runnableUTI: String?
     """
 
+    __slots__ = (
+        "testName",
+        "suiteName",
+        "summary",
+        "emittedOutput",
+        "performanceTestOutput",
+        "testsPassedString",
+        "wasSkipped",
+        "runnablePath",
+        "runnableUTI",
+    )
+
     testName: str | None
     suiteName: str | None
     summary: str | None
@@ -2411,8 +2698,29 @@ class ActivityLogUnitTestSection(ActivityLogSection):
     runnablePath: str | None
     runnableUTI: str | None
 
+    FIELDS: ClassVar[tuple[tuple[str, str, Any], ...]] = (
+        ("testName", FIELD_OPTIONAL, None),
+        ("suiteName", FIELD_OPTIONAL, None),
+        ("summary", FIELD_OPTIONAL, None),
+        ("emittedOutput", FIELD_OPTIONAL, None),
+        ("performanceTestOutput", FIELD_OPTIONAL, None),
+        ("testsPassedString", FIELD_OPTIONAL, None),
+        ("wasSkipped", FIELD_PRIMITIVE, False),
+        ("runnablePath", FIELD_OPTIONAL, None),
+        ("runnableUTI", FIELD_OPTIONAL, None),
+        ("domainType", FIELD_PRIMITIVE, ""),
+        ("title", FIELD_PRIMITIVE, ""),
+        ("startTime", FIELD_OPTIONAL, None),
+        ("duration", FIELD_PRIMITIVE, 0.0),
+        ("result", FIELD_OPTIONAL, None),
+        ("location", FIELD_OPTIONAL, None),
+        ("subsections", FIELD_LIST, None),
+        ("messages", FIELD_LIST, None),
+        ("attachments", FIELD_LIST, None),
+    )
+
     def _members(self) -> tuple[Any, ...]:
-        properties: list[Any] = [
+        return (
             self.testName,
             self.suiteName,
             self.summary,
@@ -2422,19 +2730,16 @@ class ActivityLogUnitTestSection(ActivityLogSection):
             self.wasSkipped,
             self.runnablePath,
             self.runnableUTI,
-        ]
-        return tuple(properties + list(super()._members()))
-
-    def __eq__(self, other: Any) -> bool:
-        if not isinstance(other, self.__class__):
-            return False
-
-        # pylint: disable=protected-access
-        return self._members() == other._members()
-        # pylint: enable=protected-access
-
-    def __hash__(self) -> int:
-        return xchash(self)
+            self.domainType,
+            self.title,
+            self.startTime,
+            self.duration,
+            self.result,
+            self.location,
+            self.subsections,
+            self.messages,
+            self.attachments,
+        )
 
 
 class SourceCodeContext(XcresultObject):
@@ -2447,26 +2752,24 @@ class SourceCodeContext(XcresultObject):
         + callStack: [SourceCodeFrame]
     """
 
+    __slots__ = (
+        "location",
+        "callStack",
+    )
+
     location: SourceCodeLocation | None
     callStack: list[SourceCodeFrame]
 
+    FIELDS: ClassVar[tuple[tuple[str, str, Any], ...]] = (
+        ("location", FIELD_OPTIONAL, None),
+        ("callStack", FIELD_LIST, None),
+    )
+
     def _members(self) -> tuple[Any, ...]:
-        properties: list[Any] = [
+        return (
             self.location,
             self.callStack,
-        ]
-        return tuple(properties + list(super()._members()))
-
-    def __eq__(self, other: Any) -> bool:
-        if not isinstance(other, self.__class__):
-            return False
-
-        # pylint: disable=protected-access
-        return self._members() == other._members()
-        # pylint: enable=protected-access
-
-    def __hash__(self) -> int:
-        return xchash(self)
+        )
 
 
 class ActionRecord(XcresultObject):
@@ -2486,6 +2789,18 @@ class ActionRecord(XcresultObject):
         + testPlanName: String?
     """
 
+    __slots__ = (
+        "schemeCommandName",
+        "schemeTaskName",
+        "title",
+        "startedTime",
+        "endedTime",
+        "runDestination",
+        "buildResult",
+        "actionResult",
+        "testPlanName",
+    )
+
     schemeCommandName: str
     schemeTaskName: str
     title: str | None
@@ -2496,8 +2811,20 @@ class ActionRecord(XcresultObject):
     actionResult: ActionResult
     testPlanName: str | None
 
+    FIELDS: ClassVar[tuple[tuple[str, str, Any], ...]] = (
+        ("schemeCommandName", FIELD_PRIMITIVE, ""),
+        ("schemeTaskName", FIELD_PRIMITIVE, ""),
+        ("title", FIELD_OPTIONAL, None),
+        ("startedTime", FIELD_PRIMITIVE, REQUIRED),
+        ("endedTime", FIELD_PRIMITIVE, REQUIRED),
+        ("runDestination", FIELD_OBJECT, REQUIRED),
+        ("buildResult", FIELD_OBJECT, REQUIRED),
+        ("actionResult", FIELD_OBJECT, REQUIRED),
+        ("testPlanName", FIELD_OPTIONAL, None),
+    )
+
     def _members(self) -> tuple[Any, ...]:
-        properties: list[Any] = [
+        return (
             self.schemeCommandName,
             self.schemeTaskName,
             self.title,
@@ -2507,19 +2834,7 @@ class ActionRecord(XcresultObject):
             self.buildResult,
             self.actionResult,
             self.testPlanName,
-        ]
-        return tuple(properties + list(super()._members()))
-
-    def __eq__(self, other: Any) -> bool:
-        if not isinstance(other, self.__class__):
-            return False
-
-        # pylint: disable=protected-access
-        return self._members() == other._members()
-        # pylint: enable=protected-access
-
-    def __hash__(self) -> int:
-        return xchash(self)
+        )
 
 
 class ActionTestFailureSummary(XcresultObject):
@@ -2543,6 +2858,22 @@ class ActionTestFailureSummary(XcresultObject):
         + expression: TestExpression?
     """
 
+    __slots__ = (
+        "message",
+        "fileName",
+        "lineNumber",
+        "isPerformanceFailure",
+        "uuid",
+        "issueType",
+        "detailedDescription",
+        "attachments",
+        "associatedError",
+        "sourceCodeContext",
+        "timestamp",
+        "isTopLevelFailure",
+        "expression",
+    )
+
     message: str | None
     fileName: str
     lineNumber: int
@@ -2557,8 +2888,24 @@ class ActionTestFailureSummary(XcresultObject):
     isTopLevelFailure: bool
     expression: TestExpression | None
 
+    FIELDS: ClassVar[tuple[tuple[str, str, Any], ...]] = (
+        ("message", FIELD_OPTIONAL, None),
+        ("fileName", FIELD_PRIMITIVE, ""),
+        ("lineNumber", FIELD_PRIMITIVE, 0),
+        ("isPerformanceFailure", FIELD_PRIMITIVE, False),
+        ("uuid", FIELD_PRIMITIVE, ""),
+        ("issueType", FIELD_OPTIONAL, None),
+        ("detailedDescription", FIELD_OPTIONAL, None),
+        ("attachments", FIELD_LIST, None),
+        ("associatedError", FIELD_OPTIONAL, None),
+        ("sourceCodeContext", FIELD_OPTIONAL, None),
+        ("timestamp", FIELD_OPTIONAL, None),
+        ("isTopLevelFailure", FIELD_PRIMITIVE, False),
+        ("expression", FIELD_OPTIONAL, None),
+    )
+
     def _members(self) -> tuple[Any, ...]:
-        properties: list[Any] = [
+        return (
             self.message,
             self.fileName,
             self.lineNumber,
@@ -2572,19 +2919,7 @@ class ActionTestFailureSummary(XcresultObject):
             self.timestamp,
             self.isTopLevelFailure,
             self.expression,
-        ]
-        return tuple(properties + list(super()._members()))
-
-    def __eq__(self, other: Any) -> bool:
-        if not isinstance(other, self.__class__):
-            return False
-
-        # pylint: disable=protected-access
-        return self._members() == other._members()
-        # pylint: enable=protected-access
-
-    def __hash__(self) -> int:
-        return xchash(self)
+        )
 
 
 class ActionTestIssueSummary(XcresultObject):
@@ -2606,6 +2941,20 @@ class ActionTestIssueSummary(XcresultObject):
         + isTopLevel: Bool
     """
 
+    __slots__ = (
+        "message",
+        "fileName",
+        "lineNumber",
+        "uuid",
+        "issueType",
+        "detailedDescription",
+        "attachments",
+        "associatedError",
+        "sourceCodeContext",
+        "timestamp",
+        "isTopLevel",
+    )
+
     message: str | None
     fileName: str
     lineNumber: int
@@ -2618,8 +2967,22 @@ class ActionTestIssueSummary(XcresultObject):
     timestamp: datetime.datetime | None
     isTopLevel: bool
 
+    FIELDS: ClassVar[tuple[tuple[str, str, Any], ...]] = (
+        ("message", FIELD_OPTIONAL, None),
+        ("fileName", FIELD_PRIMITIVE, ""),
+        ("lineNumber", FIELD_PRIMITIVE, 0),
+        ("uuid", FIELD_PRIMITIVE, ""),
+        ("issueType", FIELD_OPTIONAL, None),
+        ("detailedDescription", FIELD_OPTIONAL, None),
+        ("attachments", FIELD_LIST, None),
+        ("associatedError", FIELD_OPTIONAL, None),
+        ("sourceCodeContext", FIELD_OPTIONAL, None),
+        ("timestamp", FIELD_OPTIONAL, None),
+        ("isTopLevel", FIELD_PRIMITIVE, False),
+    )
+
     def _members(self) -> tuple[Any, ...]:
-        properties: list[Any] = [
+        return (
             self.message,
             self.fileName,
             self.lineNumber,
@@ -2631,19 +2994,7 @@ class ActionTestIssueSummary(XcresultObject):
             self.sourceCodeContext,
             self.timestamp,
             self.isTopLevel,
-        ]
-        return tuple(properties + list(super()._members()))
-
-    def __eq__(self, other: Any) -> bool:
-        if not isinstance(other, self.__class__):
-            return False
-
-        # pylint: disable=protected-access
-        return self._members() == other._members()
-        # pylint: enable=protected-access
-
-    def __hash__(self) -> int:
-        return xchash(self)
+        )
 
 
 class ActivityLogTargetBuildSection(ActivityLogMajorSection):
@@ -2656,24 +3007,38 @@ class ActivityLogTargetBuildSection(ActivityLogMajorSection):
         + productType: String?
     """
 
+    __slots__ = ("productType",)
+
     productType: str | None
 
+    FIELDS: ClassVar[tuple[tuple[str, str, Any], ...]] = (
+        ("productType", FIELD_OPTIONAL, None),
+        ("subtitle", FIELD_PRIMITIVE, ""),
+        ("domainType", FIELD_PRIMITIVE, ""),
+        ("title", FIELD_PRIMITIVE, ""),
+        ("startTime", FIELD_OPTIONAL, None),
+        ("duration", FIELD_PRIMITIVE, 0.0),
+        ("result", FIELD_OPTIONAL, None),
+        ("location", FIELD_OPTIONAL, None),
+        ("subsections", FIELD_LIST, None),
+        ("messages", FIELD_LIST, None),
+        ("attachments", FIELD_LIST, None),
+    )
+
     def _members(self) -> tuple[Any, ...]:
-        properties: list[Any] = [
+        return (
             self.productType,
-        ]
-        return tuple(properties + list(super()._members()))
-
-    def __eq__(self, other: Any) -> bool:
-        if not isinstance(other, self.__class__):
-            return False
-
-        # pylint: disable=protected-access
-        return self._members() == other._members()
-        # pylint: enable=protected-access
-
-    def __hash__(self) -> int:
-        return xchash(self)
+            self.subtitle,
+            self.domainType,
+            self.title,
+            self.startTime,
+            self.duration,
+            self.result,
+            self.location,
+            self.subsections,
+            self.messages,
+            self.attachments,
+        )
 
 
 class ActionTestExpectedFailure(XcresultObject):
@@ -2688,30 +3053,32 @@ class ActionTestExpectedFailure(XcresultObject):
         + isTopLevelFailure: Bool
     """
 
+    __slots__ = (
+        "uuid",
+        "failureReason",
+        "failureSummary",
+        "isTopLevelFailure",
+    )
+
     uuid: str
     failureReason: str | None
     failureSummary: ActionTestFailureSummary | None
     isTopLevelFailure: bool
 
+    FIELDS: ClassVar[tuple[tuple[str, str, Any], ...]] = (
+        ("uuid", FIELD_PRIMITIVE, ""),
+        ("failureReason", FIELD_OPTIONAL, None),
+        ("failureSummary", FIELD_OPTIONAL, None),
+        ("isTopLevelFailure", FIELD_PRIMITIVE, False),
+    )
+
     def _members(self) -> tuple[Any, ...]:
-        properties: list[Any] = [
+        return (
             self.uuid,
             self.failureReason,
             self.failureSummary,
             self.isTopLevelFailure,
-        ]
-        return tuple(properties + list(super()._members()))
-
-    def __eq__(self, other: Any) -> bool:
-        if not isinstance(other, self.__class__):
-            return False
-
-        # pylint: disable=protected-access
-        return self._members() == other._members()
-        # pylint: enable=protected-access
-
-    def __hash__(self) -> int:
-        return xchash(self)
+        )
 
 
 class ActionTestableSummary(ActionAbstractTestSummary):
@@ -2732,6 +3099,18 @@ class ActionTestableSummary(ActionAbstractTestSummary):
         + testRegion: String?
     """
 
+    __slots__ = (
+        "identifierURL",
+        "projectRelativePath",
+        "targetName",
+        "testKind",
+        "tests",
+        "diagnosticsDirectoryName",
+        "failureSummaries",
+        "testLanguage",
+        "testRegion",
+    )
+
     identifierURL: str | None
     projectRelativePath: str | None
     targetName: str | None
@@ -2742,24 +3121,37 @@ class ActionTestableSummary(ActionAbstractTestSummary):
     testLanguage: str | None
     testRegion: str | None
 
+    FIELDS: ClassVar[tuple[tuple[str, str, Any], ...]] = (
+        ("identifierURL", FIELD_OPTIONAL, None),
+        ("projectRelativePath", FIELD_OPTIONAL, None),
+        ("targetName", FIELD_OPTIONAL, None),
+        ("testKind", FIELD_OPTIONAL, None),
+        ("tests", FIELD_LIST, None),
+        ("diagnosticsDirectoryName", FIELD_OPTIONAL, None),
+        ("failureSummaries", FIELD_LIST, None),
+        ("testLanguage", FIELD_OPTIONAL, None),
+        ("testRegion", FIELD_OPTIONAL, None),
+        ("name", FIELD_OPTIONAL, None),
+    )
+
+    def iter_tests(self) -> Iterator[ActionTestSummaryIdentifiableObject]:
+        """Iterate over all subtests, depth first.
+
+        :returns: An iterator over all subtests
+        """
+        for test in self.tests or []:
+            if isinstance(test, (ActionTestSummaryGroup, ActionTestMetadata)):
+                yield from test.iter_subtests()
+
     def all_tests(self) -> list[ActionTestSummaryIdentifiableObject]:
         """Get all subtests.
 
         :returns: All subtests
         """
-        if not self.tests:
-            return []
-
-        return flatten(
-            [
-                test.all_subtests()
-                for test in self.tests
-                if isinstance(test, (ActionTestSummaryGroup, ActionTestMetadata))
-            ]
-        )
+        return list(self.iter_tests())
 
     def _members(self) -> tuple[Any, ...]:
-        properties: list[Any] = [
+        return (
             self.identifierURL,
             self.projectRelativePath,
             self.targetName,
@@ -2769,19 +3161,8 @@ class ActionTestableSummary(ActionAbstractTestSummary):
             self.failureSummaries,
             self.testLanguage,
             self.testRegion,
-        ]
-        return tuple(properties + list(super()._members()))
-
-    def __eq__(self, other: Any) -> bool:
-        if not isinstance(other, self.__class__):
-            return False
-
-        # pylint: disable=protected-access
-        return self._members() == other._members()
-        # pylint: enable=protected-access
-
-    def __hash__(self) -> int:
-        return xchash(self)
+            self.name,
+        )
 
 
 class ActionsInvocationRecord(XcresultObject):
@@ -2797,32 +3178,36 @@ class ActionsInvocationRecord(XcresultObject):
         + archive: ArchiveInfo?
     """
 
+    __slots__ = (
+        "metadataRef",
+        "metrics",
+        "issues",
+        "actions",
+        "archive",
+    )
+
     metadataRef: Reference | None
     metrics: ResultMetrics
     issues: ResultIssueSummaries
     actions: list[ActionRecord]
     archive: ArchiveInfo | None
 
+    FIELDS: ClassVar[tuple[tuple[str, str, Any], ...]] = (
+        ("metadataRef", FIELD_OPTIONAL, None),
+        ("metrics", FIELD_OBJECT, REQUIRED),
+        ("issues", FIELD_OBJECT, REQUIRED),
+        ("actions", FIELD_LIST, None),
+        ("archive", FIELD_OPTIONAL, None),
+    )
+
     def _members(self) -> tuple[Any, ...]:
-        properties: list[Any] = [
+        return (
             self.metadataRef,
             self.metrics,
             self.issues,
             self.actions,
             self.archive,
-        ]
-        return tuple(properties + list(super()._members()))
-
-    def __eq__(self, other: Any) -> bool:
-        if not isinstance(other, self.__class__):
-            return False
-
-        # pylint: disable=protected-access
-        return self._members() == other._members()
-        # pylint: enable=protected-access
-
-    def __hash__(self) -> int:
-        return xchash(self)
+        )
 
 
 class ActionTestPlanRunSummary(ActionAbstractTestSummary):
@@ -2835,24 +3220,20 @@ class ActionTestPlanRunSummary(ActionAbstractTestSummary):
         + testableSummaries: [ActionTestableSummary]
     """
 
+    __slots__ = ("testableSummaries",)
+
     testableSummaries: list[ActionTestableSummary]
 
+    FIELDS: ClassVar[tuple[tuple[str, str, Any], ...]] = (
+        ("testableSummaries", FIELD_LIST, None),
+        ("name", FIELD_OPTIONAL, None),
+    )
+
     def _members(self) -> tuple[Any, ...]:
-        properties: list[Any] = [
+        return (
             self.testableSummaries,
-        ]
-        return tuple(properties + list(super()._members()))
-
-    def __eq__(self, other: Any) -> bool:
-        if not isinstance(other, self.__class__):
-            return False
-
-        # pylint: disable=protected-access
-        return self._members() == other._members()
-        # pylint: enable=protected-access
-
-    def __hash__(self) -> int:
-        return xchash(self)
+            self.name,
+        )
 
 
 class ActionTestSummary(ActionTestSummaryIdentifiableObject):
@@ -2879,6 +3260,24 @@ class ActionTestSummary(ActionTestSummaryIdentifiableObject):
         + tags: [TestTag]
     """
 
+    __slots__ = (
+        "testStatus",
+        "duration",
+        "performanceMetrics",
+        "failureSummaries",
+        "expectedFailures",
+        "skipNoticeSummary",
+        "activitySummaries",
+        "repetitionPolicySummary",
+        "arguments",
+        "configuration",
+        "warningSummaries",
+        "summary",
+        "documentation",
+        "trackedIssues",
+        "tags",
+    )
+
     testStatus: str
     duration: float
     performanceMetrics: list[ActionTestPerformanceMetricSummary]
@@ -2895,8 +3294,29 @@ class ActionTestSummary(ActionTestSummaryIdentifiableObject):
     trackedIssues: list[IssueTrackingMetadata]
     tags: list[TestTag]
 
+    FIELDS: ClassVar[tuple[tuple[str, str, Any], ...]] = (
+        ("testStatus", FIELD_PRIMITIVE, ""),
+        ("duration", FIELD_PRIMITIVE, 0.0),
+        ("performanceMetrics", FIELD_LIST, None),
+        ("failureSummaries", FIELD_LIST, None),
+        ("expectedFailures", FIELD_LIST, None),
+        ("skipNoticeSummary", FIELD_OPTIONAL, None),
+        ("activitySummaries", FIELD_LIST, None),
+        ("repetitionPolicySummary", FIELD_OPTIONAL, None),
+        ("arguments", FIELD_LIST, None),
+        ("configuration", FIELD_OPTIONAL, None),
+        ("warningSummaries", FIELD_LIST, None),
+        ("summary", FIELD_OPTIONAL, None),
+        ("documentation", FIELD_LIST, None),
+        ("trackedIssues", FIELD_LIST, None),
+        ("tags", FIELD_LIST, None),
+        ("identifier", FIELD_OPTIONAL, None),
+        ("identifierURL", FIELD_OPTIONAL, None),
+        ("name", FIELD_OPTIONAL, None),
+    )
+
     def _members(self) -> tuple[Any, ...]:
-        properties: list[Any] = [
+        return (
             self.testStatus,
             self.duration,
             self.performanceMetrics,
@@ -2912,19 +3332,10 @@ class ActionTestSummary(ActionTestSummaryIdentifiableObject):
             self.documentation,
             self.trackedIssues,
             self.tags,
-        ]
-        return tuple(properties + list(super()._members()))
-
-    def __eq__(self, other: Any) -> bool:
-        if not isinstance(other, self.__class__):
-            return False
-
-        # pylint: disable=protected-access
-        return self._members() == other._members()
-        # pylint: enable=protected-access
-
-    def __hash__(self) -> int:
-        return xchash(self)
+            self.identifier,
+            self.identifierURL,
+            self.name,
+        )
 
 
 class ActionTestSummaryGroup(ActionTestSummaryIdentifiableObject):
@@ -2947,6 +3358,20 @@ class ActionTestSummaryGroup(ActionTestSummaryIdentifiableObject):
         + tags: [TestTag]
     """
 
+    __slots__ = (
+        "duration",
+        "subtests",
+        "failureSummaries",
+        "warningSummaries",
+        "expectedFailures",
+        "skipNoticeSummary",
+        "activitySummaries",
+        "summary",
+        "documentation",
+        "trackedIssues",
+        "tags",
+    )
+
     duration: float
     subtests: list[ActionTestSummaryIdentifiableObject]
     failureSummaries: list[ActionTestFailureSummary]
@@ -2959,24 +3384,52 @@ class ActionTestSummaryGroup(ActionTestSummaryIdentifiableObject):
     trackedIssues: list[IssueTrackingMetadata]
     tags: list[TestTag]
 
+    FIELDS: ClassVar[tuple[tuple[str, str, Any], ...]] = (
+        ("duration", FIELD_PRIMITIVE, 0.0),
+        ("subtests", FIELD_LIST, None),
+        ("failureSummaries", FIELD_LIST, None),
+        ("warningSummaries", FIELD_LIST, None),
+        ("expectedFailures", FIELD_LIST, None),
+        ("skipNoticeSummary", FIELD_OPTIONAL, None),
+        ("activitySummaries", FIELD_LIST, None),
+        ("summary", FIELD_OPTIONAL, None),
+        ("documentation", FIELD_LIST, None),
+        ("trackedIssues", FIELD_LIST, None),
+        ("tags", FIELD_LIST, None),
+        ("identifier", FIELD_OPTIONAL, None),
+        ("identifierURL", FIELD_OPTIONAL, None),
+        ("name", FIELD_OPTIONAL, None),
+    )
+
+    def iter_subtests(self) -> Iterator[ActionTestSummaryIdentifiableObject]:
+        """Iterate over all subtests, depth first.
+
+        Nested groups are walked with a stack of iterators, so no lists are built
+        along the way however deep the groups go.
+
+        :returns: An iterator over all subtests
+        """
+        stack = [iter(self.subtests or [])]
+
+        while stack:
+            for test in stack[-1]:
+                if isinstance(test, ActionTestSummaryGroup):
+                    stack.append(iter(test.subtests or []))
+                    break
+                if isinstance(test, ActionTestMetadata):
+                    yield test
+            else:
+                stack.pop()
+
     def all_subtests(self) -> list[ActionTestSummaryIdentifiableObject]:
         """Get all subtests.
 
         :returns: All subtests
         """
-        if not self.subtests:
-            return []
-
-        return flatten(
-            [
-                test.all_subtests()
-                for test in self.subtests
-                if isinstance(test, (ActionTestSummaryGroup, ActionTestMetadata))
-            ]
-        )
+        return list(self.iter_subtests())
 
     def _members(self) -> tuple[Any, ...]:
-        properties: list[Any] = [
+        return (
             self.duration,
             self.subtests,
             self.failureSummaries,
@@ -2988,19 +3441,10 @@ class ActionTestSummaryGroup(ActionTestSummaryIdentifiableObject):
             self.documentation,
             self.trackedIssues,
             self.tags,
-        ]
-        return tuple(properties + list(super()._members()))
-
-    def __eq__(self, other: Any) -> bool:
-        if not isinstance(other, self.__class__):
-            return False
-
-        # pylint: disable=protected-access
-        return self._members() == other._members()
-        # pylint: enable=protected-access
-
-    def __hash__(self) -> int:
-        return xchash(self)
+            self.identifier,
+            self.identifierURL,
+            self.name,
+        )
 
 
 class ActionTestPlanRunSummaries(XcresultObject):
@@ -3012,24 +3456,14 @@ class ActionTestPlanRunSummaries(XcresultObject):
         + summaries: [ActionTestPlanRunSummary]
     """
 
-    summaries: list[ActionTestPlanRunSummary]
-
-    def _members(self) -> tuple[Any, ...]:
-        properties: list[Any] = [
-            self.summaries,
-        ]
-        return tuple(properties + list(super()._members()))
+    __slots__ = ("summaries",)
 
-    def __eq__(self, other: Any) -> bool:
-        if not isinstance(other, self.__class__):
-            return False
+    summaries: list[ActionTestPlanRunSummary]
 
-        # pylint: disable=protected-access
-        return self._members() == other._members()
-        # pylint: enable=protected-access
+    FIELDS: ClassVar[tuple[tuple[str, str, Any], ...]] = (("summaries", FIELD_LIST, None),)
 
-    def __hash__(self) -> int:
-        return xchash(self)
+    def _members(self) -> tuple[Any, ...]:
+        return (self.summaries,)
 
 
 _CURRENT_MODULE = sys.modules[__name__]
@@ -0,0 +1,312 @@
+"""A pure Python reader for xcresult bundles using the fileBacked2 storage format.
+
+Every object in such a bundle lives in its own ``Data/data.<id>`` file, usually
+zstd compressed. Objects are stored in a compact text encoding which carries
+the same information as the JSON that ``xcresulttool get --format json
+--legacy`` prints, so they can be decoded into the exact structure that
+``xcresulttool.deserialize`` consumes without needing Xcode at all.
+"""
+
+import base64
+import importlib
+import os
+import plistlib
+import shutil
+from typing import Any, cast
+
+from xcresult.cache import bundle_root_id
+from xcresult.exceptions import XcresultException
+
+
+SUPPORTED_STORAGE_BACKEND = "fileBacked2"
+
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+# The encoded keys which have a different name in the JSON output
+_KEY_NAMES = {
+    "_n": "_name",
+    "_s": "_supertype",
+    "_v": "_value",
+}
+
+
+def _zstd_decompress(data: bytes) -> bytes:
+    """Decompress zstd data.
+
+    This uses ``compression.zstd`` on Python 3.14+ and falls back to the
+    ``zstandard`` package otherwise.
+
+    :param data: The compressed data
+
+    :returns: The decompressed data
+    """
+
+    try:
+        module: Any = importlib.import_module("compression.zstd")
+        return cast(bytes, module.decompress(data))
+    except ImportError:
+        pass
+
+    try:
+        module = importlib.import_module("zstandard")
+    except ImportError as ex:
+        raise XcresultException(
+            "Reading xcresult bundles natively requires Python 3.14+ or the zstandard package"
+        ) from ex
+
+    reader = module.ZstdDecompressor().stream_reader(data, read_across_frames=True)
+    return cast(bytes, reader.read())
+
+
+def _check_storage(path: str) -> None:
+    """Check that the bundle uses a storage format this module can read.
+
+    :param path: The path to the xcresult bundle
+    """
+
+    try:
+        with open(os.path.join(path, "Info.plist"), "rb") as info_file:
+            info: dict[str, Any] = plistlib.load(info_file)
+    except (OSError, plistlib.InvalidFileException) as ex:
+        raise XcresultException(f"Could not read the Info.plist of {path}") from ex
+
+    storage: Any = info.get("storage")
+    backend = cast(dict[str, Any], storage).get("backend") if isinstance(storage, dict) else None
+
+    if backend != SUPPORTED_STORAGE_BACKEND:
+        raise XcresultException(f"Unsupported xcresult storage backend: {backend}")
+
+
+def _object_path(path: str, identifier: str) -> str:
+    """Get the path of the file holding an object.
+
+    :param path: The path to the xcresult bundle
+    :param identifier: The id of the object
+
+    :returns: The path of the file
+    """
+
+    # Ids are base64 encoded hashes, so they should never contain a separator
+    if os.sep in identifier or (os.altsep and os.altsep in identifier):
+        raise XcresultException(f"Invalid object id: {identifier}")
+
+    return os.path.join(path, "Data", f"data.{identifier}")
+
+
+def read(path: str, identifier: str) -> bytes:
+    """Read the raw (decompressed) contents of an object.
+
+    :param path: The path to the xcresult bundle
+    :param identifier: The id of the object
+
+    :returns: The contents of the object
+    """
+
+    try:
+        with open(_object_path(path, identifier), "rb") as object_file:
+            data = object_file.read()
+    except FileNotFoundError as ex:
+        raise XcresultException(f"Object not found in bundle: {identifier}") from ex
+
+    if data.startswith(_ZSTD_MAGIC):
+        return _zstd_decompress(data)
+
+    return data
+
+
+class _Decoder:
+    """Decoder for the encoding used by objects in the bundle.
+
+    The grammar is::
+
+        object := "[" ("T" object | "S" string)? ("[" ... "]")* ("K" string value)* "]"
+        value  := "V" string | object
+        string := <length> ":" <utf-8 bytes>
+
+    ``T`` introduces the type of an object, described by another object, and
+    ``S`` refers back to a type which has already been described by name. The
+    elements of an array directly follow its type.
+    """
+
+    def __init__(self, data: bytes) -> None:
+        self.data = data
+        self.position = 0
+        self.types: dict[str, dict[str, Any]] = {}
+
+    def error(self, message: str) -> XcresultException:
+        """Create an exception for malformed data at the current position."""
+        return XcresultException(f"Malformed xcresult object at offset {self.position}: {message}")
+
+    def raw_string(self) -> bytes:
+        """Decode a length prefixed string without interpreting its contents."""
+        separator = self.data.find(b":", self.position)
+        if separator == -1:
+            raise self.error("missing string length")
+
+        start = separator + 1
+        end = start + int(self.data[self.position : separator])
+        self.position = end
+        return self.data[start:end]
+
+    def string(self) -> str:
+        """Decode a length prefixed string."""
+        return self.raw_string().decode("utf-8")
+
+    def value(self, is_data: bool = False) -> Any:
+        """Decode a value.
+
+        :param is_data: Whether this is the value of a Data object. Those hold
+            arbitrary bytes, which the JSON output represents as base64.
+        """
+        tag = self.data[self.position : self.position + 1]
+
+        if tag == b"V":
+            self.position += 1
+            if is_data:
+                return base64.b64encode(self.raw_string()).decode("ascii")
+            return self.string()
+
+        if tag == b"[":
+            return self.object()
+
+        raise self.error(f"unexpected value tag {tag!r}")
+
+    def object(self) -> dict[str, Any]:
+        """Decode an object."""
+        data = self.data
+
+        if data[self.position : self.position + 1] != b"[":
+            raise self.error("expected an object")
+
+        self.position += 1
+        output: dict[str, Any] = {}
+
+        tag = data[self.position : self.position + 1]
+
+        if tag == b"T":
+            self.position += 1
+            type_info = self.object()
+            self.types[type_info["_name"]] = type_info
+            output["_type"] = type_info
+        elif tag == b"S":
+            self.position += 1
+            known_type = self.string()
+            output["_type"] = self.types.get(known_type, {"_name": known_type})
+
+        type_name = output["_type"]["_name"] if "_type" in output else None
+
+        if type_name == "Array":
+            values: list[Any] = []
+            while data[self.position : self.position + 1] == b"[":
+                values.append(self.object())
+            output["_values"] = values
+
+        while True:
+            tag = data[self.position : self.position + 1]
+
+            if tag == b"]":
+                self.position += 1
+                return output
+
+            if tag != b"K":
+                raise self.error(f"unexpected tag {tag!r}")
+
+            self.position += 1
+            key = self.string()
+            output[_KEY_NAMES.get(key, key)] = self.value(type_name == "Data" and key == "_v")
+
+
+def decode(data: bytes) -> dict[str, Any]:
+    """Decode an object into the structure xcresulttool outputs as JSON.
+
+    :param data: The raw (decompressed) object data
+
+    :returns: The decoded data
+    """
+
+    decoder = _Decoder(data)
+    output = decoder.object()
+
+    if decoder.position != len(data):
+        raise decoder.error("unexpected trailing data")
+
+    return output
+
+
+def root_id(path: str) -> str:
+    """Get the id of the root object of a bundle.
+
+    :param path: The path to the xcresult bundle
+
+    :returns: The id of the root (ActionsInvocationRecord) object
+    """
+
+    _check_storage(path)
+
+    identifier = bundle_root_id(path)
+
+    if identifier is None:
+        raise XcresultException(f"No root id found in {path}")
+
+    return identifier
+
+
+def get(path: str, identifier: str | None = None) -> dict[str, Any]:
+    """Get an object from a bundle without calling xcresulttool.
+
+    :param path: The path to the xcresult bundle
+    :param identifier: The id of the object to get (the root object if None)
+
+    :returns: The same data as ``xcresulttool.get`` returns
+    """
+
+    if identifier is None:
+        identifier = root_id(path)
+
+    return decode(read(path, identifier))
+
+
+def list_ids(path: str) -> list[str]:
+    """List the ids of every object stored in a bundle.
+
+    :param path: The path to the xcresult bundle
+
+    :returns: The ids, sorted
+    """
+
+    data_path = os.path.join(path, "Data")
+
+    if not os.path.isdir(data_path):
+        return []
+
+    return sorted(
+        name[len("data.") :] for name in os.listdir(data_path) if name.startswith("data.")
+    )
+
+
+def export(path: str, identifier: str, object_type: str, output_path: str) -> None:
+    """Export a file from a bundle without calling xcresulttool.
+
+    :param path: The path to the xcresult bundle
+    :param identifier: The identifier of the object to export
+    :param object_type: The type of the object to export. Only "file" is supported.
+    :param output_path: The path to write the file to
+    """
+
+    if object_type == "directory":
+        raise XcresultException("Exporting directories is not supported by the native reader")
+
+    object_path = _object_path(path, identifier)
+
+    try:
+        with open(object_path, "rb") as object_file:
+            is_compressed = object_file.read(len(_ZSTD_MAGIC)) == _ZSTD_MAGIC
+    except FileNotFoundError as ex:
+        raise XcresultException(f"Object not found in bundle: {identifier}") from ex
+
+    if not is_compressed:
+        shutil.copyfile(object_path, output_path)
+        return
+
+    with open(output_path, "wb") as output_file:
+        output_file.write(read(path, identifier))
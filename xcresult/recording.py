@@ -0,0 +1,157 @@
+"""Record xcresulttool responses for a bundle and replay them without Xcode.
+
+A recording is made once on a machine with Xcode::
+
+    recording.record("MyApp.xcresult", "MyApp.recording.json.gz")
+
+and can then stand in for ``xcrun xcresulttool`` anywhere, e.g. to profile
+deserialization or JUnit generation on Linux::
+
+    with recording.replay("MyApp.recording.json.gz", latency=0.05):
+        xcresult.Xcresults("MyApp.xcresult").write_junit("junit.xml")
+"""
+
+import contextlib
+import json
+import os
+import tempfile
+from typing import Any, Generator, Iterator, cast
+
+from xcresult import xcresulttool
+from xcresult.backends import RecordedBackend, SubprocessBackend, XcresultBackend
+from xcresult.cache import bundle_root_id
+from xcresult.exceptions import XcresultException
+
+
+def _references(data: Any, key: str | None = None) -> Iterator[tuple[str, str]]:
+    """Find the references in some xcresulttool data.
+
+    :param data: The data to search
+    :param key: The key the data was found under
+
+    :returns: Tuples of the key each reference was found under and its id
+    """
+
+    if isinstance(data, list):
+        for value in cast(list[Any], data):
+            yield from _references(value, key)
+        return
+
+    if not isinstance(data, dict):
+        return
+
+    data = cast(dict[str, Any], data)
+
+    if data.get("_type", {}).get("_name") == "Reference":
+        yield key or "", data["id"]["_value"]
+        return
+
+    for child_key, value in data.items():
+        if child_key != "_type":
+            yield from _references(value, child_key)
+
+
+def record(
+    path: str, recording_path: str, backend: XcresultBackend | None = None
+) -> RecordedBackend:
+    """Record every object and attachment in a bundle.
+
+    Objects are found by following references from the root object.
+    Attachment payloads are exported as files, while directories (such as the
+    diagnostics) are not recorded.
+
+    :param path: The path to the xcresult bundle
+    :param recording_path: The path to write the recording to
+    :param backend: The backend to read the bundle with. Defaults to calling
+        xcresulttool.
+
+    :returns: The recording
+    """
+
+    if backend is None:
+        backend = SubprocessBackend()
+
+    root_id = bundle_root_id(path) or "root"
+    objects: dict[str, dict[str, Any]] = {root_id: backend.get(path)}
+    files: dict[str, bytes] = {}
+    pending = [root_id]
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        while pending:
+            for key, identifier in _references(objects[pending.pop()]):
+                if identifier in objects or identifier in files or key == "diagnosticsRef":
+                    continue
+
+                if key == "payloadRef":
+                    file_path = os.path.join(temp_dir, "payload")
+                    backend.export_file(path, identifier, file_path)
+                    with open(file_path, "rb") as payload_file:
+                        files[identifier] = payload_file.read()
+                    continue
+
+                objects[identifier] = backend.get(path, identifier)
+                pending.append(identifier)
+
+    recording = RecordedBackend(root_id, objects, files)
+    recording.save(recording_path)
+    return recording
+
+
+class XcresulttoolReplayer:
+    """A stand in for xcresulttool which answers from a recording.
+
+    Instances can be passed to ``xcresulttool.set_runner``.
+    """
+
+    recording: RecordedBackend
+
+    def __init__(self, recording: RecordedBackend) -> None:
+        self.recording = recording
+
+    def __call__(self, arguments: list[str]) -> str:
+        """Run a command against the recording.
+
+        :param arguments: The arguments xcresulttool would have been run with
+
+        :returns: The output xcresulttool would have printed
+        """
+
+        command = arguments[0] if arguments else None
+        # Every option takes a value apart from --legacy
+        values = [argument for argument in arguments[1:] if argument != "--legacy"]
+        options = dict(zip(values[::2], values[1::2]))
+
+        if command == "get":
+            return json.dumps(self.recording.get(options["--path"], options.get("--id")))
+
+        if command == "export":
+            if options.get("--type") == "directory":
+                self.recording.export_directory(
+                    options["--path"], options["--id"], options["--output-path"]
+                )
+            else:
+                self.recording.export_file(
+                    options["--path"], options["--id"], options["--output-path"]
+                )
+            return ""
+
+        raise XcresultException(f"Unsupported xcresulttool command: {' '.join(arguments)}")
+
+
+@contextlib.contextmanager
+def replay(recording_path: str, latency: float = 0.0) -> Generator[RecordedBackend, None, None]:
+    """Serve every xcresulttool call from a recording while in this context.
+
+    :param recording_path: The path of the recording
+    :param latency: The number of seconds to delay every call by
+
+    :returns: The recording being replayed
+    """
+
+    recording = RecordedBackend.load(recording_path, latency)
+    previous = xcresulttool.set_runner(XcresulttoolReplayer(recording))
+
+    try:
+        yield recording
+    finally:
+        xcresulttool.set_runner(previous)
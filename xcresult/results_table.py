@@ -0,0 +1,246 @@
+"""A column oriented table of test results."""
+
+import array
+from collections import Counter
+import heapq
+import itertools
+import math
+import sys
+from typing import Iterable
+
+from xcresult.model import ActionTestMetadata, ActionTestPlanRunSummaries
+
+
+def _index(values: list[str], indices: dict[str, int], value: str) -> int:
+    """Get the index of a value in a lookup list, adding it if it is new.
+
+    :param values: The lookup list
+    :param indices: The index of each value already in the list
+    :param value: The value to find
+
+    :returns: The index of the value
+    """
+    index = indices.get(value)
+    if index is None:
+        index = len(values)
+        values.append(value)
+        indices[value] = index
+    return index
+
+
+class ResultsTable:
+    """Every test of a bundle, flattened into columns.
+
+    Each row is one ``ActionTestMetadata`` leaf. Strings are interned so that
+    repeated values (statuses especially) share a single object, durations are
+    packed into an ``array('d')`` with NaN for tests that have none, and the
+    testable and configuration (the test plan run) of each row are stored as
+    indices into ``testables`` and ``configurations``.
+
+    Filtering returns a new table with a subset of the rows, so queries can be
+    chained. Aggregations work on whole columns at once.
+    """
+
+    identifiers: list[str]
+    names: list[str]
+    statuses: list[str]
+    durations: "array.array[float]"
+    testables: list[str]
+    testable_indices: "array.array[int]"
+    configurations: list[str]
+    configuration_indices: "array.array[int]"
+
+    # pylint: disable=too-many-positional-arguments,too-many-arguments
+    def __init__(
+        self,
+        identifiers: list[str],
+        names: list[str],
+        statuses: list[str],
+        durations: "array.array[float]",
+        testables: list[str],
+        testable_indices: "array.array[int]",
+        configurations: list[str],
+        configuration_indices: "array.array[int]",
+    ) -> None:
+        self.identifiers = identifiers
+        self.names = names
+        self.statuses = statuses
+        self.durations = durations
+        self.testables = testables
+        self.testable_indices = testable_indices
+        self.configurations = configurations
+        self.configuration_indices = configuration_indices
+
+    # pylint: enable=too-many-positional-arguments,too-many-arguments
+
+    @staticmethod
+    def from_summaries(summaries: Iterable[ActionTestPlanRunSummaries]) -> "ResultsTable":
+        """Flatten the tests of some run summaries into a table.
+
+        :param summaries: The run summaries, one for each action which ran tests
+
+        :returns: The table
+        """
+        table = ResultsTable(
+            [], [], [], array.array("d"), [], array.array("I"), [], array.array("I")
+        )
+        testable_lookup: dict[str, int] = {}
+        configuration_lookup: dict[str, int] = {}
+
+        for summary in summaries:
+            for run_summary in summary.summaries or []:
+                configuration_index = _index(
+                    table.configurations, configuration_lookup, sys.intern(run_summary.name or "")
+                )
+
+                for testable_summary in run_summary.testableSummaries or []:
+                    testable_index = _index(
+                        table.testables, testable_lookup, sys.intern(testable_summary.name or "")
+                    )
+
+                    for test in testable_summary.iter_tests():
+                        if not isinstance(test, ActionTestMetadata):
+                            continue
+
+                        table.identifiers.append(sys.intern(test.identifier or ""))
+                        table.names.append(sys.intern(test.name or ""))
+                        table.statuses.append(sys.intern(test.testStatus))
+                        table.durations.append(
+                            test.duration if test.duration is not None else math.nan
+                        )
+                        table.testable_indices.append(testable_index)
+                        table.configuration_indices.append(configuration_index)
+
+        return table
+
+    def __len__(self) -> int:
+        return len(self.identifiers)
+
+    def _select(self, selectors: Iterable[bool]) -> "ResultsTable":
+        """Get a table of the selected rows.
+
+        :param selectors: Whether to keep each row
+
+        :returns: A new table sharing the testable and configuration lookups
+        """
+        selectors = list(selectors)
+        return ResultsTable(
+            list(itertools.compress(self.identifiers, selectors)),
+            list(itertools.compress(self.names, selectors)),
+            list(itertools.compress(self.statuses, selectors)),
+            array.array("d", itertools.compress(self.durations, selectors)),
+            self.testables,
+            array.array("I", itertools.compress(self.testable_indices, selectors)),
+            self.configurations,
+            array.array("I", itertools.compress(self.configuration_indices, selectors)),
+        )
+
+    def where(
+        self,
+        *,
+        status: str | None = None,
+        testable: str | None = None,
+        configuration: str | None = None,
+        min_duration: float | None = None,
+    ) -> "ResultsTable":
+        """Filter the rows of the table.
+
+        Every condition which is set has to match for a row to be kept.
+
+        :param status: Only keep tests with this status (e.g. "Failure")
+        :param testable: Only keep tests from the testable with this name
+        :param configuration: Only keep tests from the configuration with this name
+        :param min_duration: Only keep tests which took at least this many seconds
+
+        :returns: A new table containing the matching rows
+        """
+        conditions: list[Iterable[bool]] = []
+
+        if status is not None:
+            conditions.append(map(status.__eq__, self.statuses))
+
+        if testable is not None:
+            index = self.testables.index(testable) if testable in self.testables else -1
+            conditions.append(map(index.__eq__, self.testable_indices))
+
+        if configuration is not None:
+            index = (
+                self.configurations.index(configuration)
+                if configuration in self.configurations
+                else -1
+            )
+            conditions.append(map(index.__eq__, self.configuration_indices))
+
+        if min_duration is not None:
+            # Comparisons with NaN are False, so tests without a duration are dropped
+            conditions.append(map(float(min_duration).__le__, self.durations))
+
+        if not conditions:
+            return self._select(itertools.repeat(True, len(self)))
+
+        return self._select(map(all, zip(*conditions)))
+
+    def count_by_status(self) -> dict[str, int]:
+        """Count the tests with each status.
+
+        :returns: The number of tests with each status
+        """
+        return dict(Counter(self.statuses))
+
+    def _known_durations(self) -> list[float]:
+        return [duration for duration in self.durations if not math.isnan(duration)]
+
+    def total_duration(self) -> float:
+        """Get the total duration of the tests.
+
+        :returns: The sum of the durations in seconds, ignoring tests without one
+        """
+        return math.fsum(self._known_durations())
+
+    def duration_percentile(self, percentile: float) -> float:
+        """Get a percentile of the test durations.
+
+        Values between two durations are linearly interpolated. Tests without a
+        duration are ignored.
+
+        :param percentile: The percentile to get, from 0 to 100
+
+        :returns: The duration in seconds, or NaN if no test has a duration
+        """
+        if not 0 <= percentile <= 100:
+            raise ValueError(f"Percentile must be between 0 and 100: {percentile}")
+
+        durations = sorted(self._known_durations())
+        if not durations:
+            return math.nan
+
+        position = (len(durations) - 1) * percentile / 100
+        lower = math.floor(position)
+        upper = math.ceil(position)
+        fraction = position - lower
+        return durations[lower] + (durations[upper] - durations[lower]) * fraction
+
+    def slowest(self, count: int) -> list[tuple[str, float]]:
+        """Get the slowest tests.
+
+        :param count: The maximum number of tests to return
+
+        :returns: The identifier and duration of each test, slowest first
+        """
+        rows = (index for index, duration in enumerate(self.durations) if not math.isnan(duration))
+        slowest = heapq.nlargest(count, rows, key=self.durations.__getitem__)
+        return [(self.identifiers[index], self.durations[index]) for index in slowest]
+
+    def slowest_by_testable(self, count: int) -> dict[str, list[tuple[str, float]]]:
+        """Get the slowest tests of each testable.
+
+        :param count: The maximum number of tests to return for each testable
+
+        :returns: The slowest tests of each testable which ran any, as returned by
+            ``slowest``
+        """
+        present = sorted(set(self.testable_indices))
+        return {
+            self.testables[index]: self.where(testable=self.testables[index]).slowest(count)
+            for index in present
+        }
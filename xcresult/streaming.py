@@ -0,0 +1,234 @@
+"""Incremental parsing of the JSON that xcresulttool outputs."""
+
+import codecs
+import json
+import re
+from typing import Any, Iterable, Iterator, cast
+
+from xcresult.exceptions import XcresultException
+
+
+# The tokens of a JSON document. Strings and punctuation are self delimiting,
+# but other literals could be cut short at the end of a chunk.
+_TOKEN = re.compile(
+    r"""\s*(?:
+        (?P<punctuation>[{}\[\]:,])
+        | (?P<string>"[^"\\]*(?:\\.[^"\\]*)*")
+        | (?P<literal>[^\s{}\[\]:,"]+)
+    )""",
+    re.VERBOSE | re.DOTALL,
+)
+
+# The contents of a string up to its closing quote, or up to a backslash
+# ending the text, whose escaped character is still to come
+_STRING_CONTENTS = re.compile(r'[^"\\]*(?:\\.[^"\\]*)*', re.DOTALL)
+
+# Placeholder key used while waiting for the key of a dictionary entry
+_NO_KEY = object()
+
+
+def _literal(token: str) -> Any:
+    try:
+        return json.loads(token)
+    except ValueError as ex:
+        raise XcresultException(f"Invalid JSON literal: {token}") from ex
+
+
+def _string_end(text: str, escaped: bool) -> tuple[int | None, bool]:
+    """Find the end of a string which began before the given text.
+
+    :param text: The text which follows the start of the string
+    :param escaped: Whether the string so far ends with a backslash, which
+        escapes the first character of ``text``
+
+    :returns: The index just past the closing quote (None if the string runs
+        past the end of the text), and whether the text ends with a backslash
+        escaping the character after it
+    """
+    if escaped and not text:
+        return None, True
+
+    match = _STRING_CONTENTS.match(text, 1 if escaped else 0)
+    assert match is not None
+    end = match.end()
+
+    if end == len(text):
+        return None, False
+    if text[end] == '"':
+        return end + 1, False
+    return None, True
+
+
+class _Builder:
+    """Builds JSON values from tokens, detaching the objects of some types.
+
+    Each dictionary whose ``_type._name`` is one of ``type_names`` is handed
+    out once it is complete rather than being attached to its parent, so the
+    parent only holds what is left.
+    """
+
+    def __init__(self, type_names: frozenset[str]) -> None:
+        self.type_names = type_names
+        # The lists and dictionaries still being built, and for each the key
+        # its next value goes under (_NO_KEY until it has been read)
+        self.containers: list[Any] = []
+        self.keys: list[Any] = []
+        self.completed: list[dict[str, Any]] = []
+        self.finished = False
+
+    def _add(self, value: Any) -> None:
+        if not self.containers:
+            self.finished = True
+            return
+
+        container = self.containers[-1]
+
+        if isinstance(container, list):
+            cast(list[Any], container).append(value)
+            return
+
+        key = self.keys[-1]
+
+        if key is _NO_KEY:
+            if not isinstance(value, str):
+                raise XcresultException("Invalid JSON: object keys must be strings")
+            self.keys[-1] = value
+            return
+
+        container[key] = value
+        self.keys[-1] = _NO_KEY
+
+    def _close(self, expected_type: type) -> None:
+        if not self.containers or not isinstance(self.containers[-1], expected_type):
+            raise XcresultException("Invalid JSON: mismatched brackets")
+
+        container = self.containers.pop()
+        self.keys.pop()
+
+        if isinstance(container, dict):
+            data = cast(dict[str, Any], container)
+            type_info = data.get("_type")
+            if (
+                isinstance(type_info, dict)
+                and cast(dict[str, Any], type_info).get("_name") in self.type_names
+            ):
+                self.completed.append(data)
+
+                # Drop it from its parent instead of adding it
+                if not self.containers:
+                    self.finished = True
+                elif self.keys[-1] is not None:
+                    self.keys[-1] = _NO_KEY
+                return
+
+        self._add(container)
+
+    def token(self, kind: str, text: str) -> None:
+        """Add a token to the value being built.
+
+        :param kind: The kind of token, as named by the groups of _TOKEN
+        :param text: The text of the token
+        """
+        if self.finished:
+            raise XcresultException("Invalid JSON: unexpected data after the document")
+
+        if kind == "string":
+            self._add(json.loads(text) if "\\" in text else text[1:-1])
+        elif kind == "literal":
+            self._add(_literal(text))
+        elif text == "{":
+            self.containers.append({})
+            self.keys.append(_NO_KEY)
+        elif text == "[":
+            self.containers.append([])
+            self.keys.append(None)
+        elif text == "}":
+            self._close(dict)
+        elif text == "]":
+            self._close(list)
+
+        # Colons and commas carry no information the builder needs
+
+
+def iter_json_objects(
+    chunks: Iterable[bytes], type_names: Iterable[str]
+) -> Iterator[dict[str, Any]]:
+    """Parse a JSON document incrementally, yielding objects of the given types.
+
+    Only the part of the document which is still needed is kept in memory: an
+    object of one of the types is yielded as soon as it is complete and is
+    then dropped from the document. Objects of the types nested within one
+    another are yielded innermost first, and are missing from the objects
+    containing them.
+
+    :param chunks: The document, as UTF-8 encoded chunks of any size
+    :param type_names: The ``_type._name`` of the objects to yield
+
+    :returns: The raw data of each object, in the order they complete
+    """
+
+    builder = _Builder(frozenset(type_names))
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    buffer = ""
+    # A string which runs past the end of the buffer is kept in parts, so that
+    # a long one isn't copied and scanned again from its start with each chunk
+    string_parts: list[str] = []
+    escaped = False
+
+    def tokens(final: bool) -> Iterator[dict[str, Any]]:
+        nonlocal buffer
+        position = 0
+
+        while True:
+            match = _TOKEN.match(buffer, position)
+
+            # A literal running to the end of the buffer may continue in the next chunk
+            if match is None or (
+                not final and match.lastgroup == "literal" and match.end() == len(buffer)
+            ):
+                break
+
+            kind = match.lastgroup
+            assert kind is not None
+            builder.token(kind, match.group(kind))
+            position = match.end()
+
+            yield from builder.completed
+            builder.completed.clear()
+
+        buffer = buffer[position:]
+
+    def feed(text: str, final: bool) -> Iterator[dict[str, Any]]:
+        nonlocal buffer, escaped
+
+        if string_parts:
+            end, escaped = _string_end(text, escaped)
+            if end is None:
+                string_parts.append(text)
+                return
+
+            string_parts.append(text[:end])
+            builder.token("string", "".join(string_parts))
+            string_parts.clear()
+            text = text[end:]
+
+            yield from builder.completed
+            builder.completed.clear()
+
+        buffer += text
+        yield from tokens(final)
+
+        # Nothing but whitespace, part of a literal or the start of a string is left
+        start = len(buffer) - len(buffer.lstrip())
+        if not final and buffer.startswith('"', start):
+            _, escaped = _string_end(buffer[start + 1 :], False)
+            string_parts.append(buffer[start:])
+            buffer = ""
+
+    for chunk in chunks:
+        yield from feed(decoder.decode(chunk), False)
+
+    yield from feed(decoder.decode(b"", final=True), True)
+
+    if buffer.strip() or string_parts or not builder.finished:
+        raise XcresultException("Invalid JSON: unexpected end of the document")
@@ -4,20 +4,24 @@ import abc
 import os
 from typing import Any
 
+from xcresult.cache import ObjectCache
 from xcresult.model import ActionsInvocationRecord
+from xcresult.xcresulttool import deserialize
 
 
 class XcresultsBase(abc.ABC):
     """Wrapper around an xcresults bundle."""
 
     path: str
+    object_cache: ObjectCache
     _actions_invocation_record: ActionsInvocationRecord | None
 
-    def __init__(self, path: str) -> None:
+    def __init__(self, path: str, max_cached_objects: int | None = None) -> None:
         if path.startswith("/"):
             self.path = path
         else:
             self.path = os.path.join(os.getcwd(), path)
+        self.object_cache = ObjectCache(max_cached_objects)
         self._actions_invocation_record = None
 
     @property
@@ -37,6 +41,66 @@ class XcresultsBase(abc.ABC):
         """
         raise NotImplementedError()
 
+    def get_many(self, identifiers: list[str]) -> list[dict[str, Any]]:
+        """Run a get command on the bundle for each of the given ids.
+
+        Subclasses can override this to fetch the objects concurrently.
+
+        :param identifiers: The IDs of the items to get.
+
+        :returns: The data for each id, in the same order as the ids
+        """
+        return [self.get(identifier) for identifier in identifiers]
+
+    def get_object(self, identifier: str) -> Any:
+        """Get the deserialized object with the given id.
+
+        Objects are memoized, so each one is only fetched and deserialized once
+        per bundle.
+
+        :param identifier: The ID of the object to get.
+
+        :returns: The deserialized object
+        """
+        return self.get_objects([identifier])[0]
+
+    def get_objects(self, identifiers: list[str], *, memoize: bool = True) -> list[Any]:
+        """Get the deserialized objects with the given ids.
+
+        Any objects which haven't been loaded yet are fetched together with
+        ``get_many`` before being deserialized and memoized.
+
+        :param identifiers: The IDs of the objects to get.
+        :param memoize: When False, objects which are already memoized are still
+            reused, but the ones fetched now aren't kept. Use this for a single
+            pass over many objects, so that they don't all stay in memory.
+
+        :returns: The deserialized objects, in the same order as the ids
+        """
+        objects: dict[str, Any] = {}
+        missing: list[str] = []
+
+        for identifier in dict.fromkeys(identifiers):
+            found, value = self.object_cache.lookup(identifier)
+            if found:
+                objects[identifier] = value
+            else:
+                missing.append(identifier)
+
+        if missing:
+            if len(missing) == 1:
+                fetched = [self.get(missing[0])]
+            else:
+                fetched = self.get_many(missing)
+
+            for identifier, data in zip(missing, fetched):
+                value = deserialize(data, self)
+                if memoize:
+                    self.object_cache.store(identifier, value)
+                objects[identifier] = value
+
+        return [objects[identifier] for identifier in identifiers]
+
     def export_test_attachments(self, output_path: str) -> None:
         """Export test attachments from the xcresult bundle.
 
@@ -1,20 +1,27 @@
 """A class for dealing with xcresults."""
 
+import functools
 import logging
-from typing import Any, cast
+from typing import Any, Iterator, cast
 
+from xcresult.attachment_export import AttachmentExporter, AttachmentFilter, ProgressCallback
+from xcresult.backends import CachingBackend, NativeBackend, SubprocessBackend, XcresultBackend
+from xcresult.cache import DiskCache
 from xcresult.exceptions import (
     MissingPropertyException,
 )
+from xcresult.identifier_index import IdentifierIndex
 from xcresult.junit_writer import JunitWriter, TestFilter
-from xcresult.model import ActionsInvocationRecord, ActionTestPlanRunSummaries
+from xcresult.model import (
+    ActionsInvocationRecord,
+    ActionTestPlanRunSummaries,
+    ActionTestSummaryIdentifiableObject,
+)
+from xcresult.results_table import ResultsTable
 from xcresult.xcresult_base import XcresultsBase
 from xcresult.xcresulttool import (
+    DEFAULT_MAX_WORKERS,
     deserialize,
-    export_attachment,
-    get_actions_invocation_record,
-    get,
-    export_action_test_summary_group,
 )
 
 # pylint: enable=unused-import
@@ -24,7 +31,49 @@ class Xcresults(XcresultsBase):
     """Wrapper around an xcresults bundle."""
 
     path: str
+    backend: XcresultBackend
     _actions_invocation_record: ActionsInvocationRecord | None
+    _results_table: ResultsTable | None
+    _identifier_index: IdentifierIndex | None
+
+    def __init__(
+        self,
+        path: str,
+        cache: DiskCache | None = None,
+        *,
+        max_cached_objects: int | None = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        native: bool = False,
+        backend: XcresultBackend | None = None,
+    ) -> None:
+        """Create a new instance.
+
+        :param path: The path to the xcresult bundle
+        :param cache: An optional on disk cache for xcresulttool responses. Since
+            object ids are content hashes, re-reading a bundle that has been seen
+            before is then served entirely from the cache.
+        :param max_cached_objects: The maximum number of deserialized objects to
+            keep in memory. This is a count of objects, not a size in bytes.
+            Defaults to None (no limit).
+        :param max_workers: The maximum number of xcresulttool processes to run at
+            once when fetching several objects.
+        :param native: When True, read the bundle directly from disk rather than
+            calling xcresulttool. This works without Xcode (e.g. on Linux) but only
+            supports bundles using the fileBacked2 storage format.
+        :param backend: The backend to read the bundle with. When set, ``native``
+            and ``max_workers`` are ignored. A ``cache`` still wraps it.
+        """
+        super().__init__(path, max_cached_objects)
+
+        if backend is None:
+            backend = NativeBackend() if native else SubprocessBackend(max_workers)
+
+        if cache is not None:
+            backend = CachingBackend(backend, cache)
+
+        self.backend = backend
+        self._results_table = None
+        self._identifier_index = None
 
     @property
     def actions_invocation_record(self) -> ActionsInvocationRecord:
@@ -36,10 +85,52 @@ class Xcresults(XcresultsBase):
         """
         if not self._actions_invocation_record:
             logging.debug("Actions invocation record not found, fetching...")
-            self._actions_invocation_record = get_actions_invocation_record(self.path)
+            self._actions_invocation_record = cast(
+                ActionsInvocationRecord, deserialize(self.backend.get(self.path), self)
+            )
             assert self._actions_invocation_record is not None
         return self._actions_invocation_record
 
+    def results_table(self) -> ResultsTable:
+        """Get every test in the bundle as a column oriented table.
+
+        The table is built the first time it is asked for, after which the same
+        table is returned. It is much quicker to filter and aggregate than
+        walking the test summaries each time.
+
+        :returns: The table of test results
+        """
+        if self._results_table is None:
+            self._results_table = ResultsTable.from_summaries(self._test_plan_run_summaries())
+
+        return self._results_table
+
+    def identifier_index(self) -> IdentifierIndex:
+        """Get an index of every test in the bundle by identifier and identifier URL.
+
+        The index is built the first time it is asked for, after which the same
+        index is returned, so each lookup is a dictionary access rather than a
+        walk over every test.
+
+        :returns: The index
+        """
+        if self._identifier_index is None:
+            self._identifier_index = IdentifierIndex.from_summaries(self._test_plan_run_summaries())
+
+        return self._identifier_index
+
+    def _test_plan_run_summaries(self) -> list[ActionTestPlanRunSummaries]:
+        """Get the run summaries of every action which ran tests.
+
+        :returns: The run summaries
+        """
+        test_identifiers = [
+            action.actionResult.testsRef.id
+            for action in self.actions_invocation_record.actions
+            if action.actionResult.testsRef is not None
+        ]
+        return cast(list[ActionTestPlanRunSummaries], self.get_objects(test_identifiers))
+
     def export_attachment(self, identifier: str, type_identifier: str, output_path: str) -> None:
         """Get an attachment from an xcresult bundle.
 
@@ -48,25 +139,46 @@ class Xcresults(XcresultsBase):
         :param type_identifier: The type of the attachment to export (.e.g. 'public.png')
         :param output_path: The output path to write the attachment to
         """
-        export_attachment(self.path, identifier, type_identifier, output_path)
+        if type_identifier == "directory":
+            self.backend.export_directory(self.path, identifier, output_path)
+        else:
+            self.backend.export_file(self.path, identifier, output_path)
 
     def get(self, identifier: str) -> dict[str, Any]:
         """Run a get command on bundle with the given id.
 
         :param id: The ID of the item to get.
         """
-        return get(self.path, identifier)
+        return self.backend.get(self.path, identifier)
+
+    def get_many(self, identifiers: list[str]) -> list[dict[str, Any]]:
+        """Run a get command on the bundle for each of the given ids.
+
+        :param identifiers: The IDs of the items to get.
+
+        :returns: The data for each id, in the same order as the ids
+        """
+        return self.backend.get_many(self.path, identifiers)
 
-    def export_test_attachments(self, output_path: str) -> None:
-        """Export all test attachments."""
+    def list_ids(self) -> list[str]:
+        """List the ids of every object stored in the bundle.
+
+        :returns: The ids, sorted
+        """
+        return self.backend.list_ids(self.path)
+
+    def _top_level_tests(self) -> Iterator[ActionTestSummaryIdentifiableObject]:
+        """Iterate over the top level tests of every testable summary in the bundle.
+
+        :returns: An iterator over the tests, which loads the summaries of each
+            action as it is reached
+        """
         if not self.actions_invocation_record:
             raise MissingPropertyException("No actions invocation record found")
 
         if not self.actions_invocation_record.actions:
             raise MissingPropertyException("No actions found")
 
-        logging.info("Exporting test attachments")
-
         for action in self.actions_invocation_record.actions:
             logging.info(
                 f"\tExporting action: {action.schemeCommandName} - {action.schemeTaskName} - {action.testPlanName}"
@@ -76,8 +188,7 @@ class Xcresults(XcresultsBase):
                 logging.info("\tNo testRef set on action.actionResult, skipping.")
                 continue
 
-            test_id = action.actionResult.testsRef.id
-            summaries = cast(ActionTestPlanRunSummaries, deserialize(self.get(test_id)))
+            summaries = cast(ActionTestPlanRunSummaries, action.actionResult.testsRef.resolve(self))
 
             if not summaries.summaries:
                 raise MissingPropertyException("No summaries found")
@@ -95,7 +206,50 @@ class Xcresults(XcresultsBase):
 
                     for test in testable_summary.tests:
                         logging.info(f"\t\t\t\tExporting test: {test.identifier}")
-                        export_action_test_summary_group(self.path, test, output_path, 5)
+                        yield test
+
+    def export_test_attachments(
+        self,
+        output_path: str,
+        *,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        progress_callback: ProgressCallback | None = None,
+        blob_store_path: str | None = None,
+        manifest_path: str | None = None,
+        attachment_filter: AttachmentFilter | None = None,
+    ) -> None:
+        """Export all test attachments.
+
+        The test summaries are loaded in batches while a pool of threads exports
+        the attachments found so far (see ``AttachmentExporter``).
+
+        :param output_path: The path to export the attachments to
+        :param max_workers: The maximum number of attachments to export at once
+        :param progress_callback: An optional callable which is passed an
+            ``ExportProgress`` whenever the export progresses
+        :param blob_store_path: When set, export each distinct payload only once,
+            into this folder, and hard link the attachments to it
+        :param manifest_path: When set, record every file in this manifest as it
+            is written and skip any which an earlier export recorded, so that an
+            interrupted export can be resumed
+        :param attachment_filter: When set, only export the attachments it
+            includes, e.g. only those of failed tests
+        """
+        logging.info("Exporting test attachments")
+
+        # Each summary is only read once, so keeping them would hold every test's
+        # activities in memory until the bundle is dropped
+        exporter = AttachmentExporter(
+            functools.partial(self.get_objects, memoize=False),
+            self.export_attachment,
+            output_path,
+            max_workers=max_workers,
+            progress_callback=progress_callback,
+            blob_store_path=blob_store_path,
+            manifest_path=manifest_path,
+            attachment_filter=attachment_filter,
+        )
+        exporter.export(self._top_level_tests(), 5)
 
     # pylint: disable=too-many-positional-arguments
     def write_junit(
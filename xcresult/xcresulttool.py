@@ -1,15 +1,20 @@
 """A module for dealing with xcresults."""
 
+import concurrent.futures
 import datetime
+import itertools
 import json
 import logging
 import os
+import re
 import subprocess
-from typing import Any, cast, get_type_hints
-import uuid
+import sys
+import tempfile
+from typing import Any, Callable, Iterable, Iterator, cast
 
 from xcresult import model
 from xcresult.exceptions import UnsupportedTypeException
+from xcresult.streaming import iter_json_objects
 from xcresult.model import (
     ActionsInvocationRecord,
     ActionTestPlanRunSummaries,
@@ -18,103 +23,396 @@ from xcresult.model import (
 )
 
 
-# pylint: disable=too-many-return-statements
-# pylint: disable=too-many-branches
-def deserialize(data: dict[str, Any]) -> Any:
-    """Deserialize the xcresulttool data into Python objects.
+DEFAULT_MAX_WORKERS = 8
 
-    :param data: The data to deserialize
+DEFAULT_CHUNK_SIZE = 64 * 1024
 
-    :returns: The deserialized object(s)
+# Runs xcresulttool with the given arguments, returning its output
+Runner = Callable[[list[str]], str]
+
+
+def _run_xcresulttool(arguments: list[str]) -> str:
+    """Run xcresulttool.
+
+    :param arguments: The arguments to pass to xcresulttool
+
+    :returns: The output of the command
     """
 
-    type_info = data["_type"]
-    type_name = type_info["_name"]
+    command = ["xcrun", "xcresulttool"] + arguments
 
-    del data["_type"]
+    logging.debug("Running: %s", " ".join(command))
 
-    if type_name == "Array":
-        output: list[Any] = []
-        for value in data["_values"]:
-            output.append(deserialize(value))  # type: ignore[arg-type]
-        return output
+    return subprocess.run(
+        command,
+        check=True,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        encoding="utf-8",
+    ).stdout
 
-    if "_value" in data:
-        # Primitive type
-        if type_name == "String":
-            return data["_value"]
-        if type_name == "Int":
-            return int(data["_value"])
-        if type_name == "Double":
-            return float(data["_value"])
-        if type_name == "Bool":
-            return data["_value"].lower() == "true"
-        if type_name == "Date":
-            return datetime.datetime.strptime(data["_value"], "%Y-%m-%dT%H:%M:%S.%f%z")
-        raise ValueError("Unknown type: " + type_name)
 
-    xc_class = model.MODELS.get(type_name)
+_runner: Runner = _run_xcresulttool
+
+
+def set_runner(runner: Runner | None) -> Runner:
+    """Replace the function used to run xcresulttool.
+
+    This allows ``get`` and exports to be served by something other than Xcode,
+    such as a recording being replayed.
+
+    :param runner: The new runner, or None to restore the default one
+
+    :returns: The previous runner
+    """
+    global _runner  # pylint: disable=global-statement
+
+    previous = _runner
+    _runner = runner or _run_xcresulttool
+    return previous
 
-    if xc_class is None:
-        raise UnsupportedTypeException()
 
-    instance = xc_class.__new__(xc_class)
+class _ModelDeserializer:
+    """Creates instances of a single model class.
+
+    The fields of the class come from the table the generator writes into
+    each model (``FIELDS``), so no type hints are inspected.
+
+    Properties are set through the slot descriptors of the class, which skips
+    ``__setattr__``. This works the same whether or not the models were
+    generated frozen.
+    """
+
+    model_class: type[model.XcresultObject]
+    defaults: tuple[tuple[str, Any], ...]
+    setters: tuple[tuple[str, Callable[[Any, Any], None], Any], ...]
+    property_names: frozenset[str]
+
+    def __init__(self, model_class: type[model.XcresultObject]) -> None:
+        self.model_class = model_class
+        self.defaults = tuple(
+            (property_name, default) for property_name, _, default in model_class.FIELDS
+        )
+        self.setters = tuple(
+            (property_name, getattr(model_class, property_name).__set__, default)
+            for property_name, default in self.defaults
+        )
+        self.property_names = frozenset(property_name for property_name, _ in self.defaults)
+
+    def create(self, values: dict[str, Any]) -> model.XcresultObject:
+        """Create an instance of the class.
 
-    for key, value in data.items():
+        :param values: The values of the properties. Any which are missing take
+            their default value.
+
+        :returns: The instance
+        """
+        instance = self.model_class.__new__(self.model_class)
+
+        for property_name, setter, default in self.setters:
+            value = values.get(property_name, default)
+            if value is model.REQUIRED:
+                raise ValueError()  # pragma: no cover
+            setter(instance, value)
+
+        return instance
+
+
+def _parse_bool(value: str) -> bool:
+    return value.lower() == "true"
+
+
+_DATE_FORMAT = "%Y-%m-%dT%H:%M:%S.%f%z"
+
+# The offset minutes are limited to 0-59 as strptime limits them, since
+# fromisoformat and timedelta would both accept more
+_DATE_FIELDS = re.compile(r"\d{4}-\d\d-\d\dT\d\d:\d\d:\d\d\.\d{3}[+-]\d\d[0-5]\d", re.ASCII)
+
+_TIMEZONES: dict[str, datetime.timezone] = {}
+
+
+def _timezone(offset: str) -> datetime.timezone:
+    """Get the timezone for a UTC offset such as +0100.
+
+    :param offset: The offset, as a sign followed by hours and minutes
+
+    :returns: The timezone
+    """
+    timezone = _TIMEZONES.get(offset)
+
+    if timezone is None:
+        if (
+            len(offset) != 5
+            or offset[0] not in "+-"
+            or not offset[1:].isdigit()
+            or int(offset[3:5]) >= 60
+        ):
+            raise ValueError(f"Invalid UTC offset: {offset}")
+        delta = datetime.timedelta(hours=int(offset[1:3]), minutes=int(offset[3:5]))
+        timezone = datetime.timezone(-delta if offset[0] == "-" else delta)
+        _TIMEZONES[offset] = timezone
+
+    return timezone
+
+
+def _parse_date_fields(value: str) -> datetime.datetime:
+    """Parse a date such as 2024-01-02T03:04:05.678+0000 by position.
+
+    :param value: The date, which must be exactly 28 characters long
+
+    :returns: The date
+    """
+    if _DATE_FIELDS.fullmatch(value) is None:
+        raise ValueError(f"Invalid date: {value}")
+
+    return datetime.datetime(
+        int(value[0:4]),
+        int(value[5:7]),
+        int(value[8:10]),
+        int(value[11:13]),
+        int(value[14:16]),
+        int(value[17:19]),
+        int(value[20:23]) * 1000,
+        _timezone(value[23:]),
+    )
+
+
+# Before 3.11, fromisoformat doesn't accept offsets without a colon (+0000)
+_parse_fixed_date: Callable[[str], datetime.datetime] = (
+    datetime.datetime.fromisoformat if sys.version_info >= (3, 11) else _parse_date_fields
+)
+
+
+def _parse_date(value: str) -> datetime.datetime:
+    # xcresulttool writes every date like 2024-01-02T03:04:05.678+0000, which
+    # can be parsed far quicker than strptime manages. Anything else still
+    # goes through strptime, including the other forms fromisoformat accepts,
+    # so that those are rejected exactly as before.
+    if _DATE_FIELDS.fullmatch(value) is not None:
         try:
-            setattr(instance, key, deserialize(value))
-        except UnsupportedTypeException:
-            logging.warning(f"Found unsupported property on {type_name} when deserializing: {key}")
-            continue
+            return _parse_fixed_date(value)
+        except ValueError:
+            pass
 
-    for property_name, property_type in get_type_hints(xc_class).items():
-        if not hasattr(instance, property_name):
-            if property_type == int:
-                setattr(instance, property_name, 0)
-                continue
+    return datetime.datetime.strptime(value, _DATE_FORMAT)
 
-            if property_type == bool:
-                setattr(instance, property_name, False)
-                continue
 
-            if property_type == str:
-                setattr(instance, property_name, "")
+_PRIMITIVE_PARSERS: dict[str, Callable[[str], Any]] = {
+    "String": str,
+    "Int": int,
+    "Double": float,
+    "Bool": _parse_bool,
+    "Date": _parse_date,
+}
+
+# The types of value without a _value which deserialize can handle
+_OBJECT_TYPES = frozenset(["Array"]) | frozenset(model.MODELS)
+
+_MODEL_DESERIALIZERS: dict[str, _ModelDeserializer] = {}
+
+
+def _parse_primitive(type_name: str, value: str) -> Any:
+    parser = _PRIMITIVE_PARSERS.get(type_name)
+    if parser is None:
+        raise ValueError("Unknown type: " + type_name)
+    return parser(value)
+
+
+def _model_deserializer(type_name: str) -> _ModelDeserializer:
+    model_deserializer = _MODEL_DESERIALIZERS.get(type_name)
+
+    if model_deserializer is None:
+        xc_class = model.MODELS.get(type_name)
+
+        if xc_class is None:
+            raise UnsupportedTypeException()
+
+        model_deserializer = _ModelDeserializer(xc_class)
+        _MODEL_DESERIALIZERS[type_name] = model_deserializer
+
+    return model_deserializer
+
+
+class _ArrayFrame:
+    """An array which is part way through being deserialized."""
+
+    __slots__ = ("output", "values")
+
+    def __init__(self, values: list[dict[str, Any]]) -> None:
+        self.output: list[Any] = []
+        self.values = iter(values)
+
+    def next(self) -> dict[str, Any] | None:
+        """Deserialize values until one is found which isn't a primitive.
+
+        :returns: The data of that value, or None if there are no more values
+        """
+        output = self.output
+
+        for value in self.values:
+            type_name = value["_type"]["_name"]
+
+            if "_value" not in value or type_name == "Array":
+                return value
+
+            output.append(_parse_primitive(type_name, value["_value"]))
+
+        return None
+
+    def add(self, value: Any) -> None:
+        """Add the value returned by the last call to next, once deserialized."""
+        self.output.append(value)
+
+    def finish(self) -> list[Any]:
+        """Get the deserialized array."""
+        return self.output
+
+
+class _ModelFrame:
+    """A model object which is part way through being deserialized."""
+
+    __slots__ = ("type_name", "deserializer", "values", "items", "key")
+
+    def __init__(self, type_name: str, deserializer: _ModelDeserializer, data: dict[str, Any]):
+        self.type_name = type_name
+        self.deserializer = deserializer
+        self.values: dict[str, Any] = {}
+        self.items = iter(data.items())
+        self.key = ""
+
+    def next(self) -> dict[str, Any] | None:
+        """Deserialize properties until one is found which isn't a primitive.
+
+        :returns: The data of that property, or None if there are no more
+        """
+        values = self.values
+        property_names = self.deserializer.property_names
+
+        for key, value in self.items:
+            if key == "_type":
                 continue
 
-            if property_type == float:
-                setattr(instance, property_name, 0.0)
+            type_name = value["_type"]["_name"]
+
+            # Models have no __dict__ to hold properties they don't declare
+            if key not in property_names or (
+                type_name not in _OBJECT_TYPES and "_value" not in value
+            ):
+                self.key = key
+                self.skip()
                 continue
 
-            if str(property_type).startswith("list["):
-                setattr(instance, property_name, None)
+            if "_value" in value and type_name != "Array":
+                values[key] = _parse_primitive(type_name, value["_value"])
                 continue
 
-            if not (
-                str(property_type).startswith("typing.Optional[")
-                or str(property_type).endswith(" | None")
-            ):
-                raise ValueError()  # pragma: no cover
+            self.key = key
+            return value
+
+        return None
+
+    def add(self, value: Any) -> None:
+        """Set the property returned by the last call to next, once deserialized."""
+        self.values[self.key] = value
+
+    def skip(self) -> None:
+        """Skip the property returned by the last call to next, as it is unsupported."""
+        logging.warning(
+            f"Found unsupported property on {self.type_name} when deserializing: {self.key}"
+        )
+
+    def finish(self) -> model.XcresultObject:
+        """Get the deserialized object."""
+        return self.deserializer.create(self.values)
+
 
-            setattr(instance, property_name, None)
+# Returned by _start when the data has been pushed on to the stack to deserialize
+_PENDING = object()
 
-    return instance
 
+def _start(data: dict[str, Any], stack: list[_ArrayFrame | _ModelFrame]) -> Any:
+    """Start deserializing some data.
 
-# pylint: enable=too-many-return-statements
-# pylint: enable=too-many-branches
+    :param data: The data to deserialize
+    :param stack: The stack of partially deserialized data
+
+    :returns: The deserialized value for primitives, otherwise _PENDING after
+        pushing a frame for the data on to the stack
+    """
+
+    type_name = data["_type"]["_name"]
+
+    if type_name == "Array":
+        stack.append(_ArrayFrame(data["_values"]))
+        return _PENDING
+
+    if "_value" in data:
+        return _parse_primitive(type_name, data["_value"])
+
+    stack.append(_ModelFrame(type_name, _model_deserializer(type_name), data))
+    return _PENDING
+
+
+def deserialize(data: dict[str, Any], results: Any = None) -> Any:
+    """Deserialize the xcresulttool data into Python objects.
+
+    The data is left untouched, so the same data can be deserialized any
+    number of times. Nested data is handled with an explicit stack rather
+    than recursion, so there is no limit on how deep it can go.
+
+    :param data: The data to deserialize
+    :param results: The Xcresults the data was read from, if any. References
+        remember it so that ``Reference.resolve()`` can load their target.
+
+    :returns: The deserialized object(s)
+    """
+
+    stack: list[_ArrayFrame | _ModelFrame] = []
+    node: dict[str, Any] | None = data
+
+    while True:
+        value: Any
+
+        if node is None:
+            value = stack.pop().finish()
+            if results is not None and isinstance(value, model.Reference):
+                # Bypasses __setattr__, which frozen models don't allow
+                object.__setattr__(value, "_results", results)
+        else:
+            try:
+                value = _start(node, stack)
+            except UnsupportedTypeException:
+                # The nearest object skips the property the unsupported type is under
+                while stack and isinstance(stack[-1], _ArrayFrame):
+                    stack.pop()
+                if not stack:
+                    raise
+                frame = stack[-1]
+                assert isinstance(frame, _ModelFrame)
+                frame.skip()
+                value = _PENDING
+
+        if value is not _PENDING:
+            if not stack:
+                return value
+            stack[-1].add(value)
+
+        node = stack[-1].next()
 
 
 def get(path: str, identifier: str | None = None) -> dict[str, Any]:
     """Get the some xcresult info.
 
+    To cache the responses on disk, read the bundle through ``Xcresults`` with a
+    ``DiskCache``.
+
     :param path: The path to the xcresult bundle
+    :param identifier: The identifier of the object to get (the root object if None)
 
     :returns: The deserialized data
     """
 
-    command = [
-        "xcrun",
-        "xcresulttool",
+    arguments = [
         "get",
         "--path",
         path,
@@ -124,51 +422,152 @@ def get(path: str, identifier: str | None = None) -> dict[str, Any]:
     ]
 
     if identifier:
-        command += ["--id", identifier]
+        arguments += ["--id", identifier]
 
-    logging.debug("Running: %s", " ".join(command))
-
-    output = subprocess.run(
-        command,
-        check=True,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        encoding="utf-8",
-    ).stdout
+    output = _runner(arguments)
 
     return cast(dict[str, Any], json.loads(output))
 
 
-def _export(path: str, identifier: str, object_type: str, output_path: str) -> None:
-    """Export a file/directory from the xcresult bundle.
+def _stream_xcresulttool(arguments: list[str], chunk_size: int) -> Iterator[bytes]:
+    """Run xcresulttool, reading its output a chunk at a time.
+
+    :param arguments: The arguments to pass to xcresulttool
+    :param chunk_size: The maximum number of bytes to read at once
+
+    :returns: The output of the command, in chunks
+    """
+
+    if _runner is not _run_xcresulttool:
+        # A replacement runner can only return the whole output at once
+        yield _runner(arguments).encode("utf-8")
+        return
+
+    command = ["xcrun", "xcresulttool"] + arguments
+
+    logging.debug("Streaming: %s", " ".join(command))
+
+    # stderr goes to a file so that a chatty command can't block on a full pipe
+    with tempfile.TemporaryFile() as stderr_file:
+        with subprocess.Popen(command, stdout=subprocess.PIPE, stderr=stderr_file) as process:
+            assert process.stdout is not None
+
+            try:
+                while chunk := process.stdout.read(chunk_size):
+                    yield chunk
+            except GeneratorExit:
+                # Stop the command if the caller stops reading early
+                process.kill()
+                raise
+
+            return_code = process.wait()
+
+        if return_code != 0:
+            stderr_file.seek(0)
+            raise subprocess.CalledProcessError(
+                return_code, command, stderr=stderr_file.read().decode("utf-8", "replace")
+            )
+
+
+def stream(
+    path: str,
+    type_names: Iterable[str],
+    identifier: str | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[Any]:
+    """Stream the objects of the given types from some xcresult info.
+
+    Rather than reading the whole of xcresulttool's output before parsing it,
+    it is parsed as it arrives and each object of the given types is
+    deserialized and yielded as soon as it is complete. Only the objects
+    still being built are held in memory, so this suits very large payloads
+    such as logs.
+
+    Objects of the types which are nested within one another are yielded
+    innermost first, and are left out of the objects containing them. For
+    example streaming ``ActivityLogSection`` yields every subsection on its
+    own, each with no ``subsections``.
 
     :param path: The path to the xcresult bundle
-    :param identifier: The identifier of the object to export
-    :param object_type: The type of the object to export ("file" or "directory")
-    :param output_path: The root path to write out to (attachments will be placed in a class/testname folder structure)
+    :param type_names: The names of the types to yield (e.g. "ActionTestSummaryGroup")
+    :param identifier: The identifier of the object to get (the root object if None)
+    :param chunk_size: The maximum number of bytes to read from xcresulttool at once
+
+    :returns: The deserialized objects, in the order they complete
     """
 
-    command = [
-        "xcrun",
-        "xcresulttool",
-        "export",
+    arguments = [
+        "get",
         "--path",
         path,
-        "--id",
-        identifier,
-        "--type",
-        object_type,
-        "--output-path",
-        output_path,
+        "--format",
+        "json",
         "--legacy",
     ]
 
-    subprocess.run(
-        command,
-        check=True,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        encoding="utf-8",
+    if identifier:
+        arguments += ["--id", identifier]
+
+    for data in iter_json_objects(_stream_xcresulttool(arguments, chunk_size), type_names):
+        yield deserialize(data)
+
+
+def get_many(
+    path: str,
+    identifiers: list[str],
+    max_workers: int = DEFAULT_MAX_WORKERS,
+) -> list[dict[str, Any]]:
+    """Get several objects from an xcresult bundle concurrently.
+
+    Each object is fetched by its own xcresulttool process, with up to
+    ``max_workers`` of them running at once. Repeated ids are only fetched once.
+
+    :param path: The path to the xcresult bundle
+    :param identifiers: The identifiers of the objects to get
+    :param max_workers: The maximum number of xcresulttool processes to run at once
+
+    :returns: The data for each identifier, in the same order as the identifiers
+    """
+
+    unique_identifiers = list(dict.fromkeys(identifiers))
+
+    def fetch(identifier: str) -> dict[str, Any]:
+        return get(path, identifier)
+
+    if max_workers <= 1 or len(unique_identifiers) <= 1:
+        results = [fetch(identifier) for identifier in unique_identifiers]
+    else:
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(max_workers, len(unique_identifiers))
+        ) as executor:
+            results = list(executor.map(fetch, unique_identifiers))
+
+    results_by_identifier = dict(zip(unique_identifiers, results))
+    return [results_by_identifier[identifier] for identifier in identifiers]
+
+
+def _export(path: str, identifier: str, object_type: str, output_path: str) -> None:
+    """Export a file/directory from the xcresult bundle.
+
+    :param path: The path to the xcresult bundle
+    :param identifier: The identifier of the object to export
+    :param object_type: The type of the object to export ("file" or "directory")
+    :param output_path: The root path to write out to (attachments will be placed in a class/testname folder structure)
+    """
+
+    _runner(
+        [
+            "export",
+            "--path",
+            path,
+            "--id",
+            identifier,
+            "--type",
+            object_type,
+            "--output-path",
+            output_path,
+            "--legacy",
+        ]
     )
 
 
@@ -222,106 +621,249 @@ def export_attachment(path: str, identifier: str, type_identifier: str, output_p
     _export(path, identifier, type_identifier, output_path)
 
 
-# pylint: disable=too-many-branches
+def _logged_subtests(
+    group: ActionTestSummaryGroup,
+    log_depth: int,
+) -> Iterator[tuple[model.ActionTestSummaryIdentifiableObject, int]]:
+    """Iterate over the direct subtests of a group, logging each as it is reached.
+
+    :param group: The group of tests
+    :param log_depth: The indentation level the group is logged at
+
+    :returns: An iterator over the subtests along with the indentation level to log them at
+    """
+
+    log_prefix = "\t" * log_depth
+
+    for subtest in group.subtests or []:
+        logging.info(f"{log_prefix}\tExporting subtest: {subtest.identifier}")
+        yield subtest, log_depth + 2
+
+
+def exportable_tests(
+    test: model.ActionTestSummaryIdentifiableObject,
+    log_depth: int,
+) -> Iterator[tuple[model.ActionTestMetadata, int]]:
+    """Find the tests under a test or group which may have attachments.
+
+    Nested groups are walked depth first with a stack of iterators, so no lists
+    are built along the way.
+
+    :param test: The test or group of tests to search
+    :param log_depth: The indentation level to log at
+
+    :returns: An iterator over the tests along with the indentation level to log them at
+    """
+
+    stack: list[Iterator[tuple[model.ActionTestSummaryIdentifiableObject, int]]] = [
+        iter([(test, log_depth)])
+    ]
+
+    while stack:
+        for current, depth in stack[-1]:
+            log_prefix = "\t" * depth
+
+            if isinstance(current, model.ActionTestMetadata) and current.testStatus == "Skipped":
+                # If it was skipped, there is no data to export
+                logging.debug(
+                    f"{log_prefix}Skipping processing test that was skipped: {current.identifier}"
+                )
+                continue
+
+            if current.identifierURL is None:
+                # This happens if there was an error during the test
+                logging.debug(
+                    f"{log_prefix}Skipping processing test that had no identifier URL (usually due to an error during the test)"
+                )
+                continue
+
+            if isinstance(current, ActionTestSummaryGroup):
+                stack.append(_logged_subtests(current, depth))
+                break
+
+            if isinstance(current, model.ActionTestMetadata) and current.summaryRef is not None:
+                yield current, depth
+        else:
+            stack.pop()
+
+
+# pylint: disable=too-many-positional-arguments,too-many-arguments
 def export_action_test_summary_group(
     results_path: str,
     test: model.ActionTestSummaryIdentifiableObject,
     output_path: str,
     log_depth: int = 0,
+    *,
+    loader: Callable[[list[str]], list[Any]] | None = None,
+    exporter: Callable[[str, str, str], None] | None = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    reserved: set[str] | None = None,
 ) -> None:
-    """Handle an ActionTestSummaryGroup."""
+    """Handle an ActionTestSummaryGroup.
+
+    The summaries for every test in the group are fetched up front, concurrently.
+
+    :param results_path: The path to the xcresult bundle
+    :param test: The test or group of tests to export the attachments for
+    :param output_path: The root path to write the attachments to
+    :param log_depth: The indentation level to log at
+    :param loader: An optional callable which returns the deserialized objects for
+        a list of ids, in order. Use this to share already loaded summaries, e.g.
+        ``Xcresults.get_objects``.
+    :param exporter: An optional callable which exports the object with an id, of a
+        type, to a path, e.g. ``Xcresults.export_attachment``. Uses xcresulttool
+        when not set.
+    :param max_workers: The maximum number of summaries to fetch at once when no
+        loader is set
+    :param reserved: The paths already chosen for other attachments (see
+        ``plan_test_attachments``). Share this between calls which export to the
+        same path, e.g. for several groups holding retries of the same test.
+    """
+
+    tests = list(exportable_tests(test, log_depth))
+    identifiers = [cast(model.Reference, test.summaryRef).id for test, _ in tests]
+
+    if loader is None:
+        summaries = [
+            deserialize(data)
+            for data in get_many(results_path, identifiers, max_workers=max_workers)
+        ]
+    else:
+        summaries = loader(identifiers)
+
+    def export_with_xcresulttool(identifier: str, type_identifier: str, file_path: str) -> None:
+        export_attachment(results_path, identifier, type_identifier, file_path)
+
+    export = exporter or export_with_xcresulttool
+
+    if reserved is None:
+        reserved = set()
+
+    for (exportable_test, test_log_depth), summary in zip(tests, summaries):
+        for identifier, file_path in plan_test_attachments(
+            exportable_test,
+            cast(ActionTestSummary, summary),
+            output_path,
+            test_log_depth,
+            reserved,
+        ):
+            export(identifier, "file", file_path)
+
+
+# pylint: enable=too-many-positional-arguments,too-many-arguments
+
+
+def _summary_attachments(
+    summary: ActionTestSummary, log_depth: int
+) -> Iterator[model.ActionTestAttachment]:
+    """Iterate over the attachments of a test which can be exported.
+
+    :param summary: The summary of the test
+    :param log_depth: The indentation level to log at
+
+    :returns: An iterator over the attachments of the activities, then of the failures
+    """
 
     log_prefix = "\t" * log_depth
 
-    if isinstance(test, model.ActionTestMetadata) and test.testStatus == "Skipped":
-        # If it was skipped, there is no data to export
-        logging.debug(f"{log_prefix}Skipping processing test that was skipped: {test.identifier}")
-        return
+    for activity_summary in summary.activitySummaries or []:
+        logging.info(f"{log_prefix}\tExporting activity summary: {activity_summary.title}")
+        for attachment in activity_summary.attachments or []:
+            logging.info(f"{log_prefix}\t\tExporting attachment: {attachment.name}")
+            if attachment.payloadRef is not None:
+                yield attachment
 
-    if test.identifierURL is None:
-        # This happens if there was an error during the test
-        logging.debug(
-            f"{log_prefix}Skipping processing test that had no identifier URL (usually due to an error during the test)"
-        )
-        return
+    for failure_summary in summary.failureSummaries or []:
+        for attachment in failure_summary.attachments or []:
+            if attachment.payloadRef is not None:
+                yield attachment
 
-    if isinstance(test, ActionTestSummaryGroup):
-        for subtest in test.subtests or []:
-            logging.info(f"{log_prefix}\tExporting subtest: {subtest.identifier}")
-            export_action_test_summary_group(results_path, subtest, output_path, log_depth + 2)
-        return
 
-    if not isinstance(test, model.ActionTestMetadata):
-        return
+def payload_key(identifier: str) -> str:
+    """Get the part of a payload id which is safe to use in a file name.
 
-    if test.summaryRef is None:
-        return
+    Ids look like ``0~<url safe base64 hash>``, so this is the hash.
 
-    identifier = test.summaryRef.id
-    data = cast(ActionTestSummary, deserialize(get(results_path, identifier)))
+    :param identifier: The id of the payload
 
-    relative_path = test.identifierURL.replace("test://com.apple.xcode/", "")
+    :returns: The hash
+    """
+    return identifier.rsplit("~", maxsplit=1)[-1]
 
-    if data.activitySummaries:
-        for activity_summary in data.activitySummaries:
-            logging.info(f"{log_prefix}\tExporting activity summary: {activity_summary.title}")
-            if not activity_summary.attachments:
-                continue
-            for attachment in activity_summary.attachments:
-                logging.info(f"{log_prefix}\t\tExporting attachment: {attachment.name}")
-                if attachment.payloadRef is None:
-                    continue
-                identifier = attachment.payloadRef.id
-
-                if attachment.filename is None:
-                    file_name = str(uuid.uuid4())
-                else:
-                    file_name = attachment.filename
-
-                output_file_path = os.path.join(output_path, relative_path, file_name)
-
-                while os.path.exists(output_file_path):
-                    suffix = str(uuid.uuid4()).split("-", maxsplit=1)[0]
-                    file_name, file_ext = os.path.splitext(file_name)
-                    new_file_name = f"{file_name}-{suffix}{file_ext}"
-                    output_file_path = os.path.join(output_path, relative_path, new_file_name)
-
-                export_attachment(
-                    results_path,
-                    identifier,
-                    "file",
-                    output_file_path,
-                )
 
-    if data.failureSummaries:
-        for summary in data.failureSummaries:
-            if not summary.attachments:
-                continue
+def _candidate_paths(folder: str, file_name: str, identifier: str) -> Iterator[str]:
+    """Iterate over the paths an attachment could be written to, in order of preference.
 
-            for attachment in summary.attachments:
-                if attachment.payloadRef is None:
-                    continue
-                identifier = attachment.payloadRef.id
-
-                if attachment.filename is None:
-                    file_name = str(uuid.uuid4())
-                else:
-                    file_name = attachment.filename
-
-                output_file_path = os.path.join(output_path, relative_path, file_name)
-
-                while os.path.exists(output_file_path):
-                    suffix = str(uuid.uuid4()).split("-", maxsplit=1)[0]
-                    file_name, file_ext = os.path.splitext(file_name)
-                    new_file_name = f"{file_name}-{suffix}{file_ext}"
-                    output_file_path = os.path.join(output_path, relative_path, new_file_name)
-
-                export_attachment(
-                    results_path,
-                    identifier,
-                    "file",
-                    output_file_path,
-                )
+    :param folder: The folder to write the attachment to
+    :param file_name: The name of the attachment
+    :param identifier: The id of the attachment's payload
+
+    :returns: An endless iterator of paths: the name itself, then the name with
+        the start of the payload hash appended, then that with a count appended
+    """
+    stem, extension = os.path.splitext(file_name)
+    suffix = payload_key(identifier)[:8]
+
+    yield os.path.join(folder, file_name)
+    yield os.path.join(folder, f"{stem}-{suffix}{extension}")
+
+    for count in itertools.count(2):
+        yield os.path.join(folder, f"{stem}-{suffix}-{count}{extension}")
+
+
+def plan_test_attachments(
+    test: model.ActionTestMetadata,
+    summary: ActionTestSummary,
+    output_path: str,
+    log_depth: int = 0,
+    reserved: set[str] | None = None,
+    *,
+    include: Callable[[model.ActionTestAttachment], bool] | None = None,
+) -> list[tuple[str, str]]:
+    """Choose the path each attachment of a test is exported to.
+
+    Attachments are written to a folder for the test, under its identifier URL.
+    Attachments without a file name are named after their payload hash. When a
+    name clashes with a path in ``reserved``, the start of the payload hash is
+    appended to it (and after that a count, for the same payload attached more
+    than once under the same name). Nothing is read from disk, so the same
+    attachments always get the same paths.
+
+    :param test: The test to export the attachments for
+    :param summary: The summary of the test
+    :param output_path: The root path to write the attachments to
+    :param log_depth: The indentation level to log at
+    :param reserved: The case folded paths already chosen for other attachments,
+        since the file system may not be case sensitive. Every path chosen is
+        added to it.
+    :param include: An optional predicate called for each attachment. Return
+        False to leave that attachment out.
+
+    :returns: The payload id and output path of each attachment, in order
+    """
+
+    assert test.identifierURL is not None
+
+    if reserved is None:
+        reserved = set()
+
+    folder = os.path.join(output_path, test.identifierURL.replace("test://com.apple.xcode/", ""))
+    planned: list[tuple[str, str]] = []
+
+    for attachment in _summary_attachments(summary, log_depth):
+        if include is not None and not include(attachment):
+            continue
+
+        identifier = cast(model.Reference, attachment.payloadRef).id
+        file_name = attachment.filename or payload_key(identifier)
+
+        output_file_path = next(
+            path
+            for path in _candidate_paths(folder, file_name, identifier)
+            if path.casefold() not in reserved
+        )
 
+        reserved.add(output_file_path.casefold())
+        planned.append((identifier, output_file_path))
 
-# pylint: enable=too-many-branches
+    return planned